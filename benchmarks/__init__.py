@@ -0,0 +1,4 @@
+"""Benchmark suite of pybizday_utils.
+
+Run `python -m benchmarks --help` from the root of the repository.
+"""
@@ -0,0 +1,223 @@
+"""Command line interface of the benchmark suite.
+
+Examples:
+    python -m benchmarks list
+    python -m benchmarks run
+    python -m benchmarks run -k month --calendar dense --output result.json
+    python -m benchmarks compare base.json result.json --threshold 0.05
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Any
+
+from .calendars import CALENDARS
+from .compare import compare_results
+from .runner import collect_metadata, run_benchmarks
+from .scenarios import SCENARIOS
+
+# directory which results are written to by default
+RESULTS_DIR = ".benchmarks"
+
+
+def _format_seconds(seconds: float) -> str:
+    for unit, scale in [("s", 1.0), ("ms", 1e-3), ("us", 1e-6)]:
+        if seconds >= scale:
+            return f"{seconds / scale:8.3f} {unit}"
+    return f"{seconds / 1e-9:8.3f} ns"
+
+
+def _print_result(result: dict[str, Any]) -> None:
+    stats = result["stats"]
+    calls = result["predicate_calls"]
+    print(
+        f"{result['scenario']:<28} {result['calendar']:<9}"
+        f" {_format_seconds(stats['p50'])}"
+        f" {_format_seconds(stats['p90'])}"
+        f" {_format_seconds(stats['p99'])}"
+        f" {'-' if calls is None else calls:>9}"
+    )
+
+
+def list_command(args: argparse.Namespace) -> None:
+    for scenario in SCENARIOS:
+        print(f"{scenario.name:<28} {scenario.description}")
+
+
+def run_command(args: argparse.Namespace) -> None:
+    scenarios = [
+        scenario
+        for scenario in SCENARIOS
+        if not args.k or any(k in scenario.name for k in args.k)
+    ]
+    if not scenarios:
+        sys.exit(f"No scenario matches {args.k}")
+    calendars = args.calendar or list(CALENDARS)
+
+    print(
+        f"{'scenario':<28} {'calendar':<9}"
+        f" {'p50':>11} {'p90':>11} {'p99':>11} {'calls':>9}"
+    )
+    metadata = collect_metadata()
+    results = []
+    for result in run_benchmarks(
+        scenarios,
+        calendars,
+        repeat=args.repeat,
+        min_time=args.min_time,
+    ):
+        _print_result(result)
+        results.append(result)
+
+    output = args.output or _default_output(metadata)
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({"metadata": metadata, "results": results}, f, indent=2)
+    print(f"Results are written to {output}")
+
+
+def _default_output(metadata: dict[str, Any]) -> str:
+    timestamp = metadata["created_at"][:19].replace(":", "").replace("-", "")
+    commit = (metadata["git"]["commit"] or "unknown")[:10]
+    if metadata["git"]["dirty"]:
+        commit += "-dirty"
+    return os.path.join(RESULTS_DIR, f"{timestamp}_{commit}.json")
+
+
+def _describe(metadata: dict[str, Any]) -> str:
+    git = metadata.get("git", {})
+    commit = (git.get("commit") or "unknown")[:10]
+    if git.get("dirty"):
+        commit += " (dirty)"
+    return (
+        f"commit {commit}, pybizday_utils {metadata.get('pybizday_utils')}, "
+        f"Python {metadata.get('python', {}).get('version')}, "
+        f"{metadata.get('machine', {}).get('platform')}"
+    )
+
+
+def compare_command(args: argparse.Namespace) -> None:
+    with open(args.base, encoding="utf-8") as f:
+        base = json.load(f)
+    with open(args.new, encoding="utf-8") as f:
+        new = json.load(f)
+    base_metadata, new_metadata = base.get("metadata", {}), new.get("metadata", {})  # noqa: E501
+    print(f"base: {args.base}: {_describe(base_metadata)}")
+    print(f"new:  {args.new}: {_describe(new_metadata)}")
+    if base_metadata.get("machine") != new_metadata.get("machine"):
+        print("WARNING: the results were taken on different machines")
+
+    comparisons = compare_results(
+        base,
+        new,
+        threshold=args.threshold,
+        alpha=args.alpha,
+    )
+    print(
+        f"{'scenario':<28} {'calendar':<9}"
+        f" {'base':>11} {'new':>11} {'change':>8} {'p-value':>8}  verdict"
+    )
+    for c in comparisons:
+        print(
+            f"{c.scenario:<28} {c.calendar:<9}"
+            f" {_format_seconds(c.base)} {_format_seconds(c.new)}"
+            f" {c.ratio - 1:+8.1%} {c.p_value:8.4f}  {c.verdict}"
+        )
+    regressions = [c for c in comparisons if c.verdict == "regression"]
+    print(
+        f"{len(comparisons)} compared, {len(regressions)} regressions, "
+        f"{sum(c.verdict == 'improvement' for c in comparisons)} improvements "
+        f"(threshold {args.threshold:.0%}, alpha {args.alpha})"
+    )
+    if regressions:
+        sys.exit(1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark suite of pybizday_utils",
+    )
+    subparsers = parser.add_subparsers(required=True)
+
+    list_parser = subparsers.add_parser("list", help="List the scenarios")
+    list_parser.set_defaults(func=list_command)
+
+    run_parser = subparsers.add_parser(
+        "run",
+        help="Run the scenarios over the calendars",
+        description=(
+            "Time each scenario over each calendar and report the percentiles "
+            "of the time per operation and the number of calls of the "
+            "underlying is_holiday function per operation."
+        ),
+    )
+    run_parser.add_argument(
+        "-k",
+        action="append",
+        metavar="SUBSTRING",
+        help="Run only the scenarios whose names contain SUBSTRING (repeatable)",  # noqa: E501
+    )
+    run_parser.add_argument(
+        "--calendar",
+        action="append",
+        choices=list(CALENDARS),
+        help="Calendar to run the scenarios over (repeatable). Defaults to all.",  # noqa: E501
+    )
+    run_parser.add_argument(
+        "--repeat",
+        type=int,
+        default=20,
+        help="Number of timed repeats of each scenario",
+    )
+    run_parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.01,
+        help="Minimum seconds of a repeat, which determines the loops per repeat",  # noqa: E501
+    )
+    run_parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help=(
+            "Path of the JSON file to write the results to. "
+            f"Defaults to {RESULTS_DIR}/<timestamp>_<git commit>.json"
+        ),
+    )
+    run_parser.set_defaults(func=run_command)
+
+    compare_parser = subparsers.add_parser(
+        "compare",
+        help="Compare two results and fail on regressions",
+        description=(
+            "Compare the time per operation of each scenario over each "
+            "calendar in both results with the Mann-Whitney U test, "
+            "and exit with status 1 if any of them is a regression, "
+            "i.e. significantly slower by more than the threshold."
+        ),
+    )
+    compare_parser.add_argument("base", help="JSON file of the base result")
+    compare_parser.add_argument("new", help="JSON file of the new result")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative slowdown of the median regarded as a regression (default: 0.1)",  # noqa: E501
+    )
+    compare_parser.add_argument(
+        "--alpha",
+        type=float,
+        default=0.05,
+        help="Significance level (default: 0.05)",
+    )
+    compare_parser.set_defaults(func=compare_command)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
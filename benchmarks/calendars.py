@@ -0,0 +1,92 @@
+"""Holiday calendars which every scenario is run over."""
+
+from datetime import date
+from typing import Callable
+
+from pybizday_utils.default_holiday_utils import (
+    global_default_holiday_discriminator,
+)
+from pybizday_utils.holiday_utils import (
+    HolidayDiscriminator,
+    IsHolidayFuncType,
+    compile_is_holiday,
+    is_between_1231_0103,
+    is_saturday_or_sunday,
+)
+
+# range of dates which the scenarios use
+START = date(2000, 1, 1)
+END = date(2099, 12, 31)
+
+
+class CallCounter:
+    """
+    Wrapper of an is_holiday function which counts the calls.
+    """
+
+    def __init__(self, is_holiday: IsHolidayFuncType) -> None:
+        self.is_holiday = is_holiday
+        self.count = 0
+        self.__name__ = getattr(is_holiday, "__name__", type(self).__name__)
+
+    def __call__(self, d: date) -> bool:
+        self.count += 1
+        return bool(self.is_holiday(d))
+
+
+def is_dense_holiday(d: date) -> bool:
+    """
+    About 20 fixed holidays a year besides the weekend,
+    e.g. national holidays and company-specific days off.
+    """
+    return (d.month, d.day) in {
+        (1, 9), (2, 11), (2, 23), (3, 20), (4, 29), (5, 3), (5, 4), (5, 5),
+        (6, 30), (7, 15), (8, 11), (8, 13), (8, 14), (8, 15), (9, 16),
+        (9, 23), (10, 14), (11, 3), (11, 23), (12, 30),
+    }
+
+
+def dense() -> CallCounter:
+    """
+    Weekend, the new year holidays and is_dense_holiday, evaluated day by day.
+    """
+    return CallCounter(
+        HolidayDiscriminator(
+            is_saturday_or_sunday,
+            is_between_1231_0103,
+            is_dense_holiday,
+        )
+    )
+
+
+def compiled() -> IsHolidayFuncType:
+    """
+    The dense calendar compiled from START to END.
+    """
+    return compile_is_holiday(dense(), START, END)
+
+
+def default() -> IsHolidayFuncType:
+    """
+    The global default holidays, i.e. Saturday and Sunday.
+    """
+    return global_default_holiday_discriminator
+
+
+CALENDARS: dict[str, Callable[[], IsHolidayFuncType]] = {
+    "default": default,
+    "compiled": compiled,
+    "dense": dense,
+}
+
+
+def get_call_counter(is_holiday: IsHolidayFuncType) -> CallCounter | None:
+    """
+    CallCounter behind a calendar, if any.
+    """
+    if isinstance(is_holiday, CallCounter):
+        return is_holiday
+    fallback = getattr(is_holiday, "__wrapped__", None)
+    if isinstance(fallback, CallCounter):
+        return fallback
+    return None
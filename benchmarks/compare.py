@@ -0,0 +1,112 @@
+"""Compare two benchmark results for regressions."""
+
+import math
+import statistics
+from typing import Any, NamedTuple
+
+
+class Comparison(NamedTuple):
+    """
+    Comparison of a scenario over a calendar between two results.
+
+    Attributes:
+        scenario: name of the scenario.
+        calendar: name of the calendar.
+        base: median time per operation in the base result.
+        new: median time per operation in the new result.
+        ratio: new / base.
+        p_value: two-sided p-value of the Mann-Whitney U test
+            that the times of both results come from the same distribution.
+        verdict: "regression", "improvement" or "unchanged".
+    """
+
+    scenario: str
+    calendar: str
+    base: float
+    new: float
+    ratio: float
+    p_value: float
+    verdict: str
+
+
+def mann_whitney_u(xs: list[float], ys: list[float]) -> float:
+    """
+    Two-sided p-value of the Mann-Whitney U test with the normal approximation.
+
+    The test does not assume normality, which suits timings with long tails.
+    """
+    n_x, n_y = len(xs), len(ys)
+    if n_x == 0 or n_y == 0:
+        return 1.0
+    # ranks with ties averaged
+    pooled = sorted([(v, 0) for v in xs] + [(v, 1) for v in ys])
+    ranks = [0.0] * len(pooled)
+    tie_term = 0.0
+    i = 0
+    while i < len(pooled):
+        j = i
+        while j + 1 < len(pooled) and pooled[j + 1][0] == pooled[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        ties = j - i + 1
+        tie_term += ties ** 3 - ties
+        i = j + 1
+    rank_sum_x = sum(r for r, (_, g) in zip(ranks, pooled, strict=True) if g == 0)  # noqa: E501
+    u = rank_sum_x - n_x * (n_x + 1) / 2
+    n = n_x + n_y
+    variance = n_x * n_y / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    # continuity correction
+    z = (abs(u - n_x * n_y / 2) - 0.5) / math.sqrt(variance)
+    return min(1.0, 2 * (1 - statistics.NormalDist().cdf(max(z, 0.0))))
+
+
+def compare_results(
+    base: dict[str, Any],
+    new: dict[str, Any],
+    *,
+    threshold: float = 0.1,
+    alpha: float = 0.05,
+) -> list[Comparison]:
+    """
+    Compare the scenarios over the calendars found in both results.
+
+    Args:
+        base (dict[str, Any]): base result, loaded from a JSON file.
+        new (dict[str, Any]): new result, loaded from a JSON file.
+        threshold (float, optional): relative change of the median regarded
+            as a regression or an improvement. Defaults to 0.1, i.e. 10%.
+        alpha (float, optional): significance level. Defaults to 0.05.
+
+    Returns:
+        list[Comparison]: comparisons in the order of the new result.
+
+    Notes:
+        - a change is a regression (improvement) only if it is significant,
+          i.e. p_value < alpha, and the median is more than threshold
+          slower (faster).
+    """
+    base_times = {
+        (r["scenario"], r["calendar"]): r["times"] for r in base["results"]
+    }
+    comparisons = []
+    for result in new["results"]:
+        key = (result["scenario"], result["calendar"])
+        if key not in base_times:
+            continue
+        xs, ys = base_times[key], result["times"]
+        base_median, new_median = statistics.median(xs), statistics.median(ys)
+        ratio = new_median / base_median if base_median > 0 else math.inf
+        p_value = mann_whitney_u(xs, ys)
+        if p_value < alpha and ratio > 1 + threshold:
+            verdict = "regression"
+        elif p_value < alpha and ratio < 1 / (1 + threshold):
+            verdict = "improvement"
+        else:
+            verdict = "unchanged"
+        comparisons.append(
+            Comparison(*key, base_median, new_median, ratio, p_value, verdict)
+        )
+    return comparisons
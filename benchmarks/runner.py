@@ -0,0 +1,155 @@
+"""Run the scenarios and summarize the elapsed times."""
+
+import datetime
+import importlib.metadata
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+from typing import Any, Iterable
+
+from .calendars import CALENDARS, get_call_counter
+from .scenarios import Scenario
+
+
+def calc_statistics(records: list[float]) -> dict[str, float]:
+    """
+    Calculate statistics from a list of execution times.
+    """
+    # empty case
+    if not records:
+        return {}
+    # percentiles need at least two records
+    if len(records) == 1:
+        percentiles = [records[0]] * 99
+    else:
+        percentiles = statistics.quantiles(records, n=100, method="inclusive")
+    return {
+        "min": min(records),
+        "max": max(records),
+        "avg": statistics.fmean(records),
+        "std": statistics.pstdev(records),
+        "p50": percentiles[49],
+        "p90": percentiles[89],
+        "p99": percentiles[98],
+        "count": len(records),
+    }
+
+
+def calibrate(timer: timeit.Timer, min_time: float) -> int:
+    """
+    Number of loops so that a repeat takes at least min_time seconds.
+    """
+    number = 1
+    while True:
+        if timer.timeit(number) >= min_time:
+            return number
+        number *= 2
+
+
+def run_scenario(
+    scenario: Scenario,
+    calendar: str,
+    *,
+    repeat: int,
+    min_time: float,
+) -> dict[str, Any]:
+    """
+    Time a scenario over a calendar.
+
+    Returns:
+        dict[str, Any]: the result, whose "times" are the seconds per operation
+            of each repeat, and "predicate_calls" is the number of calls of the
+            underlying is_holiday function in an operation (None if unknown).
+    """
+    is_holiday = CALENDARS[calendar]()
+    operation = scenario.setup(is_holiday)
+    timer = timeit.Timer(operation)
+    number = calibrate(timer, min_time)
+    times = [t / number for t in timer.repeat(repeat, number)]
+
+    counter = get_call_counter(is_holiday)
+    predicate_calls = None
+    if counter is not None:
+        counter.count = 0
+        operation()
+        predicate_calls = counter.count
+
+    return {
+        "scenario": scenario.name,
+        "calendar": calendar,
+        "description": scenario.description,
+        "number": number,
+        "repeat": repeat,
+        "times": times,
+        "stats": calc_statistics(times),
+        "predicate_calls": predicate_calls,
+    }
+
+
+def run_benchmarks(
+    scenarios: Iterable[Scenario],
+    calendars: Iterable[str],
+    *,
+    repeat: int = 20,
+    min_time: float = 0.01,
+) -> Iterable[dict[str, Any]]:
+    """
+    Time every scenario over every calendar, yielding each result.
+    """
+    calendars = list(calendars)
+    for scenario in scenarios:
+        for calendar in calendars:
+            yield run_scenario(
+                scenario,
+                calendar,
+                repeat=repeat,
+                min_time=min_time,
+            )
+
+
+def get_git_revision() -> dict[str, Any]:
+    """
+    Git revision of the working tree, if it is a git repository.
+    """
+    def git(*args: str) -> str:
+        return subprocess.run(
+            ["git", *args],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+
+    try:
+        return {
+            "commit": git("rev-parse", "HEAD"),
+            "dirty": bool(git("status", "--porcelain", "--untracked-files=no")),
+        }
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+
+
+def collect_metadata() -> dict[str, Any]:
+    """
+    Environment of a benchmark run: Python, machine and git revision.
+    """
+    return {
+        "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "pybizday_utils": importlib.metadata.version("pybizday_utils"),
+        "python": {
+            "version": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "executable": sys.executable,
+        },
+        "machine": {
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "cpu_count": os.cpu_count(),
+            "node": platform.node(),
+        },
+        "git": get_git_revision(),
+    }
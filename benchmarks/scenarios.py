@@ -0,0 +1,234 @@
+"""Scenarios of the benchmark suite.
+
+A scenario builds, for a given is_holiday function, a function without
+arguments which performs one operation to be timed.
+"""
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Callable
+
+from pybizday_utils import (
+    add_months,
+    add_years,
+    add_years_months,
+    bizday_range,
+    count_bizdays,
+    get_biz_end_of_month,
+    get_biz_start_of_month,
+    get_n_next_bizday,
+    get_n_prev_bizday,
+    get_next_bizday,
+    get_prev_bizday,
+    is_biz_end_of_month,
+    is_biz_start_of_month,
+    is_bizday,
+    unchecked,
+)
+from pybizday_utils.default_holiday_utils import (
+    global_default_holiday_discriminator,
+    with_is_holiday_funcs,
+)
+from pybizday_utils.holiday_utils import IsHolidayFuncType, compile_is_holiday
+
+from .calendars import START
+
+# dates which the scenarios of a single date iterate over
+DATES = [date(2025, 1, 1) + timedelta(days=i) for i in range(366)]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    Benchmark scenario.
+
+    Attributes:
+        name: name of the scenario.
+        description: what one operation does.
+        setup: function which builds the operation for an is_holiday function.
+    """
+
+    name: str
+    description: str
+    setup: Callable[[IsHolidayFuncType], Callable[[], object]]
+
+
+def _over_dates(
+    func: Callable[[date, IsHolidayFuncType], object],
+) -> Callable[[IsHolidayFuncType], Callable[[], object]]:
+    """
+    Setup of an operation which calls func for each of DATES.
+    """
+
+    def setup(is_holiday: IsHolidayFuncType) -> Callable[[], object]:
+        def run() -> object:
+            return [func(d, is_holiday) for d in DATES]
+
+        return run
+
+    return setup
+
+
+def _bizday_range(is_holiday: IsHolidayFuncType) -> Callable[[], object]:
+    return lambda: list(
+        bizday_range(date(2025, 1, 1), date(2025, 12, 31), is_holiday)
+    )
+
+
+def _count_bizdays(is_holiday: IsHolidayFuncType) -> Callable[[], object]:
+    return lambda: count_bizdays(date(2025, 1, 1), date(2034, 12, 31), is_holiday)  # noqa: E501
+
+
+def _get_n_next_bizday_large_n(
+    is_holiday: IsHolidayFuncType,
+) -> Callable[[], object]:
+    return lambda: get_n_next_bizday(date(2025, 1, 1), 10000, is_holiday)
+
+
+def _get_n_prev_bizday_large_n(
+    is_holiday: IsHolidayFuncType,
+) -> Callable[[], object]:
+    return lambda: get_n_prev_bizday(date(2075, 1, 1), 10000, is_holiday)
+
+
+def _compile_cold(is_holiday: IsHolidayFuncType) -> Callable[[], object]:
+    return lambda: compile_is_holiday(
+        is_holiday,
+        START,
+        START + timedelta(days=3652),
+    )
+
+
+def _compile_warm(is_holiday: IsHolidayFuncType) -> Callable[[], object]:
+    compiled = compile_is_holiday(is_holiday, START, START + timedelta(days=36524))  # noqa: E501
+    return lambda: [compiled(d) for d in DATES]
+
+
+def _with_is_holiday_funcs(
+    is_holiday: IsHolidayFuncType,
+) -> Callable[[], object]:
+    def run() -> object:
+        with with_is_holiday_funcs(holiday=is_holiday, all_replace=True):
+            return get_next_bizday(date(2025, 1, 1))
+
+    def run_default() -> object:
+        # the global default holidays cannot be replaced by themselves
+        with with_is_holiday_funcs():
+            return get_next_bizday(date(2025, 1, 1))
+
+    if is_holiday is global_default_holiday_discriminator:
+        return run_default
+    return run
+
+
+SCENARIOS: list[Scenario] = [
+    Scenario(
+        "is_holiday",
+        "calls of the is_holiday function itself for each day of a year",
+        _over_dates(lambda d, f: f(d)),
+    ),
+    Scenario(
+        "is_bizday",
+        "is_bizday for each day of a year",
+        _over_dates(is_bizday),
+    ),
+    Scenario(
+        "is_bizday_unchecked",
+        "unchecked.is_bizday, i.e. without validation, for each day of a year",  # noqa: E501
+        _over_dates(unchecked.is_bizday),
+    ),
+    Scenario(
+        "get_next_bizday",
+        "get_next_bizday for each day of a year",
+        _over_dates(get_next_bizday),
+    ),
+    Scenario(
+        "get_next_bizday_unchecked",
+        "unchecked.get_next_bizday for each day of a year",
+        _over_dates(unchecked.get_next_bizday),
+    ),
+    Scenario(
+        "get_prev_bizday",
+        "get_prev_bizday for each day of a year",
+        _over_dates(get_prev_bizday),
+    ),
+    Scenario(
+        "get_n_next_bizday",
+        "get_n_next_bizday with n=5 for each day of a year",
+        _over_dates(lambda d, f: get_n_next_bizday(d, 5, f)),
+    ),
+    Scenario(
+        "get_n_next_bizday_large_n",
+        "get_n_next_bizday with n=10000",
+        _get_n_next_bizday_large_n,
+    ),
+    Scenario(
+        "get_n_prev_bizday_large_n",
+        "get_n_prev_bizday with n=10000",
+        _get_n_prev_bizday_large_n,
+    ),
+    Scenario(
+        "bizday_range",
+        "list of bizday_range over a year",
+        _bizday_range,
+    ),
+    Scenario(
+        "count_bizdays",
+        "count_bizdays over ten years",
+        _count_bizdays,
+    ),
+    Scenario(
+        "is_biz_end_of_month",
+        "is_biz_end_of_month for each day of a year",
+        _over_dates(is_biz_end_of_month),
+    ),
+    Scenario(
+        "is_biz_start_of_month",
+        "is_biz_start_of_month for each day of a year",
+        _over_dates(is_biz_start_of_month),
+    ),
+    Scenario(
+        "get_biz_end_of_month",
+        "get_biz_end_of_month for each day of a year",
+        _over_dates(get_biz_end_of_month),
+    ),
+    Scenario(
+        "get_biz_start_of_month",
+        "get_biz_start_of_month for each day of a year",
+        _over_dates(get_biz_start_of_month),
+    ),
+    Scenario(
+        "add_months",
+        "add_months with 1 month for each day of a year",
+        _over_dates(lambda d, f: add_months(d, 1, f)),
+    ),
+    Scenario(
+        "add_years",
+        "add_years with 1 year for each day of a year",
+        _over_dates(lambda d, f: add_years(d, 1, f)),
+    ),
+    Scenario(
+        "add_years_months",
+        "add_years_months with 1 year and 1 month and both adjustments for each day of a year",  # noqa: E501
+        _over_dates(
+            lambda d, f: add_years_months(
+                d, 1, 1, f, bizeom2bizeom=True, bizsom2bizsom=True
+            )
+        ),
+    ),
+    Scenario(
+        "compile_is_holiday_cold",
+        "compile_is_holiday over ten years",
+        _compile_cold,
+    ),
+    Scenario(
+        "compile_is_holiday_warm",
+        "calls of a function compiled over a century for each day of a year",
+        _compile_warm,
+    ),
+    Scenario(
+        "with_is_holiday_funcs",
+        "get_next_bizday with the default holidays replaced by with_is_holiday_funcs",  # noqa: E501
+        _with_is_holiday_funcs,
+    ),
+]
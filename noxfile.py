@@ -16,4 +16,4 @@ def lint(session):
 @nox.session(venv_backend="uv", python=["3.10", "3.11", "3.12", "3.13"])
 def mypy(session):
     session.install("-e", ".[dev]")
-    session.run("mypy", "src", "tests")
+    session.run("mypy", "src", "tests", "benchmarks")
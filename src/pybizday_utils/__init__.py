@@ -1,25 +1,13 @@
-from . import (
-    default_holiday_utils,
-    holiday_utils,
-)
-from .basic import (
-    bizday_range,
-    count_bizdays,
-    get_n_next_bizday,
-    get_n_prev_bizday,
-    get_next_bizday,
-    get_prev_bizday,
-    is_bizday,
-)
-from .month import (
-    add_months,
-    add_years,
-    add_years_months,
-    get_biz_end_of_month,
-    get_biz_start_of_month,
-    is_biz_end_of_month,
-    is_biz_start_of_month,
-)
+"""Python Business Day Utilities.
+
+The public names are loaded lazily (PEP 562): `import pybizday_utils` only
+imports the version, and each submodule is imported on first access to one of
+its names, e.g. `pybizday_utils.get_next_bizday`.
+"""
+
+import importlib
+import importlib.util
+from typing import TYPE_CHECKING, Any
 
 try:
     from ._version import __version__  # noqa
@@ -30,12 +18,69 @@ except ImportError as e:
         "Please report this to the developer: https://github.com/hmasdev/pybizday_utils/issues/new"  # noqa: E501
     ) from e
 
+if TYPE_CHECKING:
+    from . import (
+        default_holiday_utils,
+        holiday_utils,
+        instrumentation,
+        unchecked,
+    )
+    from .basic import (
+        bizday_range,
+        count_bizdays,
+        get_n_next_bizday,
+        get_n_prev_bizday,
+        get_next_bizday,
+        get_prev_bizday,
+        is_bizday,
+    )
+    from .business_calendar import BusinessCalendar
+    from .month import (
+        MonthPosition,
+        add_months,
+        add_years,
+        add_years_months,
+        get_biz_end_of_month,
+        get_biz_start_of_month,
+        get_month_position,
+        is_biz_end_of_month,
+        is_biz_start_of_month,
+    )
+    from .weekmask import WeekmaskCalendar
+
+# public name -> submodule which defines it (None for the submodule itself)
+_LAZY_ATTRS: dict[str, str | None] = {
+    "add_months": "month",
+    "add_years": "month",
+    "add_years_months": "month",
+    "get_biz_end_of_month": "month",
+    "get_biz_start_of_month": "month",
+    "get_month_position": "month",
+    "is_biz_end_of_month": "month",
+    "is_biz_start_of_month": "month",
+    "MonthPosition": "month",
+    "bizday_range": "basic",
+    "count_bizdays": "basic",
+    "get_n_next_bizday": "basic",
+    "get_n_prev_bizday": "basic",
+    "get_next_bizday": "basic",
+    "get_prev_bizday": "basic",
+    "is_bizday": "basic",
+    "BusinessCalendar": "business_calendar",
+    "WeekmaskCalendar": "weekmask",
+    "default_holiday_utils": None,
+    "holiday_utils": None,
+    "instrumentation": None,
+    "unchecked": None,
+}
+
 __all__ = [
     "add_months",
     "add_years",
     "add_years_months",
     "get_biz_end_of_month",
     "get_biz_start_of_month",
+    "get_month_position",
     "is_biz_end_of_month",
     "is_biz_start_of_month",
     "bizday_range",
@@ -45,6 +90,34 @@ __all__ = [
     "get_next_bizday",
     "get_prev_bizday",
     "is_bizday",
+    "BusinessCalendar",
+    "MonthPosition",
+    "WeekmaskCalendar",
     "default_holiday_utils",
     "holiday_utils",
+    "instrumentation",
+    "unchecked",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY_ATTRS[name]
+    except KeyError:
+        # any other submodule, e.g. pybizday_utils.basic, is imported on demand
+        if name.startswith("_") or importlib.util.find_spec(f"{__name__}.{name}") is None:  # noqa: E501
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+        module_name = None
+    if module_name is None:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        value = getattr(importlib.import_module(f".{module_name}", __name__), name)  # noqa: E501
+    # cache it so that __getattr__ is not called again for the name
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
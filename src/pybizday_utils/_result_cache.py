@@ -0,0 +1,91 @@
+"""Opt-in cache of the n-th next business days found by scanning.
+
+It is shared by pybizday_utils.basic, which enables and inspects it
+(see pybizday_utils.basic.enable_result_cache),
+and pybizday_utils.unchecked, which scans through it.
+"""
+
+import datetime
+from collections import OrderedDict
+from typing import Hashable
+
+from .date_range_utils import date_range
+from .holiday_utils import IsHolidayFuncType, _cache_key
+
+
+class ResultCache:
+    """Bounded LRU cache of the n-th next business days found by scanning."""
+
+    def __init__(self, maxsize: int | None) -> None:
+        self.maxsize = maxsize
+        self.results: OrderedDict[
+            tuple[Hashable, datetime.date, int], datetime.date
+        ] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self) -> None:
+        """Remove all results and reset the statistics."""
+        self.results.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# the cache of the results of get_next_bizday, get_prev_bizday,
+# get_n_next_bizday and get_n_prev_bizday, or None if disabled.
+cache: ResultCache | None = None
+
+
+def scan_n_next_bizday(
+    date: datetime.date,
+    n: int,
+    is_holiday: IsHolidayFuncType,
+) -> datetime.date | None:
+    """n-th next business day (previous if n < 0) by scanning day by day.
+
+    None if it is beyond the range of datetime.date.
+    """
+    if n == 0:
+        if is_holiday(date):
+            raise ValueError(f"n=0 but date={date} is holiday")
+        return date
+    remaining_days = abs(n)
+    for d in date_range(date, include_start=False, step_days=1 if n > 0 else -1):  # noqa: E501
+        if not is_holiday(d):
+            remaining_days -= 1
+        if remaining_days == 0:
+            return d
+    return None
+
+
+def n_next_bizday(
+    date: datetime.date,
+    n: int,
+    is_holiday: IsHolidayFuncType,
+) -> datetime.date | None:
+    """scan_n_next_bizday memoized in the cache if enabled."""
+    current = cache
+    if current is None:
+        return scan_n_next_bizday(date, n, is_holiday)
+    fingerprint = _cache_key(is_holiday)
+    if fingerprint is None:
+        return scan_n_next_bizday(date, n, is_holiday)
+    key = (fingerprint, date, n)
+    results = current.results
+    try:
+        cached = results[key]
+        results.move_to_end(key)
+    except KeyError:
+        pass
+    else:
+        current.hits += 1
+        return cached
+    current.misses += 1
+    result = scan_n_next_bizday(date, n, is_holiday)
+    # not found is not cached, as errors are not
+    if result is None:
+        return None
+    results[key] = result
+    if current.maxsize is not None and len(results) > current.maxsize:
+        results.popitem(last=False)
+    return result
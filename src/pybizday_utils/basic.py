@@ -1,13 +1,67 @@
 import datetime
-from itertools import dropwhile, filterfalse
 from typing import Callable, Generator
 
-from .date_range_utils import date_range
+from . import _result_cache
+from . import instrumentation as _instrumentation
+from . import unchecked as _unchecked
 from .default_holiday_utils import global_default_holiday_discriminator
-from .holiday_utils import IsHolidayFuncType
+from .holiday_utils import CacheInfo, IsHolidayFuncType
 from .utils import validate_date_type
 
 
+def enable_result_cache(maxsize: int | None = 65536) -> None:
+    """Memoize the results of get_(n_)next_bizday and get_(n_)prev_bizday.
+
+    The results are keyed by the fingerprint of is_holiday, the date and the offset,
+    so that repeated offsets from the same dates cost a dict lookup instead of
+    scanning day by day. It is disabled by default.
+
+    Args:
+        maxsize (int | None, optional): Maximum number of results kept in the cache.
+            The least recently used result is evicted first.
+            None means unbounded. Defaults to 65536.
+
+    Raises:
+        ValueError: If maxsize is not positive.
+
+    Notes:
+        - Calling this function again replaces the cache with an empty one.
+        - Calendars answering the queries with index arithmetic, e.g. BusinessCalendar, are not cached.
+        - The fingerprint of a HolidayDiscriminator includes its version, so that the results are
+          not reused after its holiday functions are changed.
+          Other functions are assumed not to change their results.
+        - Unhashable is_holiday functions are not cached.
+    """  # noqa: E501
+    if maxsize is not None and maxsize <= 0:
+        raise ValueError(f"maxsize must be positive: maxsize = {maxsize}")
+    _result_cache.cache = _result_cache.ResultCache(maxsize)
+
+
+def disable_result_cache() -> None:
+    """Stop memoizing the results and discard the cache."""
+    _result_cache.cache = None
+
+
+def result_cache_info() -> CacheInfo | None:
+    """Get the statistics of the result cache.
+
+    Returns:
+        CacheInfo | None: Hits, misses, maximum size and current size of the cache,
+            or None if the cache is disabled.
+    """  # noqa: E501
+    cache = _result_cache.cache
+    if cache is None:
+        return None
+    return CacheInfo(cache.hits, cache.misses, cache.maxsize, len(cache.results))  # noqa: E501
+
+
+def result_cache_clear() -> None:
+    """Remove all results from the result cache and reset the statistics."""
+    cache = _result_cache.cache
+    if cache is not None:
+        cache.clear()
+
+
 def is_bizday(
     date: datetime.date | datetime.datetime,
     is_holiday: IsHolidayFuncType = global_default_holiday_discriminator,
@@ -32,10 +86,12 @@ def is_bizday(
     Returns:
         bool: True if the date is a business day, False otherwise.
     """
+    if _instrumentation.enabled:
+        _instrumentation.record_api_call("is_bizday")
     validate_date_type(date)
     if isinstance(date, datetime.datetime):
         date = datetime_handler(date)
-    return not is_holiday(date)
+    return _unchecked.is_bizday(date, is_holiday)
 
 
 def get_next_bizday(
@@ -63,13 +119,12 @@ def get_next_bizday(
     Returns:
         datetime.date: Next business day after the given date.
     """
+    if _instrumentation.enabled:
+        _instrumentation.record_api_call("get_next_bizday")
     validate_date_type(date)
     if isinstance(date, datetime.datetime):
         date = datetime_handler(date)
-    try:
-        return next(dropwhile(is_holiday, date_range(date, include_start=False)))
-    except StopIteration as e:
-        raise ValueError("No next business day found") from e
+    return _unchecked.get_next_bizday(date, is_holiday)
 
 
 def get_prev_bizday(
@@ -97,18 +152,12 @@ def get_prev_bizday(
     Returns:
         datetime.date: Previous business day before the given date.
     """
+    if _instrumentation.enabled:
+        _instrumentation.record_api_call("get_prev_bizday")
     validate_date_type(date)
     if isinstance(date, datetime.datetime):
         date = datetime_handler(date)
-    try:
-        return next(
-            dropwhile(
-                is_holiday,
-                date_range(date, include_start=False, step_days=-1),
-            )
-        )
-    except StopIteration as e:
-        raise ValueError("No previous business day found") from e
+    return _unchecked.get_prev_bizday(date, is_holiday)
 
 
 def get_n_next_bizday(
@@ -147,29 +196,12 @@ def get_n_next_bizday(
     Notes:
         - If n is negative, it will return the (-n)-th previous business day.
     """
+    if _instrumentation.enabled:
+        _instrumentation.record_api_call("get_n_next_bizday")
     validate_date_type(date)
     if isinstance(date, datetime.datetime):
         date = datetime_handler(date)
-    if n == 0:
-        if is_holiday(date):
-            raise ValueError(f"n=0 but date={date} is holiday")
-        return date
-    elif n > 0:
-        remaining_days = n
-        for d in date_range(date, include_start=False, step_days=1):
-            if not is_holiday(d):
-                remaining_days -= 1
-            if remaining_days == 0:
-                return d
-        else:
-            raise ValueError(f"No {n}-th next business day found")
-    else:
-        return get_n_prev_bizday(
-            date,
-            -n,
-            is_holiday,
-            datetime_handler=datetime_handler,
-        )
+    return _unchecked.get_n_next_bizday(date, n, is_holiday)
 
 
 def get_n_prev_bizday(
@@ -208,29 +240,12 @@ def get_n_prev_bizday(
     Notes:
         - If n is negative, it will return the (-n)-th next business day.
     """
+    if _instrumentation.enabled:
+        _instrumentation.record_api_call("get_n_prev_bizday")
     validate_date_type(date)
     if isinstance(date, datetime.datetime):
         date = datetime_handler(date)
-    if n == 0:
-        if is_holiday(date):
-            raise ValueError(f"n=0 but date={date} is holiday")
-        return date
-    elif n > 0:
-        remaining_days = n
-        for d in date_range(date, include_start=False, step_days=-1):
-            if not is_holiday(d):
-                remaining_days -= 1
-            if remaining_days == 0:
-                return d
-        else:
-            raise ValueError(f"No {n}-th previous business day found")
-    else:
-        return get_n_next_bizday(
-            date,
-            -n,
-            is_holiday,
-            datetime_handler=datetime_handler,
-        )
+    return _unchecked.get_n_prev_bizday(date, n, is_holiday)
 
 
 def bizday_range(
@@ -272,21 +287,20 @@ def bizday_range(
         - if include_end is True and end is not a holiday, the end date will be
           included in the range.
     """
+    if _instrumentation.enabled:
+        _instrumentation.record_api_call("bizday_range")
     validate_date_type(start)
     validate_date_type(end)
     if isinstance(start, datetime.datetime):
         start = datetime_handler(start)
     if isinstance(end, datetime.datetime):
         end = datetime_handler(end)
-    yield from filterfalse(
+    yield from _unchecked.bizday_range(
+        start,
+        end,
         is_holiday,
-        date_range(
-            start,
-            end,
-            include_start=include_start,
-            include_end=include_end,
-            step_days=1 if start <= end else -1,
-        ),
+        include_start=include_start,
+        include_end=include_end,
     )
 
 
@@ -329,27 +343,18 @@ def count_bizdays(
         - if include_end is True and end is not a holiday, the end date will be
           included in the count.
     """
+    if _instrumentation.enabled:
+        _instrumentation.record_api_call("count_bizdays")
     validate_date_type(start)
     validate_date_type(end)
     if isinstance(start, datetime.datetime):
         start = datetime_handler(start)
     if isinstance(end, datetime.datetime):
         end = datetime_handler(end)
-    if start > end:
-        return -count_bizdays(
-            end,
-            start,
-            is_holiday,
-            include_end=include_start,
-            include_start=include_end,
-            datetime_handler=datetime_handler,
-        )
-    bdrange = bizday_range(
+    return _unchecked.count_bizdays(
         start,
         end,
         is_holiday,
         include_start=include_start,
         include_end=include_end,
-        datetime_handler=datetime_handler,
     )
-    return sum(1 for _ in bdrange)
@@ -0,0 +1,665 @@
+import datetime
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left
+from itertools import compress
+from operator import ne
+from typing import Generator, Iterator
+
+from .holiday_utils import (
+    CompiledIsHoliday,
+    HolidayDiscriminator,
+    IsHolidayFuncType,
+)
+
+_MIN_ORDINAL = datetime.date.min.toordinal()
+_MAX_ORDINAL = datetime.date.max.toordinal()
+
+
+def _build_bizday_counts(
+    is_holiday: IsHolidayFuncType,
+    start_ordinal: int,
+    end_ordinal: int,
+) -> "array[int]":
+    """Table whose i-th element is the number of business days in [start, start + i days)."""  # noqa: E501
+    fromordinal = datetime.date.fromordinal
+    counts = array("i", [0])
+    count = 0
+    for o in range(start_ordinal, end_ordinal + 1):
+        count += not is_holiday(fromordinal(o))
+        counts.append(count)
+    return counts
+
+
+def _source_discriminator(
+    is_holiday: IsHolidayFuncType,
+) -> HolidayDiscriminator | None:
+    """HolidayDiscriminator whose changes change the results of is_holiday, if any."""  # noqa: E501
+    source: IsHolidayFuncType | None = is_holiday
+    if isinstance(source, CompiledIsHoliday):
+        source = source._is_holiday
+    if isinstance(source, HolidayDiscriminator):
+        return source
+    return None
+
+
+class BaseBusinessCalendar(ABC):
+    """Base class of business day calendars answered by index arithmetic.
+
+    Subclasses implement the lookups on date ordinals
+    (see datetime.date.toordinal), and this class provides the public methods
+    with the same semantics as the functions in `pybizday_utils.basic`.
+    Functions in `pybizday_utils.basic` and `pybizday_utils.month` switch to
+    these methods when an instance is passed as their `is_holiday` argument.
+
+    Notes:
+        - calling an instance returns whether the date is a holiday,
+          so an instance is also an IsHolidayFuncType.
+    """
+
+    def __init__(self) -> None:
+        # _month_tables[year][month - 1]: ordinals of the first and last
+        # business days of the month (0 if not found) and the number of
+        # business days in the month, filled lazily
+        self._month_tables: dict[int, list[tuple[int, int, int] | None]] = {}
+
+    def __call__(self, date: datetime.datetime | datetime.date) -> bool:
+        """Check if the given date is a holiday.
+
+        Args:
+            date (datetime.datetime | datetime.date): Date to check.
+
+        Returns:
+            bool: True if the date is a holiday, False otherwise.
+        """
+        if isinstance(date, datetime.datetime):
+            date = date.date()
+        return self._is_holiday_ordinal(date.toordinal())
+
+    def is_bizday(self, date: datetime.datetime | datetime.date) -> bool:
+        """Check if the given date is a business day.
+
+        Args:
+            date (datetime.datetime | datetime.date): Date to check.
+
+        Returns:
+            bool: True if the date is a business day, False otherwise.
+        """
+        return not self(date)
+
+    def next(self, date: datetime.datetime | datetime.date) -> datetime.date:
+        """Get the next business day after the given date.
+
+        Args:
+            date (datetime.datetime | datetime.date): Reference date.
+
+        Raises:
+            ValueError: If no next business day is found.
+
+        Returns:
+            datetime.date: Next business day after the given date.
+        """
+        if isinstance(date, datetime.datetime):
+            date = date.date()
+        ordinal = self._n_next_ordinal(date.toordinal(), 1)
+        if ordinal is None:
+            raise ValueError("No next business day found")
+        return datetime.date.fromordinal(ordinal)
+
+    def prev(self, date: datetime.datetime | datetime.date) -> datetime.date:
+        """Get the previous business day before the given date.
+
+        Args:
+            date (datetime.datetime | datetime.date): Reference date.
+
+        Raises:
+            ValueError: If no previous business day is found.
+
+        Returns:
+            datetime.date: Previous business day before the given date.
+        """
+        if isinstance(date, datetime.datetime):
+            date = date.date()
+        ordinal = self._n_prev_ordinal(date.toordinal(), 1)
+        if ordinal is None:
+            raise ValueError("No previous business day found")
+        return datetime.date.fromordinal(ordinal)
+
+    def n_next(
+        self,
+        date: datetime.datetime | datetime.date,
+        n: int,
+    ) -> datetime.date:
+        """Get the n-th next business day after the given date.
+
+        Args:
+            date (datetime.datetime | datetime.date): Reference date.
+            n (int): Number of business days to skip.
+                See pybizday_utils.basic.get_n_next_bizday.
+
+        Raises:
+            ValueError: If n=0 and the date is a holiday.
+            ValueError: If no n-th next business day is found.
+
+        Returns:
+            datetime.date: n-th next business day after the given date.
+        """
+        if isinstance(date, datetime.datetime):
+            date = date.date()
+        if n == 0:
+            if self(date):
+                raise ValueError(f"n=0 but date={date} is holiday")
+            return date
+        elif n < 0:
+            return self.n_prev(date, -n)
+        ordinal = self._n_next_ordinal(date.toordinal(), n)
+        if ordinal is None:
+            raise ValueError(f"No {n}-th next business day found")
+        return datetime.date.fromordinal(ordinal)
+
+    def n_prev(
+        self,
+        date: datetime.datetime | datetime.date,
+        n: int,
+    ) -> datetime.date:
+        """Get the n-th previous business day before the given date.
+
+        Args:
+            date (datetime.datetime | datetime.date): Reference date.
+            n (int): Number of business days to skip.
+                See pybizday_utils.basic.get_n_prev_bizday.
+
+        Raises:
+            ValueError: If n=0 and the date is a holiday.
+            ValueError: If no n-th previous business day is found.
+
+        Returns:
+            datetime.date: n-th previous business day before the given date.
+        """
+        if isinstance(date, datetime.datetime):
+            date = date.date()
+        if n == 0:
+            if self(date):
+                raise ValueError(f"n=0 but date={date} is holiday")
+            return date
+        elif n < 0:
+            return self.n_next(date, -n)
+        ordinal = self._n_prev_ordinal(date.toordinal(), n)
+        if ordinal is None:
+            raise ValueError(f"No {n}-th previous business day found")
+        return datetime.date.fromordinal(ordinal)
+
+    def bizday_range(
+        self,
+        start: datetime.datetime | datetime.date,
+        end: datetime.datetime | datetime.date,
+        *,
+        include_start: bool = True,
+        include_end: bool = True,
+    ) -> Generator[datetime.date, None, None]:
+        """Generate a range of business days between two dates.
+
+        Args:
+            start (datetime.datetime | datetime.date): Start date.
+            end (datetime.datetime | datetime.date): End date.
+            include_start (bool, optional): Include the start date in the range.
+                Defaults to True.
+            include_end (bool, optional): Include the end date in the range.
+                Defaults to True.
+
+        Yields:
+            Generator[datetime.date, None, None]: Business days between start and end
+                dates, in descending order if start > end.
+        """  # noqa: E501
+        if isinstance(start, datetime.datetime):
+            start = start.date()
+        if isinstance(end, datetime.datetime):
+            end = end.date()
+        lo, hi = start.toordinal(), end.toordinal()
+        descending = lo > hi
+        if descending:
+            lo, hi = hi, lo
+            include_start, include_end = include_end, include_start
+        if not include_start:
+            lo += 1
+        if not include_end:
+            hi -= 1
+        fromordinal = datetime.date.fromordinal
+        ordinals = self._iter_bizday_ordinals(lo, hi, descending)
+        yield from map(fromordinal, ordinals)
+
+    def count_bizdays(
+        self,
+        start: datetime.datetime | datetime.date,
+        end: datetime.datetime | datetime.date,
+        *,
+        include_start: bool = True,
+        include_end: bool = True,
+    ) -> int:
+        """Count the number of business days between two dates.
+
+        Args:
+            start (datetime.datetime | datetime.date): Start date.
+            end (datetime.datetime | datetime.date): End date.
+            include_start (bool, optional): Include the start date in the count.
+                Defaults to True.
+            include_end (bool, optional): Include the end date in the count.
+                Defaults to True.
+
+        Returns:
+            int: Number of business days between start and end dates.
+
+        Notes:
+            - if start > end, the count will be negative.
+        """
+        if isinstance(start, datetime.datetime):
+            start = start.date()
+        if isinstance(end, datetime.datetime):
+            end = end.date()
+        lo, hi = start.toordinal(), end.toordinal()
+        sign = 1
+        if lo > hi:
+            lo, hi = hi, lo
+            include_start, include_end = include_end, include_start
+            sign = -1
+        if not include_start:
+            lo += 1
+        if not include_end:
+            hi -= 1
+        return sign * self._count_ordinals(lo, hi)
+
+    def is_biz_start_of_month(
+        self,
+        date: datetime.datetime | datetime.date,
+    ) -> bool:
+        """Check if the given date is the first business day of the month.
+
+        Args:
+            date (datetime.datetime | datetime.date): Date to check.
+
+        Raises:
+            ValueError: If the date is a business day but no previous business day is found.
+
+        Returns:
+            bool: True if the date is the first business day of the month, False otherwise.
+
+        Notes:
+            - the same as pybizday_utils.month.is_biz_start_of_month.
+        """  # noqa: E501
+        if isinstance(date, datetime.datetime):
+            date = date.date()
+        if date.toordinal() != self._get_month_row(date.year, date.month)[0]:  # noqa: E501
+            return False
+        if date.month > 1:
+            preceding = self._get_month_row(date.year, date.month - 1)[1]
+        elif date.year > datetime.MINYEAR:
+            preceding = self._get_month_row(date.year - 1, 12)[1]
+        else:
+            preceding = 0
+        if not preceding:
+            raise ValueError("No previous business day found")
+        return datetime.date.fromordinal(preceding).month != date.month
+
+    def is_biz_end_of_month(
+        self,
+        date: datetime.datetime | datetime.date,
+    ) -> bool:
+        """Check if the given date is the last business day of the month.
+
+        Args:
+            date (datetime.datetime | datetime.date): Date to check.
+
+        Raises:
+            ValueError: If the date is a business day but no next business day is found.
+
+        Returns:
+            bool: True if the date is the last business day of the month, False otherwise.
+
+        Notes:
+            - the same as pybizday_utils.month.is_biz_end_of_month.
+        """  # noqa: E501
+        if isinstance(date, datetime.datetime):
+            date = date.date()
+        if date.toordinal() != self._get_month_row(date.year, date.month)[1]:  # noqa: E501
+            return False
+        if date.month < 12:
+            following = self._get_month_row(date.year, date.month + 1)[0]
+        elif date.year < datetime.MAXYEAR:
+            following = self._get_month_row(date.year + 1, 1)[0]
+        else:
+            following = 0
+        if not following:
+            raise ValueError("No next business day found")
+        return datetime.date.fromordinal(following).month != date.month
+
+    def biz_start_of_month(
+        self,
+        date: datetime.datetime | datetime.date,
+    ) -> datetime.date:
+        """Get the first business day of the month for the given date.
+
+        Args:
+            date (datetime.datetime | datetime.date): Reference date.
+
+        Raises:
+            ValueError: If no business day is found after the end of the previous month.
+
+        Returns:
+            datetime.date: first business day of the month for the given date.
+
+        Notes:
+            - the same as pybizday_utils.month.get_biz_start_of_month,
+              i.e. the next business day after the end of the previous month.
+        """  # noqa: E501
+        first = self._get_month_row(date.year, date.month)[0]
+        if not first:
+            raise ValueError("No next business day found")
+        return datetime.date.fromordinal(first)
+
+    def biz_end_of_month(
+        self,
+        date: datetime.datetime | datetime.date,
+    ) -> datetime.date:
+        """Get the last business day of the month for the given date.
+
+        Args:
+            date (datetime.datetime | datetime.date): Reference date.
+
+        Raises:
+            ValueError: If no business day is found before the start of the next month.
+
+        Returns:
+            datetime.date: last business day of the month for the given date.
+
+        Notes:
+            - the same as pybizday_utils.month.get_biz_end_of_month,
+              i.e. the previous business day before the start of the next month.
+        """  # noqa: E501
+        last = self._get_month_row(date.year, date.month)[1]
+        if not last:
+            raise ValueError("No previous business day found")
+        return datetime.date.fromordinal(last)
+
+    def count_bizdays_in_month(
+        self,
+        date: datetime.datetime | datetime.date,
+    ) -> int:
+        """Count the number of business days in the month of the given date.
+
+        Args:
+            date (datetime.datetime | datetime.date): Reference date.
+
+        Returns:
+            int: Number of business days in the month.
+        """
+        return self._get_month_row(date.year, date.month)[2]
+
+    def _get_month_row(self, year: int, month: int) -> tuple[int, int, int]:
+        """First and last business days (0 if not found) and the number of business days of the month."""  # noqa: E501
+        try:
+            table = self._month_tables[year]
+        except KeyError:
+            table = self._month_tables[year] = [None] * 12
+        row = table[month - 1]
+        if row is None:
+            lo = datetime.date(year, month, 1).toordinal()
+            hi = (
+                datetime.date(year, month + 1, 1).toordinal()
+                if month < 12
+                else datetime.date(year, 12, 31).toordinal() + 1
+            )
+            row = table[month - 1] = (
+                self._n_next_ordinal(lo - 1, 1) or 0,
+                self._n_prev_ordinal(hi, 1) or 0,
+                self._count_ordinals(lo, hi - 1),
+            )
+        return row
+
+    @abstractmethod
+    def _is_holiday_ordinal(self, ordinal: int) -> bool:
+        """Whether the day of the ordinal is a holiday."""
+
+    @abstractmethod
+    def _count_ordinals(self, lo: int, hi: int) -> int:
+        """Number of business days in [lo, hi]."""
+
+    @abstractmethod
+    def _n_next_ordinal(self, ordinal: int, n: int) -> int | None:
+        """Ordinal of the n-th (n > 0) business day after ordinal, or None."""
+
+    @abstractmethod
+    def _n_prev_ordinal(self, ordinal: int, n: int) -> int | None:
+        """Ordinal of the n-th (n > 0) business day before ordinal, or None."""
+
+    @abstractmethod
+    def _iter_bizday_ordinals(
+        self,
+        lo: int,
+        hi: int,
+        descending: bool = False,
+    ) -> Iterator[int]:
+        """Ordinals of the business days in [lo, hi]."""
+
+
+class BusinessCalendar(BaseBusinessCalendar):
+    """Indexed business day calendar built from an is_holiday function.
+
+    The business days between start and end are evaluated once and kept as a
+    cumulative count of business days per calendar day.
+    Counting business days in the range takes two lookups, and the n-th next or
+    previous business day is found by bisection over the counts,
+    instead of calling is_holiday day by day.
+    Outside the range, the original is_holiday function is used.
+    If is_holiday is a HolidayDiscriminator, or a CompiledIsHoliday of one,
+    the counts and the month tables are rebuilt whenever its holiday functions are changed.
+
+    An instance can be passed as the `is_holiday` argument of every function in
+    `pybizday_utils.basic` and `pybizday_utils.month`,
+    which then switch to the indexed path automatically.
+
+    Args:
+        is_holiday (IsHolidayFuncType): function to check if a date is a holiday.
+        start (datetime.date | datetime.datetime): start date of the index.
+        end (datetime.date | datetime.datetime): end date of the index.
+
+    Raises:
+        ValueError: If start is greater than end.
+
+    Notes:
+        - start and end dates are inclusive.
+        - a rebuild costs as much as the construction, and must not run
+          concurrently with other calls.
+    """  # noqa: E501
+
+    def __init__(
+        self,
+        is_holiday: IsHolidayFuncType,
+        start: datetime.date | datetime.datetime,
+        end: datetime.date | datetime.datetime,
+    ) -> None:
+        if isinstance(start, datetime.datetime):
+            start = start.date()
+        if isinstance(end, datetime.datetime):
+            end = end.date()
+        if start > end:
+            raise ValueError(
+                "Start date must be before end date: "
+                f"start = {start}, end = {end}"
+            )
+        counts = _build_bizday_counts(
+            is_holiday,
+            start.toordinal(),
+            end.toordinal(),
+        )
+        self._init(is_holiday, start, counts)
+        discriminator = _source_discriminator(is_holiday)
+        if discriminator is not None:
+            # weakly, so that the discriminator does not keep this calendar alive.
+            # A CompiledIsHoliday subscribed earlier, so it is rebuilt first.
+            discriminator.subscribe(self._on_change, weak=True)
+
+    @classmethod
+    def from_compiled(cls, compiled: CompiledIsHoliday) -> "BusinessCalendar":
+        """Build a calendar over the range of a compiled is_holiday function.
+
+        The holidays are read from the bitmap of the compiled function,
+        and if it has a prefix-count table (e.g. loaded by load_compiled from
+        a file saved with counts), the table is shared without copying.
+
+        Args:
+            compiled (CompiledIsHoliday): compiled is_holiday function.
+
+        Returns:
+            BusinessCalendar: calendar from compiled.start to compiled.end,
+                which falls back to compiled outside the range.
+        """
+        self = cls.__new__(cls)
+        self._init(compiled, compiled.start, compiled.bizday_counts())
+        discriminator = _source_discriminator(compiled)
+        if discriminator is not None:
+            # compiled subscribed earlier, so it is rebuilt first
+            discriminator.subscribe(self._on_compiled_change, weak=True)
+        return self
+
+    def _init(
+        self,
+        is_holiday: IsHolidayFuncType,
+        start: datetime.date,
+        counts: "array[int] | memoryview",
+    ) -> None:
+        super().__init__()
+        self._is_holiday = is_holiday
+        self._start = start
+        self._start_ordinal = start.toordinal()
+        self._end_ordinal = self._start_ordinal + len(counts) - 2
+        self._end = datetime.date.fromordinal(self._end_ordinal)
+        self._counts = counts
+
+    def _on_change(self, discriminator: HolidayDiscriminator) -> None:
+        # rebuild the counts, and the month tables from scratch by _init
+        counts = _build_bizday_counts(
+            self._is_holiday,
+            self._start_ordinal,
+            self._end_ordinal,
+        )
+        self._init(self._is_holiday, self._start, counts)
+
+    def _on_compiled_change(self, discriminator: HolidayDiscriminator) -> None:
+        # share the counts of the rebuilt compiled function again
+        compiled = self._is_holiday
+        assert isinstance(compiled, CompiledIsHoliday)
+        self._init(compiled, compiled.start, compiled.bizday_counts())
+
+    @property
+    def start(self) -> datetime.date:
+        """Start date of the index (inclusive)."""
+        return self._start
+
+    @property
+    def end(self) -> datetime.date:
+        """End date of the index (inclusive)."""
+        return self._end
+
+    @property
+    def is_holiday(self) -> IsHolidayFuncType:
+        """Original function to check if a date is a holiday."""
+        return self._is_holiday
+
+    def _is_holiday_ordinal(self, ordinal: int) -> bool:
+        if ordinal < self._start_ordinal or ordinal > self._end_ordinal:
+            return self._is_holiday(datetime.date.fromordinal(ordinal))
+        i = ordinal - self._start_ordinal
+        return self._counts[i + 1] == self._counts[i]
+
+    def _count_ordinals(self, lo: int, hi: int) -> int:
+        if lo > hi:
+            return 0
+        fromordinal = datetime.date.fromordinal
+        count = 0
+        # count with the raw function outside the indexed range
+        for o in range(lo, min(hi, self._start_ordinal - 1) + 1):
+            count += not self._is_holiday(fromordinal(o))
+        for o in range(max(lo, self._end_ordinal + 1), hi + 1):
+            count += not self._is_holiday(fromordinal(o))
+        # two lookups inside the indexed range
+        i = max(lo, self._start_ordinal) - self._start_ordinal
+        j = min(hi, self._end_ordinal) - self._start_ordinal + 1
+        if i < j:
+            count += self._counts[j] - self._counts[i]
+        return count
+
+    def _n_next_ordinal(self, ordinal: int, n: int) -> int | None:
+        remaining = n
+        # scan with the raw function until reaching the indexed range
+        for o in range(ordinal + 1, self._start_ordinal):
+            if not self._is_holiday(datetime.date.fromordinal(o)):
+                remaining -= 1
+                if remaining == 0:
+                    return o
+        ordinal = max(ordinal, self._start_ordinal - 1)
+        # bisection over the counts inside the indexed range
+        if ordinal < self._end_ordinal:
+            target = self._counts[ordinal - self._start_ordinal + 1] + remaining
+            total = self._counts[-1]
+            if target <= total:
+                # the first day whose count reaches target is the business day
+                i = bisect_left(self._counts, target)
+                return self._start_ordinal + i - 1
+            remaining = target - total
+            ordinal = self._end_ordinal
+        # scan with the raw function beyond the indexed range
+        for o in range(ordinal + 1, _MAX_ORDINAL + 1):
+            if not self._is_holiday(datetime.date.fromordinal(o)):
+                remaining -= 1
+                if remaining == 0:
+                    return o
+        return None
+
+    def _n_prev_ordinal(self, ordinal: int, n: int) -> int | None:
+        remaining = n
+        # scan with the raw function until reaching the indexed range
+        for o in range(ordinal - 1, self._end_ordinal, -1):
+            if not self._is_holiday(datetime.date.fromordinal(o)):
+                remaining -= 1
+                if remaining == 0:
+                    return o
+        ordinal = min(ordinal, self._end_ordinal + 1)
+        # bisection over the counts inside the indexed range
+        if ordinal > self._start_ordinal:
+            target = self._counts[ordinal - self._start_ordinal] - remaining + 1
+            if target >= 1:
+                # the first day whose count reaches target is the business day
+                i = bisect_left(self._counts, target)
+                return self._start_ordinal + i - 1
+            remaining = 1 - target
+            ordinal = self._start_ordinal
+        # scan with the raw function beyond the indexed range
+        for o in range(ordinal - 1, _MIN_ORDINAL - 1, -1):
+            if not self._is_holiday(datetime.date.fromordinal(o)):
+                remaining -= 1
+                if remaining == 0:
+                    return o
+        return None
+
+    def _iter_bizday_ordinals(
+        self,
+        lo: int,
+        hi: int,
+        descending: bool = False,
+    ) -> Generator[int, None, None]:
+        fromordinal = datetime.date.fromordinal
+        below = range(lo, min(hi, self._start_ordinal - 1) + 1)
+        above = range(max(lo, self._end_ordinal + 1), hi + 1)
+        i = max(lo, self._start_ordinal) - self._start_ordinal
+        j = max(min(hi, self._end_ordinal) - self._start_ordinal + 1, i)
+        # days whose count differs from the previous one are business days
+        inside: Iterator[int] = compress(
+            range(self._start_ordinal + i, self._start_ordinal + j),
+            map(ne, self._counts[i + 1:j + 1], self._counts[i:j]),
+        )
+        if descending:
+            below, above = above[::-1], below[::-1]
+            inside = reversed(list(inside))
+        yield from (o for o in below if not self._is_holiday(fromordinal(o)))
+        yield from inside
+        yield from (o for o in above if not self._is_holiday(fromordinal(o)))
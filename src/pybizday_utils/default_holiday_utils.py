@@ -66,6 +66,7 @@ def with_is_holiday_funcs(
     *is_holiday_funcs_args: IsHolidayFuncType,
     allow_overwrite: bool = False,
     all_replace: bool = False,
+    priority: int = 0,
     **is_holiday_funcs_kwargs: IsHolidayFuncType,
 ) -> Generator[HolidayDiscriminator, None, None]:
     """Context manager to add custom holiday functions.
@@ -75,6 +76,7 @@ def with_is_holiday_funcs(
         *is_holiday_funcs_args (IsHolidayFuncType): Custom holiday functions to add.
         allow_overwrite (bool, optional): Whether to allow overwriting existing holiday functions. Defaults to False.
         all_replace (bool, optional): Whether to remove all current holiday functions before adding new ones. Defaults to False.
+        priority (int, optional): Priority of the custom holiday functions. See HolidayDiscriminator.add_is_holiday_funcs. Defaults to 0.
         **is_holiday_funcs_kwargs (IsHolidayFuncType): Custom holiday functions to add.
 
     Yields:
@@ -90,6 +92,7 @@ def with_is_holiday_funcs(
     default = _GlobalDefaultHolidayDiscriminator.get_instance()
     # Cache the current holiday functions
     _cache = default.is_holiday_funcs
+    _priorities = default.priorities
 
     # If all_replace is True, remove all current holiday functions
     if all_replace:
@@ -99,6 +102,7 @@ def with_is_holiday_funcs(
     default.add_is_holiday_funcs(
         *is_holiday_funcs_args,
         allow_overwrite=allow_overwrite,
+        priority=priority,
         **is_holiday_funcs_kwargs,
     )
 
@@ -107,8 +111,13 @@ def with_is_holiday_funcs(
     finally:
         # remove all holiday functions
         default.remove_is_holiday_funcs(*default.names)
-        # Restore the original state
-        default.add_is_holiday_funcs(**_cache, allow_overwrite=True)
+        # Restore the original state, one by one to keep the priorities
+        for name, func in _cache.items():
+            default.add_is_holiday_funcs(
+                allow_overwrite=True,
+                priority=_priorities[name],
+                **{name: func},
+            )
 
 
 # initialize the default holiday functions
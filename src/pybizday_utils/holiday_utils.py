@@ -1,13 +1,34 @@
 import datetime
-from functools import wraps
+import hashlib
+import mmap as _mmap
+import os
+import struct
+import sys
+import time
+import types
+import weakref
+from array import array
+from collections import OrderedDict
+from functools import lru_cache, update_wrapper
 from logging import Logger, getLogger
-from typing import Callable
+from typing import Callable, Hashable, NamedTuple
 
-from .date_range_utils import date_range
+from . import instrumentation as _instrumentation
 
 _logger = getLogger(__name__)
 IsHolidayFuncType = Callable[[datetime.datetime | datetime.date], bool]  # noqa: E501
 
+# header of the compiled calendar file. See load_compiled for the format.
+_COMPILED_MAGIC = b"PYBIZDAY"
+_COMPILED_VERSION = 1
+_COMPILED_HEADER = struct.Struct("<8sHHIIB3x32s8x")
+_COMPILED_FLAG_COUNTS = 1
+
+# an adaptive HolidayDiscriminator times one in _ADAPTIVE_SAMPLE_INTERVAL calls
+# and reorders its functions every _ADAPTIVE_REORDER_SAMPLES timed calls
+_ADAPTIVE_SAMPLE_INTERVAL = 16
+_ADAPTIVE_REORDER_SAMPLES = 64
+
 
 def is_saturday_or_sunday(
     date: datetime.datetime | datetime.date,
@@ -79,33 +100,200 @@ def is_between_1231_0103(
     return is_the_end_of_year(date) or is_the_first_three_days_of_new_year(date)
 
 
+@lru_cache(maxsize=None)
+def _flat_call_factory(
+    n: int,
+) -> Callable[..., IsHolidayFuncType]:
+    """Factory of a function which evaluates n functions in order without a loop.
+
+    e.g. for n = 2, the factory is equivalent to
+
+        def factory(f0, f1):
+            def flat_call(date):
+                if f0(date):
+                    return True
+                if f1(date):
+                    return True
+                return False
+            return flat_call
+    """  # noqa: E501
+    args = [f"f{i}" for i in range(n)]
+    lines = [f"def factory({', '.join(args)}):", "    def flat_call(date):"]
+    for arg in args:
+        lines += [f"        if {arg}(date):", "            return True"]
+    lines += ["        return False", "    return flat_call"]
+    namespace: dict[str, Callable[..., IsHolidayFuncType]] = {}
+    exec("\n".join(lines), namespace)
+    return namespace["factory"]
+
+
+def _make_flat_call(funcs: tuple[IsHolidayFuncType, ...]) -> IsHolidayFuncType:
+    """Function equivalent to `lambda date: any(func(date) for func in funcs)`."""  # noqa: E501
+    return _flat_call_factory(len(funcs))(*funcs)
+
+
 class HolidayDiscriminator:
     """Class to check if a date is a holiday.
 
     This class allows you to add custom holiday functions and check if a date is a holiday based on those functions.
     It also provides a way to remove holiday functions and get the names of the registered holiday functions.
 
+    The holiday functions are evaluated in descending order of their priorities, and in the order of registration
+    for the same priority, until one of them returns True.
+    In the adaptive mode, the functions of the same priority are reordered by their observed cost per hit,
+    so that cheap functions which often return True are evaluated first.
+    The results are the same in any order as long as the functions have no side effects.
+
     Args:
         *funcs (IsHolidayFuncType): Holiday functions to add.
+        adaptive (bool, optional): Whether to reorder the holiday functions by their observed cost per hit.
+            Defaults to False.
         **kwargs (IsHolidayFuncType): Holiday functions to add.
 
     Properties:
         names (list[str]): List of names of the registered holiday functions.
         is_holiday_funcs (dict[str, IsHolidayFuncType]): Dictionary of the registered holiday functions.
+        priorities (dict[str, int]): Dictionary of the priorities of the registered holiday functions.
+        evaluation_order (list[str]): List of names of the registered holiday functions in the order of evaluation.
+        adaptive (bool): Whether the adaptive mode is enabled.
+        version (int): Number of changes of the holiday functions or their priorities.
 
     Methods:
         __call__(date: datetime.datetime | datetime.date) -> bool: Check if the given date is a holiday.
         add_is_holiday_funcs(*is_holiday_funcs_args: IsHolidayFuncType, **is_holiday_funcs_kwargs: IsHolidayFuncType) -> None: Add custom holiday functions.
         remove_is_holiday_funcs(*names: str) -> None: Remove holiday functions by their names.
+        subscribe(callback: Callable[[HolidayDiscriminator], object], weak: bool = False) -> Callable[[], None]: Call a function on every change.
     """  # noqa: E501
 
     def __init__(
         self,
         *funcs: IsHolidayFuncType,
+        adaptive: bool = False,
         **kwargs: IsHolidayFuncType,
     ) -> None:
-        self._is_holiday_funcs = {func.__name__: func for func in funcs}
-        self._is_holiday_funcs.update(kwargs)
+        self._adaptive = adaptive
+        self._priorities: dict[str, int] = {}
+        # name -> [number of calls, number of hits, cumulative nanoseconds]
+        # observed in the adaptive mode
+        self._rule_stats: dict[str, list[int]] = {}
+        self._n_calls = 0
+        self._n_samples = 0
+        # the functions in the order of evaluation, and their flat call
+        self._order_funcs: tuple[IsHolidayFuncType, ...] = ()
+        self._flat_call = _make_flat_call(())
+        self._version = 0
+        # key -> function returning the subscriber, or None if it is dead
+        self._subscribers: dict[
+            object,
+            Callable[[], Callable[["HolidayDiscriminator"], object] | None],
+        ] = {}
+        self._funcs = {func.__name__: func for func in funcs}
+        self._funcs.update(kwargs)
+        self._update_order()
+
+    @property
+    def _is_holiday_funcs(self) -> dict[str, IsHolidayFuncType]:
+        return self._funcs
+
+    @_is_holiday_funcs.setter
+    def _is_holiday_funcs(self, funcs: dict[str, IsHolidayFuncType]) -> None:
+        self._funcs = funcs
+        self._update_order()
+        self._notify_change()
+
+    @property
+    def version(self) -> int:
+        """Number of changes of the holiday functions or their priorities.
+
+        It increases on every change, so a cache derived from this discriminator
+        is stale if the version differs from the one when the cache was built.
+        """  # noqa: E501
+        return self._version
+
+    def subscribe(
+        self,
+        callback: Callable[["HolidayDiscriminator"], object],
+        *,
+        weak: bool = False,
+    ) -> Callable[[], None]:
+        """Call a function with this discriminator on every change.
+
+        Args:
+            callback (Callable[[HolidayDiscriminator], object]): function to call after each change.
+            weak (bool, optional): Whether to hold only a weak reference to callback,
+                which is unsubscribed when it is garbage collected. Defaults to False.
+
+        Returns:
+            Callable[[], None]: function to unsubscribe the callback.
+
+        Notes:
+            - An exception raised by a callback is logged and does not stop the other callbacks.
+        """  # noqa: E501
+        key = object()
+        subscribers = self._subscribers
+
+        def discard(_: object) -> None:
+            # called when the weakly referenced callback is garbage collected
+            subscribers.pop(key, None)
+
+        ref: Callable[[], Callable[[HolidayDiscriminator], object] | None]
+        if not weak:
+            ref = lambda: callback  # noqa: E731
+        elif isinstance(callback, types.MethodType):
+            ref = weakref.WeakMethod(callback, discard)
+        else:
+            ref = weakref.ref(callback, discard)
+        subscribers[key] = ref
+
+        def unsubscribe() -> None:
+            self._subscribers.pop(key, None)
+
+        return unsubscribe
+
+    def _notify_change(self) -> None:
+        """Increase the version and call the subscribers."""
+        self._version += 1
+        for key, ref in list(self._subscribers.items()):
+            callback = ref()
+            if callback is None:
+                self._subscribers.pop(key, None)
+                continue
+            try:
+                callback(self)
+            except Exception:
+                _logger.exception(f"Subscriber {callback!r} of {self!r} failed")
+
+    def _update_order(self) -> None:
+        """Update the order of evaluation of the holiday functions."""
+        for name in self._priorities.keys() - self._funcs.keys():
+            del self._priorities[name]
+        for name in self._rule_stats.keys() - self._funcs.keys():
+            del self._rule_stats[name]
+        self._order = tuple(
+            sorted(
+                self._funcs.items(),
+                key=lambda item: (
+                    -self._priorities.get(item[0], 0),
+                    self._cost_per_hit(item[0]) if self._adaptive else 0.0,
+                ),
+            )
+        )
+        order_funcs = tuple(func for _, func in self._order)
+        if order_funcs != self._order_funcs:
+            self._order_funcs = order_funcs
+            self._flat_call = _make_flat_call(order_funcs)
+
+    def _cost_per_hit(self, name: str) -> float:
+        """Estimated nanoseconds per hit of a holiday function in the adaptive mode.
+
+        Functions which are not observed yet come first to be observed.
+        """  # noqa: E501
+        try:
+            calls, hits, ns = self._rule_stats[name]
+        except KeyError:
+            return 0.0
+        # the hit rate is smoothed so that it is positive
+        return (ns / max(calls, 1)) * (calls + 2) / (hits + 1)
 
     def __call__(self, date: datetime.datetime | datetime.date) -> bool:
         """Check if the given date is a holiday.
@@ -116,7 +304,60 @@ class HolidayDiscriminator:
         Returns:
             bool: True if the date is a holiday, False otherwise.
         """
-        return any(func(date) for func in self._is_holiday_funcs.values())
+        if _instrumentation.enabled:
+            return self._call_instrumented(date)
+        if self._adaptive:
+            return self._call_adaptive(date)
+        return self._flat_call(date)
+
+    def _call_instrumented(self, date: datetime.datetime | datetime.date) -> bool:  # noqa: E501
+        """__call__ recording the calls, hits and time of each rule."""
+        perf_counter_ns = time.perf_counter_ns
+        for name, func in self._order:
+            t0 = perf_counter_ns()
+            hit = bool(func(date))
+            _instrumentation.record_rule_call(
+                self,
+                name,
+                func,
+                hit,
+                perf_counter_ns() - t0,
+            )
+            if hit:
+                return True
+        return False
+
+    def _call_adaptive(self, date: datetime.datetime | datetime.date) -> bool:
+        """__call__ observing the cost and hits of each rule in some calls."""
+        self._n_calls += 1
+        if self._n_calls % _ADAPTIVE_SAMPLE_INTERVAL:
+            return self._flat_call(date)
+        perf_counter_ns = time.perf_counter_ns
+        result = False
+        for name, func in self._order:
+            t0 = perf_counter_ns()
+            hit = bool(func(date))
+            elapsed = perf_counter_ns() - t0
+            try:
+                stats = self._rule_stats[name]
+            except KeyError:
+                stats = self._rule_stats[name] = [0, 0, 0]
+            stats[0] += 1
+            stats[1] += hit
+            stats[2] += elapsed
+            if hit:
+                result = True
+                break
+        self._n_samples += 1
+        if self._n_samples >= _ADAPTIVE_REORDER_SAMPLES:
+            self._n_samples = 0
+            self._update_order()
+            # halve the statistics so that recent calls weigh more
+            for stats in self._rule_stats.values():
+                stats[0] //= 2
+                stats[1] //= 2
+                stats[2] //= 2
+        return result
 
     @property
     def names(self) -> list[str]:
@@ -140,10 +381,39 @@ class HolidayDiscriminator:
         """  # noqa: E501
         return self._is_holiday_funcs.copy()
 
+    @property
+    def priorities(self) -> dict[str, int]:
+        """Get the priorities of the registered holiday functions.
+
+        Returns:
+            dict[str, int]: Dictionary of the priorities of the registered holiday functions.
+        """  # noqa: E501
+        return {name: self._priorities.get(name, 0) for name in self._funcs}
+
+    @property
+    def evaluation_order(self) -> list[str]:
+        """Get the names of the registered holiday functions in the order of evaluation.
+
+        Returns:
+            list[str]: List of names of the registered holiday functions in the order of evaluation.
+        """  # noqa: E501
+        return [name for name, _ in self._order]
+
+    @property
+    def adaptive(self) -> bool:
+        """Whether the holiday functions are reordered by their observed cost per hit."""  # noqa: E501
+        return self._adaptive
+
+    @adaptive.setter
+    def adaptive(self, adaptive: bool) -> None:
+        self._adaptive = adaptive
+        self._update_order()
+
     def add_is_holiday_funcs(
         self,
         *is_holiday_funcs_args: IsHolidayFuncType,
         allow_overwrite: bool = False,
+        priority: int = 0,
         **is_holiday_funcs_kwargs: IsHolidayFuncType,
     ) -> None:
         """Add custom holiday functions.
@@ -151,6 +421,8 @@ class HolidayDiscriminator:
         Args:
             *is_holiday_funcs_args (IsHolidayFuncType): Holiday functions to add.
             allow_overwrite (bool, optional): Allow overwriting existing holiday functions. Defaults to False.
+            priority (int, optional): Priority of the holiday functions to add. The functions of higher priorities are evaluated first.
+                Defaults to 0.
             **is_holiday_funcs_kwargs (IsHolidayFuncType): Holiday functions to add.
 
         Raises:
@@ -180,6 +452,10 @@ class HolidayDiscriminator:
         for name, is_holiday_func in dic.items():
             # TODO: more strict type checking
             self._is_holiday_funcs[name] = is_holiday_func
+            self._priorities[name] = priority
+            self._rule_stats.pop(name, None)
+        self._update_order()
+        self._notify_change()
 
     def remove_is_holiday_funcs(
         self,
@@ -200,6 +476,386 @@ class HolidayDiscriminator:
         # remove the functions
         for name in names:
             self._is_holiday_funcs.pop(name)
+        self._update_order()
+        self._notify_change()
+
+
+def _build_holiday_bitmap(
+    is_holiday: IsHolidayFuncType,
+    start_ordinal: int,
+    end_ordinal: int,
+) -> bytearray:
+    """Bitmap whose i-th bit is whether the day of start_ordinal + i is a holiday."""  # noqa: E501
+    bitmap = bytearray((end_ordinal - start_ordinal) // 8 + 1)
+    fromordinal = datetime.date.fromordinal
+    for i, ordinal in enumerate(range(start_ordinal, end_ordinal + 1)):
+        if is_holiday(fromordinal(ordinal)):
+            bitmap[i >> 3] |= 1 << (i & 7)
+    return bitmap
+
+
+def _add_years_clipped(date: datetime.date, years: int) -> datetime.date:
+    """Add years to a date, clipped to [date.min, date.max].
+
+    February 29 is mapped to February 28 in a non-leap year.
+    """
+    year = date.year + years
+    if year > datetime.MAXYEAR:
+        return datetime.date.max
+    if year < datetime.MINYEAR:
+        return datetime.date.min
+    try:
+        return date.replace(year=year)
+    except ValueError:
+        return date.replace(year=year, day=28)
+
+
+class OutOfRangeInfo(NamedTuple):
+    """Statistics of the dates out of the range of a CompiledIsHoliday.
+
+    Attributes:
+        calls: number of calls with a date out of the compilation range.
+        earliest: earliest of the dates. None if calls is 0.
+        latest: latest of the dates. None if calls is 0.
+    """
+
+    calls: int
+    earliest: datetime.date | None
+    latest: datetime.date | None
+
+
+class CompiledIsHoliday:
+    """Function to check if a date is a holiday, compiled into a bitmap.
+
+    The holidays between start and end are kept as one bit per day,
+    indexed by the offset of `date.toordinal()` from the start date,
+    so that a check is integer arithmetic and a byte lookup.
+    The bitmap takes (end - start).days / 8 bytes, i.e. about 4.5 KB per century.
+    Outside the range, the original function is used,
+    or, if extend_years is given, the range is extended to cover the date.
+    Only the first date out of the range is logged as a warning;
+    the others are counted, see out_of_range_info.
+    If the function is a HolidayDiscriminator, the bitmap is rebuilt whenever
+    its holiday functions are changed.
+
+    Args:
+        is_holiday (IsHolidayFuncType): Function to compile.
+        start (datetime.datetime | datetime.date): Start date for compilation.
+        end (datetime.datetime | datetime.date): End date for compilation.
+        logger (Logger, optional): Logger. Defaults to getLogger(__name__).
+        extend_years (int | None, optional): Number of years by which the range is extended
+            when a date out of the range is checked. The range is extended up to the date
+            if it is farther. None means that the range is never extended. Defaults to None.
+
+    Raises:
+        ValueError: If start is greater than end, or extend_years is not positive.
+
+    Properties:
+        start (datetime.date): Start date for compilation.
+        end (datetime.date): End date for compilation.
+        nbytes (int): Size of the bitmap in bytes.
+        extend_years (int | None): Number of years by which the range is extended.
+
+    Methods:
+        __call__(date: datetime.datetime | datetime.date) -> bool: Check if the given date is a holiday.
+        out_of_range_info() -> OutOfRangeInfo: Get the statistics of the dates out of the range.
+        reset_out_of_range_info() -> None: Reset the statistics and log the next date out of the range again.
+
+    Note:
+        - start and end dates are inclusive.
+        - an extension or a change of the HolidayDiscriminator rebuilds the bitmap,
+          so it must not run concurrently with other calls.
+        - the rebuild costs as much as the compilation, and runs on every change.
+    """  # noqa: E501
+
+    def __init__(
+        self,
+        is_holiday: IsHolidayFuncType,
+        start: datetime.datetime | datetime.date,
+        end: datetime.datetime | datetime.date,
+        logger: Logger = _logger,
+        *,
+        extend_years: int | None = None,
+    ) -> None:
+        # Preprocess start and end dates
+        if isinstance(start, datetime.datetime):
+            start = start.date()
+        if isinstance(end, datetime.datetime):
+            end = end.date()
+
+        # validate start and end dates
+        if start > end:
+            raise ValueError(
+                "Start date must be before end date: "
+                f"start = {start}, end = {end}"
+            )
+
+        update_wrapper(self, is_holiday, updated=())
+        bitmap = _build_holiday_bitmap(
+            is_holiday,
+            start.toordinal(),
+            end.toordinal(),
+        )
+        self._init(
+            is_holiday,
+            start,
+            end,
+            bitmap,
+            logger,
+            extend_years=extend_years,
+        )
+        if isinstance(is_holiday, HolidayDiscriminator):
+            # weakly, so that the discriminator does not keep this bitmap alive
+            is_holiday.subscribe(self._on_change, weak=True)
+
+    def _init(
+        self,
+        is_holiday: IsHolidayFuncType | None,
+        start: datetime.date,
+        end: datetime.date,
+        bitmap: bytearray | memoryview,
+        logger: Logger,
+        counts: "array[int] | memoryview | None" = None,
+        extend_years: int | None = None,
+    ) -> None:
+        if extend_years is not None and extend_years <= 0:
+            raise ValueError(
+                f"extend_years must be positive: extend_years = {extend_years}"  # noqa: E501
+            )
+        self._is_holiday = is_holiday
+        self._extend_years = extend_years
+        self._start = start
+        self._end = end
+        self._start_ordinal = start.toordinal()
+        self._end_ordinal = end.toordinal()
+        self._logger = logger
+        self._bitmap = bitmap
+        self._counts = counts
+        self._fingerprint: str | None = None
+        self._n_out_of_range = 0
+        self._earliest_out_of_range: datetime.date | None = None
+        self._latest_out_of_range: datetime.date | None = None
+
+    @property
+    def start(self) -> datetime.date:
+        """Start date for compilation."""
+        return self._start
+
+    @property
+    def end(self) -> datetime.date:
+        """End date for compilation."""
+        return self._end
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the bitmap in bytes."""
+        return len(self._bitmap)
+
+    @property
+    def extend_years(self) -> int | None:
+        """Number of years by which the range is extended."""
+        return self._extend_years
+
+    def __call__(self, date: datetime.datetime | datetime.date) -> bool:
+        """Check if the given date is a holiday.
+
+        Args:
+            date (datetime.datetime | datetime.date): Date to check.
+
+        Returns:
+            bool: True if the date is a holiday, False otherwise.
+        """
+        # Preprocess date
+        if isinstance(date, datetime.datetime):
+            date = date.date()
+        i = date.toordinal() - self._start_ordinal
+        # validate date
+        if i < 0 or date > self._end:
+            if self._is_holiday is None:
+                raise ValueError(
+                    f"Date({date}) is out of the compilation range from {self._start} to {self._end}, "  # noqa: E501
+                    "and no function to fall back to is given."
+                )
+            if self._extend_years is not None:
+                self._extend(date)
+                return self(date)
+            self._record_out_of_range(date)
+            return self._is_holiday(date)
+        # Check the bit of the date
+        return bool(self._bitmap[i >> 3] >> (i & 7) & 1)
+
+    def _record_out_of_range(self, date: datetime.date) -> None:
+        """Count a date out of the range, and log only the first one."""
+        self._n_out_of_range += 1
+        if self._n_out_of_range == 1:
+            self._earliest_out_of_range = self._latest_out_of_range = date
+            self._logger.warning(
+                f"Date({date}) is out of the compilation range from {self._start} to {self._end}. "  # noqa: E501
+                "The other dates out of the range are counted without logging: see out_of_range_info()."  # noqa: E501
+            )
+            return
+        assert self._earliest_out_of_range is not None
+        assert self._latest_out_of_range is not None
+        if date < self._earliest_out_of_range:
+            self._earliest_out_of_range = date
+        elif date > self._latest_out_of_range:
+            self._latest_out_of_range = date
+
+    def out_of_range_info(self) -> OutOfRangeInfo:
+        """Get the statistics of the dates out of the compilation range.
+
+        Returns:
+            OutOfRangeInfo: Number of calls with a date out of the range,
+                and the earliest and latest of the dates.
+
+        Notes:
+            - dates which extend the range (see extend_years) are not counted.
+        """
+        return OutOfRangeInfo(
+            self._n_out_of_range,
+            self._earliest_out_of_range,
+            self._latest_out_of_range,
+        )
+
+    def reset_out_of_range_info(self) -> None:
+        """Reset the statistics of the dates out of the compilation range.
+
+        The next date out of the range is logged as a warning again.
+        """
+        self._n_out_of_range = 0
+        self._earliest_out_of_range = self._latest_out_of_range = None
+
+    def _extend(self, date: datetime.date) -> None:
+        """Extend the compilation range to cover the given date."""
+        assert self._is_holiday is not None
+        assert self._extend_years is not None
+        start, end = self._start, self._end
+        if date < start:
+            start = min(date, _add_years_clipped(start, -self._extend_years))
+        else:
+            end = max(date, _add_years_clipped(end, self._extend_years))
+        start_ordinal, end_ordinal = start.toordinal(), end.toordinal()
+
+        # concatenate the bitmaps as little-endian integers
+        n_days = self._end_ordinal - self._start_ordinal + 1
+        bits = int.from_bytes(self._bitmap, "little") & ((1 << n_days) - 1)
+        if start_ordinal < self._start_ordinal:
+            lower = _build_holiday_bitmap(
+                self._is_holiday,
+                start_ordinal,
+                self._start_ordinal - 1,
+            )
+            bits = int.from_bytes(lower, "little") | (
+                bits << (self._start_ordinal - start_ordinal)
+            )
+        if end_ordinal > self._end_ordinal:
+            upper = _build_holiday_bitmap(
+                self._is_holiday,
+                self._end_ordinal + 1,
+                end_ordinal,
+            )
+            bits |= int.from_bytes(upper, "little") << (
+                self._end_ordinal + 1 - start_ordinal
+            )
+        n_bytes = (end_ordinal - start_ordinal) // 8 + 1
+        self._logger.info(
+            f"Date({date}) is out of the compilation range from {self._start} to {self._end}, "  # noqa: E501
+            f"so the range is extended to start at {start} and end at {end}."
+        )
+
+        self._bitmap = bytearray(bits.to_bytes(n_bytes, "little"))
+        self._start, self._end = start, end
+        self._start_ordinal, self._end_ordinal = start_ordinal, end_ordinal
+        self._counts = None
+        self._fingerprint = None
+
+    def _on_change(self, discriminator: HolidayDiscriminator) -> None:
+        # rebuild the bitmap over the current, possibly extended, range
+        self._bitmap = _build_holiday_bitmap(
+            discriminator,
+            self._start_ordinal,
+            self._end_ordinal,
+        )
+        self._counts = None
+        self._fingerprint = None
+
+    @property
+    def fingerprint(self) -> str:
+        """SHA-256 hex digest of the compilation range and the bitmap."""
+        if self._fingerprint is None:
+            self._fingerprint = self._digest().hex()
+        return self._fingerprint
+
+    def bizday_counts(self) -> "array[int] | memoryview":
+        """Get the prefix-count table of business days.
+
+        Returns:
+            array[int] | memoryview: table whose i-th element is the number of
+                business days in [start, start + i days), of length (end - start).days + 2.
+
+        Notes:
+            - the table is computed from the bitmap on the first call,
+              unless it has been loaded by load_compiled.
+        """  # noqa: E501
+        if self._counts is None:
+            counts = array("i", [0])
+            count = 0
+            bitmap = self._bitmap
+            for i in range(self._end_ordinal - self._start_ordinal + 1):
+                count += not bitmap[i >> 3] >> (i & 7) & 1
+                counts.append(count)
+            self._counts = counts
+        return self._counts
+
+    def save_compiled(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        with_counts: bool = False,
+    ) -> None:
+        """Save the compiled function to a file which load_compiled can open.
+
+        Args:
+            path (str | os.PathLike[str]): path of the file.
+            with_counts (bool, optional): whether to save the prefix-count table
+                of business days as well. Defaults to False.
+
+        Notes:
+            - see load_compiled for the file format.
+            - the original function is not saved.
+        """
+        weekmask = 0
+        for weekday in range(7):
+            first = (weekday - (self._start_ordinal - 1)) % 7
+            offsets = range(first, self._end_ordinal - self._start_ordinal + 1, 7)  # noqa: E501
+            if offsets and all(
+                self._bitmap[i >> 3] >> (i & 7) & 1 for i in offsets
+            ):
+                weekmask |= 1 << weekday
+        header = _COMPILED_HEADER.pack(
+            _COMPILED_MAGIC,
+            _COMPILED_VERSION,
+            _COMPILED_FLAG_COUNTS if with_counts else 0,
+            self._start_ordinal,
+            self._end_ordinal,
+            weekmask,
+            self._digest(),
+        )
+        with open(path, "wb") as f:
+            f.write(header)
+            f.write(self._bitmap)
+            if with_counts:
+                f.write(b"\0" * (-len(self._bitmap) % 8))
+                counts = array("i", self.bizday_counts())
+                if sys.byteorder != "little":
+                    counts.byteswap()
+                f.write(counts.tobytes())
+
+    def _digest(self) -> bytes:
+        h = hashlib.sha256()
+        h.update(struct.pack("<II", self._start_ordinal, self._end_ordinal))
+        h.update(self._bitmap)
+        return h.digest()
 
 
 def compile_is_holiday(
@@ -207,7 +863,9 @@ def compile_is_holiday(
     start: datetime.datetime | datetime.date = datetime.date.min,
     end: datetime.datetime | datetime.date = datetime.date.max,
     logger: Logger = _logger,
-) -> IsHolidayFuncType:
+    *,
+    extend_years: int | None = None,
+) -> CompiledIsHoliday:
     """Compile a function to check if a date is a holiday.
 
     Args:
@@ -217,45 +875,477 @@ def compile_is_holiday(
         end (datetime.datetime | datetime.date, optional): End date for
             compilation. Defaults to datetime.date.max.
         logger (Logger, optional): Logger. Defaults to getLogger(__name__).
+        extend_years (int | None, optional): Number of years by which the
+            compilation range is extended when a date out of the range is checked,
+            instead of falling back to is_holiday.
+            None means that the range is never extended. Defaults to None.
 
     Returns:
-        IsHolidayFuncType: Compiled function.
+        CompiledIsHoliday: Compiled function, which keeps the holidays
+            as a bitmap of one bit per day. If is_holiday is a HolidayDiscriminator,
+            the bitmap is rebuilt whenever its holiday functions are changed.
+
+    Raises:
+        ValueError: If start is greater than end, or extend_years is not positive.
 
     Note:
         - start and end dates are inclusive.
     """  # noqa: E501
-    # Preprocess start and end dates
-    if isinstance(start, datetime.datetime):
-        start = start.date()
-    if isinstance(end, datetime.datetime):
-        end = end.date()
-
-    # validate start and end dates
-    if start > end:
+    return CompiledIsHoliday(
+        is_holiday,
+        start,
+        end,
+        logger,
+        extend_years=extend_years,
+    )
+
+
+def load_compiled(
+    path: str | os.PathLike[str],
+    *,
+    mmap: bool = True,
+    is_holiday: IsHolidayFuncType | None = None,
+    logger: Logger = _logger,
+    verify: bool = False,
+    extend_years: int | None = None,
+) -> CompiledIsHoliday:
+    """Load a compiled function saved by CompiledIsHoliday.save_compiled.
+
+    With mmap=True, the bitmap and the prefix-count table are used in place
+    through a read-only memory map, so processes loading the same file share
+    its pages through the OS page cache and nothing is parsed.
+
+    The file format is as follows (all integers are little-endian):
+
+    | offset     | size          | content                                                     |
+    | ---------- | ------------- | ----------------------------------------------------------- |
+    | 0          | 8             | magic `b"PYBIZDAY"`                                         |
+    | 8          | 2             | format version (uint16, currently 1)                        |
+    | 10         | 2             | flags (uint16, bit 0: the prefix-count table is present)    |
+    | 12         | 4             | ordinal of the start date (uint32)                          |
+    | 16         | 4             | ordinal of the end date (uint32)                            |
+    | 20         | 1             | weekmask (bit w: every weekday w in the range is a holiday) |
+    | 21         | 3             | reserved                                                    |
+    | 24         | 32            | fingerprint (SHA-256 of the range and the bitmap)           |
+    | 56         | 8             | reserved                                                    |
+    | 64         | B             | bitmap: bit i of byte i // 8 is whether start + i days is a holiday |
+    | 64 + B     | pad to 8      | padding (only when the prefix-count table is present)       |
+    | aligned    | 4 * (N + 1)   | prefix-count table (int32): business days in [start, start + i days) |
+
+    where N is the number of days in the range and B = (N - 1) // 8 + 1.
+
+    Args:
+        path (str | os.PathLike[str]): path of the file.
+        mmap (bool, optional): whether to memory-map the file instead of reading it.
+            Defaults to True.
+        is_holiday (IsHolidayFuncType | None, optional): function used for dates out of the range.
+            If None, checking such a date raises ValueError. Defaults to None.
+        logger (Logger, optional): Logger. Defaults to getLogger(__name__).
+        verify (bool, optional): whether to verify the fingerprint. Defaults to False.
+        extend_years (int | None, optional): Number of years by which the range is extended
+            when a date out of the range is checked. It requires is_holiday.
+            The extended bitmap is kept in memory, not in the file. Defaults to None.
+
+    Raises:
+        ValueError: If the file is not a compiled calendar file, its version is not supported,
+            its compilation range is invalid, it is shorter than its compilation range requires,
+            verify is True and the fingerprint does not match, or extend_years is given without is_holiday or is not positive.
+
+    Returns:
+        CompiledIsHoliday: Compiled function.
+    """  # noqa: E501
+    if extend_years is not None and is_holiday is None:
+        raise ValueError("extend_years requires is_holiday to extend the range.")  # noqa: E501
+    with open(path, "rb") as f:
+        if mmap:
+            buffer = memoryview(_mmap.mmap(f.fileno(), 0, access=_mmap.ACCESS_READ))  # noqa: E501
+        else:
+            buffer = memoryview(f.read())
+    if len(buffer) < _COMPILED_HEADER.size:
+        raise ValueError(f"{path} is not a compiled calendar file.")
+    magic, version, flags, start_ordinal, end_ordinal, _, fingerprint = (
+        _COMPILED_HEADER.unpack_from(buffer)
+    )
+    if magic != _COMPILED_MAGIC:
+        raise ValueError(f"{path} is not a compiled calendar file.")
+    if version != _COMPILED_VERSION:
+        raise ValueError(
+            f"Unsupported version of compiled calendar file: version = {version}"  # noqa: E501
+        )
+    if not 1 <= start_ordinal <= end_ordinal <= datetime.date.max.toordinal():  # noqa: E501
+        raise ValueError(
+            f"Invalid compilation range of {path}: "
+            f"start ordinal = {start_ordinal}, end ordinal = {end_ordinal}"
+        )
+    n_days = end_ordinal - start_ordinal + 1
+    n_bytes = (n_days - 1) // 8 + 1
+    size = _COMPILED_HEADER.size + n_bytes
+    if flags & _COMPILED_FLAG_COUNTS:
+        size += -n_bytes % 8 + 4 * (n_days + 1)
+    if len(buffer) < size:
         raise ValueError(
-            "Start date must be before end date: "
-            f"start = {start}, end = {end}"
+            f"{path} is truncated: {len(buffer)} bytes, expected {size} bytes."
         )
+    offset = _COMPILED_HEADER.size
+    bitmap = buffer[offset:offset + n_bytes]
+    counts: array[int] | memoryview | None = None
+    if flags & _COMPILED_FLAG_COUNTS:
+        offset += n_bytes + (-n_bytes % 8)
+        raw_counts = buffer[offset:offset + 4 * (n_days + 1)]
+        if sys.byteorder == "little":
+            counts = raw_counts.cast("i")
+        else:
+            counts = array("i")
+            counts.frombytes(raw_counts)
+            counts.byteswap()
 
-    # initialize the date range
-    holidays: set[datetime.date] = {
-        d
-        for d in date_range(start, end)
-        if is_holiday(d)
-    }
+    compiled = CompiledIsHoliday.__new__(CompiledIsHoliday)
+    if is_holiday is not None:
+        update_wrapper(compiled, is_holiday, updated=())
+    compiled._init(
+        is_holiday,
+        datetime.date.fromordinal(start_ordinal),
+        datetime.date.fromordinal(end_ordinal),
+        bitmap,
+        logger,
+        counts,
+        extend_years,
+    )
+    if verify and compiled._digest() != fingerprint:
+        raise ValueError(f"Fingerprint of {path} does not match.")
+    compiled._fingerprint = fingerprint.hex()
+    return compiled
 
-    @wraps(is_holiday)
-    def is_holiday_(d: datetime.datetime | datetime.date) -> bool:
-        # Preprocess date
-        if isinstance(d, datetime.datetime):
-            d = d.date()
-        # validate date
-        if d < start or d > end:
-            logger.warning(
-                f"Date({d}) is out of the compilation range from {start} to {end}.",
+
+class LazyCompiledIsHoliday:
+    """Function to check if a date is a holiday, compiled segment by segment.
+
+    Instead of evaluating the original function over the whole date range at once,
+    the holidays of a segment (a block of `segment_years` years) are computed when a date
+    in the segment is checked for the first time, and kept in a bounded cache.
+    So the cost of compilation is proportional to the dates actually checked.
+    If the original function is a HolidayDiscriminator, the cache is cleared whenever
+    its holiday functions are changed.
+
+    Args:
+        is_holiday (IsHolidayFuncType): Function to compile.
+        segment_years (int, optional): Number of years in a segment. Defaults to 1.
+        max_segments (int | None, optional): Maximum number of segments kept in the cache.
+            The least recently used segment is evicted first.
+            None means unbounded. Defaults to 128.
+
+    Raises:
+        ValueError: If segment_years or max_segments is not positive.
+
+    Properties:
+        n_resident_segments (int): Number of segments in the cache.
+        n_compiled_segments (int): Number of segments compiled so far, including evicted ones.
+
+    Methods:
+        __call__(date: datetime.datetime | datetime.date) -> bool: Check if the given date is a holiday.
+        cache_clear() -> None: Remove all segments from the cache.
+    """  # noqa: E501
+
+    def __init__(
+        self,
+        is_holiday: IsHolidayFuncType,
+        *,
+        segment_years: int = 1,
+        max_segments: int | None = 128,
+    ) -> None:
+        if segment_years <= 0:
+            raise ValueError(
+                f"segment_years must be positive: segment_years = {segment_years}"  # noqa: E501
             )
-            return is_holiday(d)
-        # Check if the date is in the set of holidays
-        return d in holidays
+        if max_segments is not None and max_segments <= 0:
+            raise ValueError(
+                f"max_segments must be positive: max_segments = {max_segments}"  # noqa: E501
+            )
+        update_wrapper(self, is_holiday, updated=())
+        self._is_holiday = is_holiday
+        self._segment_years = segment_years
+        self._max_segments = max_segments
+        # segment key -> (ordinal of the first day, bitmap of the holidays)
+        self._segments: OrderedDict[int, tuple[int, bytearray]] = OrderedDict()  # noqa: E501
+        self._n_compiled_segments = 0
+        if isinstance(is_holiday, HolidayDiscriminator):
+            # weakly, so that the discriminator does not keep this cache alive
+            is_holiday.subscribe(self._on_change, weak=True)
+
+    @property
+    def segment_years(self) -> int:
+        """Number of years in a segment."""
+        return self._segment_years
+
+    @property
+    def max_segments(self) -> int | None:
+        """Maximum number of segments kept in the cache."""
+        return self._max_segments
+
+    @property
+    def n_resident_segments(self) -> int:
+        """Number of segments in the cache."""
+        return len(self._segments)
+
+    @property
+    def n_compiled_segments(self) -> int:
+        """Number of segments compiled so far, including evicted ones."""
+        return self._n_compiled_segments
+
+    def cache_clear(self) -> None:
+        """Remove all segments from the cache."""
+        self._segments.clear()
+
+    def _on_change(self, discriminator: HolidayDiscriminator) -> None:
+        self.cache_clear()
+
+    def __call__(self, date: datetime.datetime | datetime.date) -> bool:
+        """Check if the given date is a holiday.
+
+        Args:
+            date (datetime.datetime | datetime.date): Date to check.
 
-    return is_holiday_
+        Returns:
+            bool: True if the date is a holiday, False otherwise.
+        """
+        if isinstance(date, datetime.datetime):
+            date = date.date()
+        key = (date.year - 1) // self._segment_years
+        try:
+            segment = self._segments[key]
+            self._segments.move_to_end(key)
+        except KeyError:
+            segment = self._compile_segment(key)
+        start_ordinal, bitmap = segment
+        i = date.toordinal() - start_ordinal
+        return bool(bitmap[i >> 3] >> (i & 7) & 1)
+
+    def _compile_segment(self, key: int) -> tuple[int, bytearray]:
+        first_year = key * self._segment_years + 1
+        last_year = min(first_year + self._segment_years - 1, datetime.MAXYEAR)
+        start_ordinal = datetime.date(first_year, 1, 1).toordinal()
+        end_ordinal = datetime.date(last_year, 12, 31).toordinal()
+        segment = (
+            start_ordinal,
+            _build_holiday_bitmap(self._is_holiday, start_ordinal, end_ordinal),
+        )
+        self._segments[key] = segment
+        self._n_compiled_segments += 1
+        if (
+            self._max_segments is not None
+            and len(self._segments) > self._max_segments
+        ):
+            self._segments.popitem(last=False)
+        return segment
+
+
+def compile_is_holiday_lazily(
+    is_holiday: IsHolidayFuncType,
+    *,
+    segment_years: int = 1,
+    max_segments: int | None = 128,
+) -> LazyCompiledIsHoliday:
+    """Compile a function to check if a date is a holiday on first touch.
+
+    Unlike compile_is_holiday, which evaluates is_holiday over the whole
+    compilation range at once, the returned function compiles the holidays
+    of each block of `segment_years` years when a date in the block is checked
+    for the first time, and keeps at most `max_segments` blocks.
+
+    Args:
+        is_holiday (IsHolidayFuncType): Function to compile.
+        segment_years (int, optional): Number of years in a segment.
+            Defaults to 1.
+        max_segments (int | None, optional): Maximum number of segments kept
+            in the cache. None means unbounded. Defaults to 128.
+
+    Returns:
+        LazyCompiledIsHoliday: Compiled function.
+
+    Raises:
+        ValueError: If segment_years or max_segments is not positive.
+    """
+    return LazyCompiledIsHoliday(
+        is_holiday,
+        segment_years=segment_years,
+        max_segments=max_segments,
+    )
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of the cache of a CachedIsHoliday.
+
+    Attributes:
+        hits: number of calls answered from the cache.
+        misses: number of calls which evaluated the original function.
+        maxsize: maximum number of results kept in the cache. None means unbounded.
+        currsize: number of results in the cache.
+    """  # noqa: E501
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+class CachedIsHoliday:
+    """Function to check if a date is a holiday, memoizing the results of the dates checked.
+
+    Unlike CompiledIsHoliday and LazyCompiledIsHoliday, which evaluate the original
+    function over a range of dates, the original function is evaluated only for the dates
+    actually checked, which suits expensive functions checked on scattered dates.
+    If the original function is a HolidayDiscriminator, the cache is cleared whenever
+    its holiday functions are changed.
+
+    Args:
+        is_holiday (IsHolidayFuncType): Function to memoize.
+        maxsize (int | None, optional): Maximum number of results kept in the cache.
+            The least recently used result is evicted first.
+            None means unbounded. Defaults to 4096.
+        key (Callable[[datetime.date], Hashable], optional): Function to get the key of the cache from a date.
+            Dates of the same key must have the same result. Defaults to datetime.date.toordinal.
+
+    Raises:
+        ValueError: If maxsize is not positive.
+
+    Properties:
+        maxsize (int | None): Maximum number of results kept in the cache.
+
+    Methods:
+        __call__(date: datetime.datetime | datetime.date) -> bool: Check if the given date is a holiday.
+        cache_info() -> CacheInfo: Get the statistics of the cache.
+        cache_clear() -> None: Remove all results from the cache and reset the statistics.
+    """  # noqa: E501
+
+    def __init__(
+        self,
+        is_holiday: IsHolidayFuncType,
+        *,
+        maxsize: int | None = 4096,
+        key: Callable[[datetime.date], Hashable] = datetime.date.toordinal,
+    ) -> None:
+        if maxsize is not None and maxsize <= 0:
+            raise ValueError(f"maxsize must be positive: maxsize = {maxsize}")
+        update_wrapper(self, is_holiday, updated=())
+        self._is_holiday = is_holiday
+        self._maxsize = maxsize
+        self._key = key
+        self._cache: OrderedDict[Hashable, bool] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        if isinstance(is_holiday, HolidayDiscriminator):
+            # weakly, so that the discriminator does not keep this cache alive
+            is_holiday.subscribe(self._on_change, weak=True)
+
+    @property
+    def maxsize(self) -> int | None:
+        """Maximum number of results kept in the cache."""
+        return self._maxsize
+
+    def cache_info(self) -> CacheInfo:
+        """Get the statistics of the cache.
+
+        Returns:
+            CacheInfo: Hits, misses, maximum size and current size of the cache.
+        """
+        return CacheInfo(self._hits, self._misses, self._maxsize, len(self._cache))  # noqa: E501
+
+    def cache_clear(self) -> None:
+        """Remove all results from the cache and reset the statistics."""
+        self._cache.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def _on_change(self, discriminator: HolidayDiscriminator) -> None:
+        # the results are stale, but the statistics are kept
+        self._cache.clear()
+
+    def __call__(self, date: datetime.datetime | datetime.date) -> bool:
+        """Check if the given date is a holiday.
+
+        Args:
+            date (datetime.datetime | datetime.date): Date to check.
+
+        Returns:
+            bool: True if the date is a holiday, False otherwise.
+        """
+        if isinstance(date, datetime.datetime):
+            date = date.date()
+        key = self._key(date)
+        try:
+            result = self._cache[key]
+            self._cache.move_to_end(key)
+        except KeyError:
+            pass
+        else:
+            self._hits += 1
+            return result
+        self._misses += 1
+        result = bool(self._is_holiday(date))
+        self._cache[key] = result
+        if self._maxsize is not None and len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
+        return result
+
+
+def cached_is_holiday(
+    is_holiday: IsHolidayFuncType,
+    *,
+    maxsize: int | None = 4096,
+    key: Callable[[datetime.date], Hashable] = datetime.date.toordinal,
+) -> CachedIsHoliday:
+    """Memoize a function to check if a date is a holiday with a bounded LRU cache.
+
+    The returned function evaluates is_holiday only for the dates not in its cache,
+    and can be used anywhere an is_holiday function is accepted.
+    If is_holiday is a HolidayDiscriminator, e.g. the global default holiday discriminator,
+    the cache is cleared whenever its holiday functions are changed.
+
+    Args:
+        is_holiday (IsHolidayFuncType): Function to memoize.
+        maxsize (int | None, optional): Maximum number of results kept in the cache.
+            None means unbounded. Defaults to 4096.
+        key (Callable[[datetime.date], Hashable], optional): Function to get the key of the cache from a date.
+            Defaults to datetime.date.toordinal.
+
+    Returns:
+        CachedIsHoliday: Memoized function.
+
+    Raises:
+        ValueError: If maxsize is not positive.
+    """  # noqa: E501
+    return CachedIsHoliday(is_holiday, maxsize=maxsize, key=key)
+
+
+def _cache_key(is_holiday: IsHolidayFuncType) -> Hashable | None:
+    """Key which changes whenever the results of is_holiday may change.
+
+    A HolidayDiscriminator is identified by itself and its version,
+    a CompiledIsHoliday by its fingerprint and its fallback function,
+    and a LazyCompiledIsHoliday or a CachedIsHoliday by itself and the function it wraps.
+    The other functions are identified by themselves, i.e. assumed not to change their results.
+
+    Returns:
+        Hashable | None: the key, or None if is_holiday is not hashable.
+    """  # noqa: E501
+    key: Hashable
+    if isinstance(is_holiday, HolidayDiscriminator):
+        key = (is_holiday, is_holiday.version)
+    elif isinstance(is_holiday, CompiledIsHoliday):
+        fallback = is_holiday._is_holiday
+        fallback_key = None if fallback is None else _cache_key(fallback)
+        if fallback is not None and fallback_key is None:
+            return None
+        key = (is_holiday.fingerprint, fallback_key)
+    elif isinstance(is_holiday, (LazyCompiledIsHoliday, CachedIsHoliday)):
+        wrapped_key = _cache_key(is_holiday._is_holiday)
+        if wrapped_key is None:
+            return None
+        key = (is_holiday, wrapped_key)
+    else:
+        key = is_holiday
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
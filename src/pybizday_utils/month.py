@@ -1,14 +1,13 @@
 import datetime
+from enum import Flag, auto
 from typing import Callable
 
-from dateutil.relativedelta import relativedelta
-
-from .basic import (
-    get_next_bizday,
-    get_prev_bizday,
-)
+from . import instrumentation as _instrumentation
 from .default_holiday_utils import global_default_holiday_discriminator
 from .holiday_utils import IsHolidayFuncType
+from .unchecked import get_next_bizday, get_prev_bizday
+from .utils import add_calendar_months
+from .weekmask import as_business_calendar
 
 
 def is_biz_end_of_month(
@@ -32,8 +31,13 @@ def is_biz_end_of_month(
     Returns:
         bool: True if the date is the last business day of the month, False otherwise.
     """  # noqa: E501
+    if _instrumentation.enabled:
+        _instrumentation.record_api_call("is_biz_end_of_month")
     if isinstance(date, datetime.datetime):
         date = datetime_handler(date)
+    calendar = as_business_calendar(is_holiday)
+    if calendar is not None:
+        return calendar.is_biz_end_of_month(date)
     if is_holiday(date):
         return False
     return date.month != (get_next_bizday(date, is_holiday)).month
@@ -60,8 +64,13 @@ def is_biz_start_of_month(
     Returns:
         bool: True if the date is the first business day of the month, False otherwise.
     """  # noqa: E501
+    if _instrumentation.enabled:
+        _instrumentation.record_api_call("is_biz_start_of_month")
     if isinstance(date, datetime.datetime):
         date = datetime_handler(date)
+    calendar = as_business_calendar(is_holiday)
+    if calendar is not None:
+        return calendar.is_biz_start_of_month(date)
     if is_holiday(date):
         return False
     return date.month != (get_prev_bizday(date, is_holiday)).month
@@ -88,8 +97,21 @@ def get_biz_end_of_month(
     Returns:
         datetime.date: last business day of the month for the given date.
     """  # noqa: E501
+    if _instrumentation.enabled:
+        _instrumentation.record_api_call("get_biz_end_of_month")
     if isinstance(date, datetime.datetime):
         date = datetime_handler(date)
+    return _get_biz_end_of_month(date, is_holiday)
+
+
+def _get_biz_end_of_month(
+    date: datetime.date,
+    is_holiday: IsHolidayFuncType,
+) -> datetime.date:
+    """get_biz_end_of_month of a datetime.date, not recorded by the instrumentation."""  # noqa: E501
+    calendar = as_business_calendar(is_holiday)
+    if calendar is not None:
+        return calendar.biz_end_of_month(date)
     date = date.replace(day=1)  # start of month
     date = date + datetime.timedelta(days=31)
     date = date.replace(day=1)  # start of next month
@@ -117,13 +139,113 @@ def get_biz_start_of_month(
     Returns:
         datetime.date: first business day of the month for the given date.
     """  # noqa: E501
+    if _instrumentation.enabled:
+        _instrumentation.record_api_call("get_biz_start_of_month")
     if isinstance(date, datetime.datetime):
         date = datetime_handler(date)
+    return _get_biz_start_of_month(date, is_holiday)
+
+
+def _get_biz_start_of_month(
+    date: datetime.date,
+    is_holiday: IsHolidayFuncType,
+) -> datetime.date:
+    """get_biz_start_of_month of a datetime.date, not recorded by the instrumentation."""  # noqa: E501
+    calendar = as_business_calendar(is_holiday)
+    if calendar is not None:
+        return calendar.biz_start_of_month(date)
     date = date.replace(day=1)  # start of month
     date = date - datetime.timedelta(days=1)  # end of previous month
     return get_next_bizday(date, is_holiday)
 
 
+class MonthPosition(Flag):
+    """Position of a date in its month with respect to business days.
+
+    A business day which is both the first and the last business day of the
+    month (i.e. the only one) is `FIRST | LAST`.
+    """
+
+    HOLIDAY = auto()
+    INTERIOR = auto()
+    FIRST = auto()
+    LAST = auto()
+
+
+def _month_position(
+    date: datetime.date,
+    is_holiday: IsHolidayFuncType,
+    *,
+    first: bool = True,
+    last: bool = True,
+    stop_at_last: bool = False,
+) -> MonthPosition:
+    """Classify a date, checking FIRST and LAST only if requested.
+
+    is_holiday(date) is evaluated once, and the scan for the next (previous)
+    business day is done only if last (first) is True.
+    If stop_at_last is True, FIRST is not checked for a LAST date.
+    """
+    calendar = as_business_calendar(is_holiday)
+    if calendar is not None:
+        if calendar(date):
+            return MonthPosition.HOLIDAY
+        is_last = last and calendar.is_biz_end_of_month(date)
+        is_first = (
+            first
+            and not (stop_at_last and is_last)
+            and calendar.is_biz_start_of_month(date)
+        )
+    else:
+        if is_holiday(date):
+            return MonthPosition.HOLIDAY
+        is_last = last and get_next_bizday(date, is_holiday).month != date.month  # noqa: E501
+        is_first = (
+            first
+            and not (stop_at_last and is_last)
+            and get_prev_bizday(date, is_holiday).month != date.month
+        )
+    position = MonthPosition(0)
+    if is_first:
+        position |= MonthPosition.FIRST
+    if is_last:
+        position |= MonthPosition.LAST
+    return position or MonthPosition.INTERIOR
+
+
+def get_month_position(
+    date: datetime.date | datetime.datetime,
+    is_holiday: IsHolidayFuncType = global_default_holiday_discriminator,
+    *,
+    datetime_handler: Callable[
+        [datetime.datetime],
+        datetime.date,
+    ] = datetime.datetime.date,
+) -> MonthPosition:
+    """Classify the given date as a holiday, the first or last business day of the month, or an interior business day.
+
+    Args:
+        date (datetime.date | datetime.datetime): Date to classify.
+        is_holiday (IsHolidayFuncType, optional): Function to check if a date is a holiday.
+            Defaults to global_default_holiday_discriminator.
+        datetime_handler (Callable[[datetime.datetime], datetime.date], optional): Function to convert
+            datetime.datetime to datetime.date. Defaults to datetime.datetime.date.
+
+    Returns:
+        MonthPosition: HOLIDAY, INTERIOR, or a combination of FIRST and LAST.
+
+    Notes:
+        - `MonthPosition.FIRST in position` is the same as is_biz_start_of_month(date),
+          and `MonthPosition.LAST in position` is the same as is_biz_end_of_month(date),
+          but is_holiday(date) is evaluated only once.
+    """  # noqa: E501
+    if _instrumentation.enabled:
+        _instrumentation.record_api_call("get_month_position")
+    if isinstance(date, datetime.datetime):
+        date = datetime_handler(date)
+    return _month_position(date, is_holiday)
+
+
 def add_years_months(
     date: datetime.date | datetime.datetime,
     years: int,
@@ -155,13 +277,46 @@ def add_years_months(
     Returns:
         datetime.date: Date after adding years and months with business day adjustment.
     """  # noqa: E501
+    if _instrumentation.enabled:
+        _instrumentation.record_api_call("add_years_months")
     if isinstance(date, datetime.datetime):
         date = datetime_handler(date)
-    added = date + relativedelta(years=years, months=months)
-    if bizeom2bizeom and is_biz_end_of_month(date, is_holiday):
-        return get_biz_end_of_month(added, is_holiday)
-    elif bizsom2bizsom and is_biz_start_of_month(date, is_holiday):
-        return get_biz_start_of_month(added, is_holiday)
+    return _add_years_months(
+        date,
+        years,
+        months,
+        is_holiday,
+        bizeom2bizeom=bizeom2bizeom,
+        bizsom2bizsom=bizsom2bizsom,
+    )
+
+
+def _add_years_months(
+    date: datetime.date,
+    years: int,
+    months: int,
+    is_holiday: IsHolidayFuncType,
+    *,
+    bizeom2bizeom: bool,
+    bizsom2bizsom: bool,
+) -> datetime.date:
+    """add_years_months of a datetime.date, not recorded by the instrumentation."""  # noqa: E501
+    added = add_calendar_months(date, years, months)
+    if not (bizeom2bizeom or bizsom2bizsom):
+        return added
+    # classify the date in one pass instead of is_biz_end_of_month and
+    # is_biz_start_of_month, which evaluate is_holiday(date) each
+    position = _month_position(
+        date,
+        is_holiday,
+        first=bizsom2bizsom,
+        last=bizeom2bizeom,
+        stop_at_last=True,
+    )
+    if MonthPosition.LAST in position:
+        return _get_biz_end_of_month(added, is_holiday)
+    elif MonthPosition.FIRST in position:
+        return _get_biz_start_of_month(added, is_holiday)
     else:
         return added
 
@@ -196,14 +351,17 @@ def add_years(
     Returns:
         datetime.date: Date after adding years with business day adjustment.
     """  # noqa: E501
-    return add_years_months(
+    if _instrumentation.enabled:
+        _instrumentation.record_api_call("add_years")
+    if isinstance(date, datetime.datetime):
+        date = datetime_handler(date)
+    return _add_years_months(
         date,
         years,
         0,
         is_holiday,
         bizeom2bizeom=bizeom2bizeom,
         bizsom2bizsom=bizsom2bizsom,
-        datetime_handler=datetime_handler,
     )
 
 
@@ -237,12 +395,15 @@ def add_months(
     Returns:
         datetime.date: Date after adding months with business day adjustment.
     """  # noqa: E501
-    return add_years_months(
+    if _instrumentation.enabled:
+        _instrumentation.record_api_call("add_months")
+    if isinstance(date, datetime.datetime):
+        date = datetime_handler(date)
+    return _add_years_months(
         date,
         0,
         months,
         is_holiday,
         bizeom2bizeom=bizeom2bizeom,
         bizsom2bizsom=bizsom2bizsom,
-        datetime_handler=datetime_handler,
     )
@@ -0,0 +1,275 @@
+"""Trusted-input variants of the functions of pybizday_utils.basic.
+
+The functions in this module take the same arguments as those of
+pybizday_utils.basic, except datetime_handler, and return the same results,
+but skip validate_date_type, the conversion of datetime.datetime to
+datetime.date, and the instrumentation. They are meant for tight loops over
+dates which are already known to be datetime.date objects.
+The functions of pybizday_utils.basic validate and convert their arguments
+and then call the functions of this module.
+
+Examples:
+    >>> from pybizday_utils import unchecked
+    >>> dates = [date(2025, 1, 1) + timedelta(days=i) for i in range(365)]
+    >>> bizdays = [d for d in dates if unchecked.is_bizday(d, is_holiday)]
+
+Notes:
+    - The inputs are trusted: passing anything but datetime.date, including
+      datetime.datetime, is not detected and the result is undefined.
+    - The calls are not recorded by pybizday_utils.instrumentation.
+"""
+
+import datetime
+from itertools import filterfalse
+from typing import Generator
+
+from ._result_cache import n_next_bizday
+from .date_range_utils import date_range
+from .default_holiday_utils import global_default_holiday_discriminator
+from .holiday_utils import IsHolidayFuncType
+from .weekmask import as_business_calendar
+
+
+def _not_found(n: int) -> ValueError:
+    """Error for the n-th next business day which is not found."""
+    if n > 0:
+        return ValueError(f"No {n}-th next business day found")
+    return ValueError(f"No {-n}-th previous business day found")
+
+
+def is_bizday(
+    date: datetime.date,
+    is_holiday: IsHolidayFuncType = global_default_holiday_discriminator,
+) -> bool:
+    """Check if the given date is a business day.
+
+    See pybizday_utils.basic.is_bizday.
+
+    Args:
+        date (datetime.date): date to check.
+        is_holiday (IsHolidayFuncType, optional): function to check if a date is
+            a holiday. Defaults to global_default_holiday_discriminator.
+
+    Returns:
+        bool: True if the date is a business day, False otherwise.
+    """
+    return not is_holiday(date)
+
+
+def get_next_bizday(
+    date: datetime.date,
+    is_holiday: IsHolidayFuncType = global_default_holiday_discriminator,
+) -> datetime.date:
+    """Get the next business day after the given date.
+
+    See pybizday_utils.basic.get_next_bizday.
+
+    Args:
+        date (datetime.date): Reference date.
+        is_holiday (IsHolidayFuncType, optional): function to check if a date is
+            a holiday. Defaults to global_default_holiday_discriminator.
+
+    Raises:
+        ValueError: If no next business day is found.
+
+    Returns:
+        datetime.date: Next business day after the given date.
+    """
+    calendar = as_business_calendar(is_holiday)
+    if calendar is not None:
+        return calendar.next(date)
+    result = n_next_bizday(date, 1, is_holiday)
+    if result is None:
+        raise ValueError("No next business day found")
+    return result
+
+
+def get_prev_bizday(
+    date: datetime.date,
+    is_holiday: IsHolidayFuncType = global_default_holiday_discriminator,
+) -> datetime.date:
+    """Get the previous business day before the given date.
+
+    See pybizday_utils.basic.get_prev_bizday.
+
+    Args:
+        date (datetime.date): Reference date.
+        is_holiday (IsHolidayFuncType, optional): function to check if a date is
+            a holiday. Defaults to global_default_holiday_discriminator.
+
+    Raises:
+        ValueError: If no previous business day is found.
+
+    Returns:
+        datetime.date: Previous business day before the given date.
+    """
+    calendar = as_business_calendar(is_holiday)
+    if calendar is not None:
+        return calendar.prev(date)
+    result = n_next_bizday(date, -1, is_holiday)
+    if result is None:
+        raise ValueError("No previous business day found")
+    return result
+
+
+def get_n_next_bizday(
+    date: datetime.date,
+    n: int,
+    is_holiday: IsHolidayFuncType = global_default_holiday_discriminator,
+) -> datetime.date:
+    """Get the n-th next business day after the given date.
+
+    See pybizday_utils.basic.get_n_next_bizday.
+
+    Args:
+        date (datetime.date): Reference date.
+        n (int): Number of business days to skip.
+            If n is negative, the (-n)-th previous business day is returned.
+        is_holiday (IsHolidayFuncType, optional): function to check if a date is
+            a holiday. Defaults to global_default_holiday_discriminator.
+
+    Raises:
+        ValueError: If n=0 and the date is a holiday.
+        ValueError: If no n-th next business day is found.
+
+    Returns:
+        datetime.date: n-th next business day after the given date.
+    """
+    calendar = as_business_calendar(is_holiday)
+    if calendar is not None:
+        return calendar.n_next(date, n)
+    result = n_next_bizday(date, n, is_holiday)
+    if result is None:
+        raise _not_found(n)
+    return result
+
+
+def get_n_prev_bizday(
+    date: datetime.date,
+    n: int,
+    is_holiday: IsHolidayFuncType = global_default_holiday_discriminator,
+) -> datetime.date:
+    """Get the n-th previous business day before the given date.
+
+    See pybizday_utils.basic.get_n_prev_bizday.
+
+    Args:
+        date (datetime.date): Reference date.
+        n (int): Number of business days to skip.
+            If n is negative, the (-n)-th next business day is returned.
+        is_holiday (IsHolidayFuncType, optional): function to check if a date is
+            a holiday. Defaults to global_default_holiday_discriminator.
+
+    Raises:
+        ValueError: If n=0 and the date is a holiday.
+        ValueError: If no n-th previous business day is found.
+
+    Returns:
+        datetime.date: n-th previous business day before the given date.
+    """
+    calendar = as_business_calendar(is_holiday)
+    if calendar is not None:
+        return calendar.n_prev(date, n)
+    result = n_next_bizday(date, -n, is_holiday)
+    if result is None:
+        raise _not_found(-n)
+    return result
+
+
+def bizday_range(
+    start: datetime.date,
+    end: datetime.date,
+    is_holiday: IsHolidayFuncType = global_default_holiday_discriminator,
+    *,
+    include_start: bool = True,
+    include_end: bool = True,
+) -> Generator[datetime.date, None, None]:
+    """Generate a range of business days between two dates.
+
+    See pybizday_utils.basic.bizday_range.
+
+    Args:
+        start (datetime.date): Start date.
+        end (datetime.date): End date.
+        is_holiday (IsHolidayFuncType, optional): function to check if a date is
+            a holiday. Defaults to global_default_holiday_discriminator.
+        include_start (bool, optional): Include the start date in the range.
+            Defaults to True.
+        include_end (bool, optional): Include the end date in the range.
+            Defaults to True.
+
+    Yields:
+        Generator[datetime.date, None, None]: Business days between start and end
+            dates.
+    """
+    calendar = as_business_calendar(is_holiday)
+    if calendar is not None:
+        yield from calendar.bizday_range(
+            start,
+            end,
+            include_start=include_start,
+            include_end=include_end,
+        )
+        return
+    yield from filterfalse(
+        is_holiday,
+        date_range(
+            start,
+            end,
+            include_start=include_start,
+            include_end=include_end,
+            step_days=1 if start <= end else -1,
+        ),
+    )
+
+
+def count_bizdays(
+    start: datetime.date,
+    end: datetime.date,
+    is_holiday: IsHolidayFuncType = global_default_holiday_discriminator,
+    *,
+    include_start: bool = True,
+    include_end: bool = True,
+) -> int:
+    """Count the number of business days between two dates.
+
+    See pybizday_utils.basic.count_bizdays.
+
+    Args:
+        start (datetime.date): Start date.
+        end (datetime.date): End date.
+        is_holiday (IsHolidayFuncType, optional): function to check if a date is
+            a holiday. Defaults to global_default_holiday_discriminator.
+        include_start (bool, optional): Include the start date in the count.
+            Defaults to True.
+        include_end (bool, optional): Include the end date in the count.
+            Defaults to True.
+
+    Returns:
+        int: Number of business days between start and end dates.
+            Negative if start > end.
+    """
+    calendar = as_business_calendar(is_holiday)
+    if calendar is not None:
+        return calendar.count_bizdays(
+            start,
+            end,
+            include_start=include_start,
+            include_end=include_end,
+        )
+    if start > end:
+        return -count_bizdays(
+            end,
+            start,
+            is_holiday,
+            include_end=include_start,
+            include_start=include_end,
+        )
+    bdrange = bizday_range(
+        start,
+        end,
+        is_holiday,
+        include_start=include_start,
+        include_end=include_end,
+    )
+    return sum(1 for _ in bdrange)
@@ -20,3 +20,36 @@ def validate_date_type(date: Any) -> TypeGuard[datetime.date | datetime.datetime
             f"not {type(date)}"
         )
     return True
+
+
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def add_calendar_months(
+    date: datetime.date,
+    years: int,
+    months: int,
+) -> datetime.date:
+    """Add years and months to a date without business day adjustment.
+
+    The same as `date + dateutil.relativedelta.relativedelta(years=years, months=months)`:
+    the day is clamped to the last day of the resulting month.
+
+    Args:
+        date (datetime.date): Reference date. A datetime.datetime keeps its time.
+        years (int): Years to add.
+        months (int): Months to add.
+
+    Returns:
+        datetime.date: Date after adding years and months.
+
+    Raises:
+        ValueError: If the resulting year is out of the range of datetime.date.
+    """  # noqa: E501
+    year, month = divmod(date.year * 12 + date.month - 1 + years * 12 + months, 12)  # noqa: E501
+    month += 1
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        last_day = 29
+    else:
+        last_day = _DAYS_IN_MONTH[month - 1]
+    return date.replace(year=year, month=month, day=min(date.day, last_day))
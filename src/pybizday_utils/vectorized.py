@@ -0,0 +1,596 @@
+"""Vectorized business day utilities over NumPy arrays.
+
+This module requires NumPy, which is an optional dependency of pybizday_utils:
+`pip install pybizday_utils[numpy]`.
+
+Dates are given as `numpy.datetime64` arrays (any unit, truncated to days),
+arrays of integer ordinals (see datetime.date.toordinal),
+or anything numpy can convert to `datetime64[D]` such as a list of datetime.date.
+NaT is not supported.
+"""
+
+import datetime
+import weakref
+from typing import Any, Literal
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as e:
+    raise ImportError(
+        "pybizday_utils.vectorized requires numpy. "
+        "Install it with `pip install pybizday_utils[numpy]`."
+    ) from e
+
+from . import basic, month
+from .business_calendar import _MAX_ORDINAL, BusinessCalendar
+from .default_holiday_utils import global_default_holiday_discriminator
+from .holiday_utils import CompiledIsHoliday, IsHolidayFuncType
+from .weekmask import WeekmaskCalendar, get_weekmask_calendar
+
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+# range of the numbers of months since 1970-01 supported by datetime.date
+_MIN_MONTH = (datetime.MINYEAR - 1970) * 12
+_MAX_MONTH = (datetime.MAXYEAR - 1970) * 12 + 11
+
+# holiday tables of compiled calendars: (ordinal of the first day, table)
+_holiday_tables: "weakref.WeakKeyDictionary[Any, tuple[int, npt.NDArray[np.bool_]]]" = (  # noqa: E501
+    weakref.WeakKeyDictionary()
+)
+# prefix counts of business days of compiled calendars: (ordinal of the first day, counts)  # noqa: E501
+_bizday_counts: "weakref.WeakKeyDictionary[Any, tuple[int, npt.NDArray[np.int64]]]" = (  # noqa: E501
+    weakref.WeakKeyDictionary()
+)
+
+
+def _to_ordinals(dates: npt.ArrayLike) -> npt.NDArray[np.int64]:
+    """Convert dates to an array of ordinals."""
+    arr = np.asarray(dates)
+    if np.issubdtype(arr.dtype, np.integer):
+        return arr.astype(np.int64)
+    return arr.astype("datetime64[D]").astype(np.int64) + _EPOCH_ORDINAL
+
+
+def _from_ordinals(ordinals: npt.NDArray[np.int64]) -> npt.NDArray[np.datetime64]:  # noqa: E501
+    """Convert an array of ordinals to datetime64[D]."""
+    return (ordinals - _EPOCH_ORDINAL).astype("datetime64[D]")
+
+
+def _to_months(ordinals: npt.NDArray[np.int64]) -> npt.NDArray[np.int64]:
+    """Convert ordinals to the numbers of months since 1970-01."""
+    return _from_ordinals(ordinals).astype("datetime64[M]").astype(np.int64)
+
+
+def _month_start_ordinals(months: npt.NDArray[np.int64]) -> npt.NDArray[np.int64]:  # noqa: E501
+    """Ordinals of the first days of the months since 1970-01."""
+    days = months.astype("datetime64[M]").astype("datetime64[D]")
+    return days.astype(np.int64) + _EPOCH_ORDINAL
+
+
+def _is_current(
+    is_holiday: CompiledIsHoliday | BusinessCalendar,
+    start_ordinal: int,
+    n_days: int,
+) -> bool:
+    """Whether a cached table still covers the range of the compiled calendar."""  # noqa: E501
+    return (
+        start_ordinal == is_holiday._start_ordinal
+        and start_ordinal + n_days - 1 == is_holiday._end_ordinal
+    )
+
+
+def _get_holiday_table(
+    is_holiday: IsHolidayFuncType,
+) -> tuple[int, npt.NDArray[np.bool_]] | None:
+    """Holiday table of a compiled calendar, i.e. is_holiday of each day in its range."""  # noqa: E501
+    if not isinstance(is_holiday, (CompiledIsHoliday, BusinessCalendar)):
+        return None
+    try:
+        cached = _holiday_tables[is_holiday]
+    except KeyError:
+        pass
+    else:
+        # the range of a CompiledIsHoliday may have been extended since
+        if _is_current(is_holiday, cached[0], len(cached[1])):
+            return cached
+    if isinstance(is_holiday, CompiledIsHoliday):
+        n_days = is_holiday._end_ordinal - is_holiday._start_ordinal + 1
+        bits = np.unpackbits(
+            np.frombuffer(is_holiday._bitmap, dtype=np.uint8),
+            bitorder="little",
+        )
+        table = bits[:n_days].astype(bool)
+    else:
+        counts = np.frombuffer(is_holiday._counts, dtype=np.intc)
+        table = np.diff(counts) == 0
+    _holiday_tables[is_holiday] = (is_holiday._start_ordinal, table)
+    return _holiday_tables[is_holiday]
+
+
+def _evaluate(
+    ordinals: npt.NDArray[np.int64],
+    is_holiday: IsHolidayFuncType,
+) -> npt.NDArray[np.bool_]:
+    """Evaluate is_holiday once for each unique ordinal."""
+    unique, inverse = np.unique(ordinals, return_inverse=True)
+    fromordinal = datetime.date.fromordinal
+    results = np.fromiter(
+        (bool(is_holiday(fromordinal(int(o)))) for o in unique),
+        dtype=bool,
+        count=len(unique),
+    )
+    return results[inverse.reshape(ordinals.shape)]
+
+
+def _is_holiday_array(
+    ordinals: npt.NDArray[np.int64],
+    is_holiday: IsHolidayFuncType,
+) -> npt.NDArray[np.bool_]:
+    """Vectorized is_holiday over an array of ordinals."""
+    weekmask_calendar = (
+        is_holiday
+        if isinstance(is_holiday, WeekmaskCalendar)
+        else get_weekmask_calendar(is_holiday)
+    )
+    if weekmask_calendar is not None:
+        weekend = np.zeros(7, dtype=bool)
+        weekend[list(weekmask_calendar.weekend)] = True
+        result = weekend[(ordinals - 1) % 7]
+        if weekmask_calendar.holidays:
+            result |= np.isin(
+                ordinals,
+                [d.toordinal() for d in weekmask_calendar.holidays],
+            )
+        return result
+
+    table = _get_holiday_table(is_holiday)
+    if table is None:
+        return _evaluate(ordinals, is_holiday)
+    start_ordinal, holiday_table = table
+    offsets = ordinals - start_ordinal
+    inside = (offsets >= 0) & (offsets < len(holiday_table))
+    result = np.empty(ordinals.shape, dtype=bool)
+    # a single fancy-index operation inside the compiled range
+    result[inside] = holiday_table[offsets[inside]]
+    if not inside.all():
+        result[~inside] = _evaluate(ordinals[~inside], is_holiday)
+    return result
+
+
+def _count_before_weekmask(
+    ordinals: npt.NDArray[np.int64],
+    calendar: WeekmaskCalendar,
+) -> npt.NDArray[np.int64]:
+    """Vectorized WeekmaskCalendar._count_before."""
+    weeks, rest = np.divmod(ordinals - 1, 7)
+    indices = (
+        weeks * len(calendar._weekdays)
+        + np.asarray(calendar._weekday_counts, dtype=np.int64)[rest]
+    )
+    return indices - np.searchsorted(
+        np.asarray(calendar._holiday_indices, dtype=np.int64),
+        indices,
+        side="left",
+    )
+
+
+def _get_bizday_counts(
+    is_holiday: IsHolidayFuncType,
+) -> tuple[int, npt.NDArray[np.int64]] | None:
+    """Prefix counts of business days of a compiled calendar.
+
+    counts[i] is the number of business days in [start, start + i)
+    where start is the ordinal of the first day of the compiled range.
+    """
+    if not isinstance(is_holiday, (CompiledIsHoliday, BusinessCalendar)):
+        return None
+    try:
+        cached = _bizday_counts[is_holiday]
+    except KeyError:
+        pass
+    else:
+        if _is_current(is_holiday, cached[0], len(cached[1]) - 1):
+            return cached
+    if isinstance(is_holiday, BusinessCalendar):
+        counts = np.frombuffer(is_holiday._counts, dtype=np.intc).astype(np.int64)  # noqa: E501
+    else:
+        table = _get_holiday_table(is_holiday)
+        assert table is not None
+        counts = np.concatenate(([0], np.cumsum(~table[1], dtype=np.int64)))
+    _bizday_counts[is_holiday] = (is_holiday._start_ordinal, counts)
+    return _bizday_counts[is_holiday]
+
+
+def _count_before(
+    ordinals: npt.NDArray[np.int64],
+    is_holiday: IsHolidayFuncType,
+) -> npt.NDArray[np.int64]:
+    """Number of business days before each ordinal, up to a common offset.
+
+    Only differences between the results are meaningful.
+    """
+    weekmask_calendar = (
+        is_holiday
+        if isinstance(is_holiday, WeekmaskCalendar)
+        else get_weekmask_calendar(is_holiday)
+    )
+    if weekmask_calendar is not None:
+        return _count_before_weekmask(ordinals, weekmask_calendar)
+    if ordinals.size == 0:
+        return np.zeros(ordinals.shape, dtype=np.int64)
+    lo, hi = int(ordinals.min()), int(ordinals.max())
+    compiled = _get_bizday_counts(is_holiday)
+    if compiled is not None:
+        start_ordinal, counts = compiled
+        if start_ordinal <= lo and hi < start_ordinal + len(counts):
+            return counts[ordinals - start_ordinal]
+    # prefix counts over the days spanned by the ordinals
+    holidays = _is_holiday_array(np.arange(lo, hi, dtype=np.int64), is_holiday)  # noqa: E501
+    counts = np.concatenate(([0], np.cumsum(~holidays, dtype=np.int64)))
+    return counts[ordinals - lo]
+
+
+def is_bizday(
+    dates: npt.ArrayLike,
+    is_holiday: IsHolidayFuncType = global_default_holiday_discriminator,
+) -> npt.NDArray[np.bool_]:
+    """Check if each of the given dates is a business day.
+
+    Args:
+        dates (npt.ArrayLike): datetime64 array, array of ordinals,
+            or anything convertible to datetime64[D].
+        is_holiday (IsHolidayFuncType, optional): function to check if a date is
+            a holiday. Defaults to global_default_holiday_discriminator.
+
+    Returns:
+        npt.NDArray[np.bool_]: True where the date is a business day.
+
+    Notes:
+        - If is_holiday is a compiled calendar (CompiledIsHoliday or
+          BusinessCalendar), dates in its range are looked up in its table at
+          once, and is_holiday is called only for dates out of the range.
+        - If is_holiday only depends on the day of the week
+          (see pybizday_utils.weekmask), it is evaluated in closed form.
+        - Otherwise, is_holiday is called once for each unique date.
+    """
+    return ~_is_holiday_array(_to_ordinals(dates), is_holiday)
+
+
+def count_bizdays(
+    starts: npt.ArrayLike,
+    ends: npt.ArrayLike,
+    is_holiday: IsHolidayFuncType = global_default_holiday_discriminator,
+    *,
+    include_start: bool = True,
+    include_end: bool = True,
+) -> npt.NDArray[np.int64]:
+    """Count the number of business days between each pair of dates.
+
+    Args:
+        starts (npt.ArrayLike): start dates.
+        ends (npt.ArrayLike): end dates. The same shape as starts,
+            or broadcastable to it.
+        is_holiday (IsHolidayFuncType, optional): function to check if a date is
+            a holiday. Defaults to global_default_holiday_discriminator.
+        include_start (bool, optional): Include the start date in the count.
+            Defaults to True.
+        include_end (bool, optional): Include the end date in the count.
+            Defaults to True.
+
+    Raises:
+        ValueError: If starts and ends cannot be broadcast together.
+
+    Returns:
+        npt.NDArray[np.int64]: Number of business days between each pair.
+
+    Notes:
+        - the same as pybizday_utils.basic.count_bizdays for each pair,
+          e.g. the count is negative if start > end.
+        - counts are differences of prefix counts of business days,
+          gathered at once.
+        - unless is_holiday is compiled over the dates (or only depends on
+          the day of the week), is_holiday is evaluated once for each day
+          from the earliest to the latest of the dates.
+    """
+    start_ordinals, end_ordinals = np.broadcast_arrays(
+        _to_ordinals(starts),
+        _to_ordinals(ends),
+    )
+    descending = start_ordinals > end_ordinals
+    lo = np.where(descending, end_ordinals, start_ordinals)
+    hi = np.where(descending, start_ordinals, end_ordinals)
+    # include_start and include_end are swapped if start > end
+    if not include_start:
+        lo = lo + ~descending
+        hi = hi - descending
+    if not include_end:
+        lo = lo + descending
+        hi = hi - ~descending
+    prefix = _count_before(np.stack((lo, hi + 1)), is_holiday)
+    counts: npt.NDArray[np.int64] = np.maximum(prefix[1] - prefix[0], 0)
+    counts[descending] *= -1
+    return counts
+
+
+def offset_bizdays(
+    dates: npt.ArrayLike,
+    n: npt.ArrayLike,
+    is_holiday: IsHolidayFuncType = global_default_holiday_discriminator,
+    *,
+    errors: Literal["raise", "coerce"] = "raise",
+) -> npt.NDArray[np.datetime64]:
+    """Get the n-th next business day after each of the given dates.
+
+    Args:
+        dates (npt.ArrayLike): reference dates.
+        n (npt.ArrayLike): number of business days to skip for each date,
+            an integer or an integer array broadcastable to dates.
+            0 means the same date.
+            n > 0 means the n-th next business day.
+            n < 0 means the (-n)-th previous business day.
+        is_holiday (IsHolidayFuncType, optional): function to check if a date is
+            a holiday. Defaults to global_default_holiday_discriminator.
+        errors (Literal["raise", "coerce"], optional): how to handle dates
+            without a result, i.e. n=0 on a holiday or no n-th business day.
+            "raise" raises ValueError and "coerce" sets NaT.
+            Defaults to "raise".
+
+    Raises:
+        TypeError: If n is not an integer or an integer array.
+        ValueError: If errors is "raise" and n=0 but a date is a holiday.
+        ValueError: If errors is "raise" and no n-th business day is found.
+        ValueError: If errors is neither "raise" nor "coerce".
+
+    Returns:
+        npt.NDArray[np.datetime64]: datetime64[D] array of the n-th next business days.
+
+    Notes:
+        - the same as pybizday_utils.basic.get_n_next_bizday for each date.
+        - the results are looked up in a sorted array of business days
+          around the dates, so the whole batch is a few NumPy operations.
+          is_holiday is evaluated for each day in the span of the dates
+          widened by about twice the largest |n|, unless it is compiled
+          or only depends on the day of the week.
+        - dates whose results are not in the span fall back to
+          pybizday_utils.basic.get_n_next_bizday.
+    """  # noqa: E501
+    if errors not in ("raise", "coerce"):
+        raise ValueError(f"errors must be 'raise' or 'coerce': errors = {errors}")  # noqa: E501
+    n_ = np.asarray(n)
+    if not np.issubdtype(n_.dtype, np.integer):
+        raise TypeError(f"n must be an integer or an integer array: dtype = {n_.dtype}")  # noqa: E501
+    ordinals, offsets = np.broadcast_arrays(_to_ordinals(dates), n_.astype(np.int64))  # noqa: E501
+    result = np.zeros(ordinals.shape, dtype=np.int64)
+    if ordinals.size == 0:
+        return _from_ordinals(result)
+
+    # business days in the span of the dates, widened in both directions
+    margin = 2 * int(np.abs(offsets).max()) + 14
+    lo = max(1, int(ordinals.min()) - margin)
+    hi = min(_MAX_ORDINAL, int(ordinals.max()) + margin)
+    days = np.arange(lo, hi + 1, dtype=np.int64)
+    holidays = _is_holiday_array(days, is_holiday)
+    bizdays = days[~holidays]
+
+    # index of the result among the business days
+    indices = np.where(
+        offsets > 0,
+        np.searchsorted(bizdays, ordinals, side="right") + offsets - 1,
+        np.searchsorted(bizdays, ordinals, side="left") + offsets,
+    )
+    on_holiday = (offsets == 0) & holidays[ordinals - lo]
+    found = ~on_holiday & (indices >= 0) & (indices < len(bizdays))
+    result[found] = bizdays[indices[found]]
+
+    invalid = on_holiday
+    fallback = ~found & ~on_holiday
+    if on_holiday.any() and errors == "raise":
+        date = datetime.date.fromordinal(int(ordinals[on_holiday][0]))
+        raise ValueError(f"n=0 but date={date} is holiday")
+    for index in map(tuple, np.argwhere(fallback)):
+        try:
+            result[index] = basic.get_n_next_bizday(
+                datetime.date.fromordinal(int(ordinals[index])),
+                int(offsets[index]),
+                is_holiday,
+            ).toordinal()
+        except ValueError:
+            if errors == "raise":
+                raise
+            invalid[index] = True
+
+    bizday_dates = _from_ordinals(result)
+    bizday_dates[invalid] = np.datetime64("NaT")
+    return bizday_dates
+
+
+def add_years_months(
+    dates: npt.ArrayLike,
+    years: npt.ArrayLike,
+    months: npt.ArrayLike,
+    is_holiday: IsHolidayFuncType = global_default_holiday_discriminator,
+    *,
+    bizeom2bizeom: bool = True,
+    bizsom2bizsom: bool = False,
+) -> npt.NDArray[np.datetime64]:
+    """Add years and months to each of the given dates with business day adjustment.
+
+    Args:
+        dates (npt.ArrayLike): reference dates.
+        years (npt.ArrayLike): years to add, an integer or an integer array broadcastable to dates.
+        months (npt.ArrayLike): months to add, an integer or an integer array broadcastable to dates.
+        is_holiday (IsHolidayFuncType, optional): function to check if a date is a holiday.
+            Defaults to global_default_holiday_discriminator.
+        bizeom2bizeom (bool, optional): Whether to adjust to the last business day of the month
+            if the date is the last business day of the month. Defaults to True.
+        bizsom2bizsom (bool, optional): Whether to adjust to the first business day of the month
+            if the date is the first business day of the month. Defaults to False.
+
+    Raises:
+        TypeError: If years or months is not an integer or an integer array.
+
+    Returns:
+        npt.NDArray[np.datetime64]: datetime64[D] array of the dates after adding years and months.
+
+    Notes:
+        - the same as pybizday_utils.month.add_years_months for each date.
+        - the first and last business days of the months are looked up in
+          per-month tables built from a sorted array of business days
+          over the span of the dates and the results.
+          is_holiday is evaluated for each day in the span, unless it is
+          compiled or only depends on the day of the week.
+        - dates whose adjustment is not found in the span fall back to
+          pybizday_utils.month.add_years_months,
+          which raises the same error as for a single date.
+    """  # noqa: E501
+    years_, months_ = np.asarray(years), np.asarray(months)
+    for name, value in (("years", years_), ("months", months_)):
+        if not np.issubdtype(value.dtype, np.integer):
+            raise TypeError(f"{name} must be an integer or an integer array: dtype = {value.dtype}")  # noqa: E501
+    ordinals, years_, months_ = np.broadcast_arrays(
+        _to_ordinals(dates),
+        years_.astype(np.int64),
+        months_.astype(np.int64),
+    )
+    result = np.zeros(ordinals.shape, dtype=np.int64)
+    if ordinals.size == 0:
+        return _from_ordinals(result)
+
+    # add_calendar_months(date, years, months)
+    date_months = _to_months(ordinals)
+    days = ordinals - _month_start_ordinals(date_months)
+    target_months = date_months + 12 * years_ + months_
+    # months out of the range of datetime.date are left to month.add_years_months  # noqa: E501
+    fallback = (
+        (target_months < _MIN_MONTH) | (target_months > _MAX_MONTH)
+    )
+    target_months[fallback] = date_months[fallback]
+    target_starts = _month_start_ordinals(target_months)
+    target_ends = _month_start_ordinals(target_months + 1) - 1
+    result[:] = np.minimum(target_starts + days, target_ends)
+
+    if bizeom2bizeom or bizsom2bizsom:
+        # business days around the dates and the target months
+        margin = 31
+        lo = max(1, int(min(ordinals.min(), target_starts.min())) - margin)
+        hi = min(_MAX_ORDINAL, int(max(ordinals.max(), target_ends.max())) + margin)  # noqa: E501
+        span = np.arange(lo, hi + 1, dtype=np.int64)
+        holidays = _is_holiday_array(span, is_holiday)
+        bizdays = span[~holidays]
+        n_bizdays = len(bizdays)
+        on_bizday = ~holidays[ordinals - lo]
+
+        # first and last business days of the months
+        month_lo = int(target_months.min())
+        month_starts = _month_start_ordinals(
+            np.arange(month_lo, int(target_months.max()) + 2, dtype=np.int64),
+        )
+        first_indices = np.searchsorted(bizdays, month_starts[:-1], side="left")  # noqa: E501
+        last_indices = np.searchsorted(bizdays, month_starts[1:], side="left") - 1  # noqa: E501
+        first_indices = first_indices[target_months - month_lo]
+        last_indices = last_indices[target_months - month_lo]
+
+        adjusted = np.zeros(ordinals.shape, dtype=bool)
+        if bizeom2bizeom:
+            next_indices = np.searchsorted(bizdays, ordinals, side="right")
+            has_next = next_indices < n_bizdays
+            fallback |= on_bizday & ~has_next
+            next_bizdays = bizdays[np.minimum(next_indices, n_bizdays - 1)]
+            is_eom = on_bizday & has_next & (
+                _to_months(next_bizdays) % 12 != date_months % 12
+            )
+            fallback |= is_eom & (last_indices < 0)
+            is_eom &= last_indices >= 0
+            result[is_eom] = bizdays[last_indices[is_eom]]
+            adjusted |= is_eom
+        if bizsom2bizsom:
+            prev_indices = np.searchsorted(bizdays, ordinals, side="left") - 1
+            has_prev = prev_indices >= 0
+            candidates = on_bizday & ~adjusted & ~fallback
+            fallback |= candidates & ~has_prev
+            prev_bizdays = bizdays[np.maximum(prev_indices, 0)]
+            is_som = candidates & has_prev & (
+                _to_months(prev_bizdays) % 12 != date_months % 12
+            )
+            fallback |= is_som & (first_indices >= n_bizdays)
+            is_som &= first_indices < n_bizdays
+            result[is_som] = bizdays[first_indices[is_som]]
+
+    for index in map(tuple, np.argwhere(fallback)):
+        result[index] = month.add_years_months(
+            datetime.date.fromordinal(int(ordinals[index])),
+            int(years_[index]),
+            int(months_[index]),
+            is_holiday,
+            bizeom2bizeom=bizeom2bizeom,
+            bizsom2bizsom=bizsom2bizsom,
+        ).toordinal()
+    return _from_ordinals(result)
+
+
+def add_years(
+    dates: npt.ArrayLike,
+    years: npt.ArrayLike,
+    is_holiday: IsHolidayFuncType = global_default_holiday_discriminator,
+    *,
+    bizeom2bizeom: bool = True,
+    bizsom2bizsom: bool = False,
+) -> npt.NDArray[np.datetime64]:
+    """Add years to each of the given dates with business day adjustment.
+    This function is a wrapper around add_years_months with months set to 0.
+
+    Args:
+        dates (npt.ArrayLike): reference dates.
+        years (npt.ArrayLike): years to add, an integer or an integer array broadcastable to dates.
+        is_holiday (IsHolidayFuncType, optional): function to check if a date is a holiday.
+            Defaults to global_default_holiday_discriminator.
+        bizeom2bizeom (bool, optional): Whether to adjust to the last business day of the month
+            if the date is the last business day of the month. Defaults to True.
+        bizsom2bizsom (bool, optional): Whether to adjust to the first business day of the month
+            if the date is the first business day of the month. Defaults to False.
+
+    Returns:
+        npt.NDArray[np.datetime64]: datetime64[D] array of the dates after adding years.
+    """  # noqa: E501
+    return add_years_months(
+        dates,
+        years,
+        0,
+        is_holiday,
+        bizeom2bizeom=bizeom2bizeom,
+        bizsom2bizsom=bizsom2bizsom,
+    )
+
+
+def add_months(
+    dates: npt.ArrayLike,
+    months: npt.ArrayLike,
+    is_holiday: IsHolidayFuncType = global_default_holiday_discriminator,
+    *,
+    bizeom2bizeom: bool = True,
+    bizsom2bizsom: bool = False,
+) -> npt.NDArray[np.datetime64]:
+    """Add months to each of the given dates with business day adjustment.
+    This function is a wrapper around add_years_months with years set to 0.
+
+    Args:
+        dates (npt.ArrayLike): reference dates.
+        months (npt.ArrayLike): months to add, an integer or an integer array broadcastable to dates.
+        is_holiday (IsHolidayFuncType, optional): function to check if a date is a holiday.
+            Defaults to global_default_holiday_discriminator.
+        bizeom2bizeom (bool, optional): Whether to adjust to the last business day of the month
+            if the date is the last business day of the month. Defaults to True.
+        bizsom2bizsom (bool, optional): Whether to adjust to the first business day of the month
+            if the date is the first business day of the month. Defaults to False.
+
+    Returns:
+        npt.NDArray[np.datetime64]: datetime64[D] array of the dates after adding months.
+    """  # noqa: E501
+    return add_years_months(
+        dates,
+        0,
+        months,
+        is_holiday,
+        bizeom2bizeom=bizeom2bizeom,
+        bizsom2bizsom=bizsom2bizsom,
+    )
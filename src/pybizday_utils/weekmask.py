@@ -0,0 +1,215 @@
+import datetime
+from array import array
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Generator, Iterable
+
+from . import instrumentation as _instrumentation
+from .business_calendar import _MAX_ORDINAL, BaseBusinessCalendar
+from .holiday_utils import (
+    HolidayDiscriminator,
+    IsHolidayFuncType,
+    is_saturday_or_sunday,
+)
+
+# is_holiday functions which only depend on the day of the week,
+# mapped to the weekdays (Monday is 0) on which they return True.
+_WEEKDAY_RULES: dict[IsHolidayFuncType, frozenset[int]] = {
+    is_saturday_or_sunday: frozenset({5, 6}),
+}
+
+
+class WeekmaskCalendar(BaseBusinessCalendar):
+    """Business day calendar of weekly holidays plus a sparse list of holidays.
+
+    Counts and offsets are computed in closed form: the number of business days
+    is the number of whole weeks times the business days per week plus a
+    remainder looked up in a per-weekday table, and the sparse holidays on top
+    are taken into account by bisection.
+    No function is called day by day, and the whole date range is supported.
+
+    Args:
+        weekend (Iterable[int], optional): weekdays which are holidays (Monday is 0 and Sunday is 6).
+            Defaults to (5, 6), i.e. Saturday and Sunday.
+        holidays (Iterable[datetime.date | datetime.datetime], optional): additional holidays.
+            Defaults to ().
+
+    Raises:
+        ValueError: If weekend contains a value other than 0, 1, ..., 6.
+    """  # noqa: E501
+
+    def __init__(
+        self,
+        weekend: Iterable[int] = (5, 6),
+        holidays: Iterable[datetime.date | datetime.datetime] = (),
+    ) -> None:
+        super().__init__()
+        self._weekend = frozenset(weekend)
+        if not self._weekend <= frozenset(range(7)):
+            raise ValueError(
+                f"weekend must consist of 0, 1, ..., 6: weekend = {weekend}"
+            )
+        # _weekdays: weekdays of business days
+        # _weekday_counts[r]: number of business weekdays less than r
+        self._weekdays = tuple(w for w in range(7) if w not in self._weekend)
+        self._weekday_counts = tuple(
+            sum(1 for w in self._weekdays if w < r) for r in range(8)
+        )
+        self._holidays = frozenset(
+            d.date() if isinstance(d, datetime.datetime) else d
+            for d in holidays
+        )
+        # ordinals of the holidays which are not on the weekend,
+        # and their indices among the days which are not on the weekend
+        self._holiday_ordinals = frozenset(
+            o
+            for o in map(datetime.date.toordinal, self._holidays)
+            if (o - 1) % 7 not in self._weekend
+        )
+        self._holiday_indices = array(
+            "q",
+            sorted(map(self._count_weekdays_before, self._holiday_ordinals)),
+        )
+
+    @property
+    def weekend(self) -> frozenset[int]:
+        """Weekdays which are holidays (Monday is 0 and Sunday is 6)."""
+        return self._weekend
+
+    @property
+    def holidays(self) -> frozenset[datetime.date]:
+        """Additional holidays."""
+        return self._holidays
+
+    def _count_weekdays_before(self, ordinal: int) -> int:
+        """Number of days in [1, ordinal) which are not on the weekend."""
+        weeks, rest = divmod(ordinal - 1, 7)
+        return weeks * len(self._weekdays) + self._weekday_counts[rest]
+
+    def _weekday_ordinal(self, index: int) -> int:
+        """Ordinal of the index-th (0-based) day which is not on the weekend."""
+        weeks, rest = divmod(index, len(self._weekdays))
+        return 1 + 7 * weeks + self._weekdays[rest]
+
+    def _count_before(self, ordinal: int) -> int:
+        """Number of business days in [1, ordinal)."""
+        index = self._count_weekdays_before(ordinal)
+        return index - bisect_left(self._holiday_indices, index)
+
+    def _nth_ordinal(self, m: int) -> int | None:
+        """Ordinal of the m-th (0-based) business day, or None."""
+        if not self._weekdays:
+            return None
+        # smallest fixed point of index = m + #(holiday indices <= index)
+        index = m
+        while True:
+            shifted = m + bisect_right(self._holiday_indices, index)
+            if shifted == index:
+                break
+            index = shifted
+        ordinal = self._weekday_ordinal(index)
+        return ordinal if ordinal <= _MAX_ORDINAL else None
+
+    def _is_holiday_ordinal(self, ordinal: int) -> bool:
+        return (
+            (ordinal - 1) % 7 in self._weekend
+            or ordinal in self._holiday_ordinals
+        )
+
+    def _count_ordinals(self, lo: int, hi: int) -> int:
+        if lo > hi:
+            return 0
+        return self._count_before(hi + 1) - self._count_before(lo)
+
+    def _n_next_ordinal(self, ordinal: int, n: int) -> int | None:
+        return self._nth_ordinal(self._count_before(ordinal + 1) + n - 1)
+
+    def _n_prev_ordinal(self, ordinal: int, n: int) -> int | None:
+        m = self._count_before(ordinal) - n
+        return self._nth_ordinal(m) if m >= 0 else None
+
+    def _iter_bizday_ordinals(
+        self,
+        lo: int,
+        hi: int,
+        descending: bool = False,
+    ) -> Generator[int, None, None]:
+        if lo > hi or not self._weekdays:
+            return
+        indices = range(
+            self._count_weekdays_before(lo),
+            self._count_weekdays_before(hi + 1),
+        )
+        if descending:
+            indices = indices[::-1]
+        holiday_indices = set(self._holiday_indices)
+        for index in indices:
+            if index not in holiday_indices:
+                yield self._weekday_ordinal(index)
+
+
+@lru_cache(maxsize=None)
+def _get_weekmask_calendar(weekend: frozenset[int]) -> WeekmaskCalendar:
+    return WeekmaskCalendar(weekend)
+
+
+def get_weekmask_calendar(
+    is_holiday: IsHolidayFuncType,
+) -> WeekmaskCalendar | None:
+    """Get the WeekmaskCalendar equivalent to the given is_holiday function.
+
+    is_holiday is recognized when it is a function which only depends on
+    the day of the week (e.g. is_saturday_or_sunday),
+    or a HolidayDiscriminator whose functions are all such functions.
+
+    Args:
+        is_holiday (IsHolidayFuncType): function to check if a date is a holiday.
+
+    Returns:
+        WeekmaskCalendar | None: equivalent calendar, or None if is_holiday is not recognized.
+
+    Notes:
+        - a HolidayDiscriminator is inspected on every call
+          because its functions can be changed at any time.
+    """  # noqa: E501
+    if (
+        isinstance(is_holiday, HolidayDiscriminator)
+        and type(is_holiday).__call__ is HolidayDiscriminator.__call__
+    ):
+        funcs: Iterable[IsHolidayFuncType] = is_holiday._is_holiday_funcs.values()  # noqa: E501
+    else:
+        funcs = (is_holiday,)
+    weekend: frozenset[int] = frozenset()
+    for func in funcs:
+        try:
+            weekdays = _WEEKDAY_RULES.get(func)
+        except TypeError:  # unhashable callable
+            return None
+        if weekdays is None:
+            return None
+        weekend |= weekdays
+    return _get_weekmask_calendar(weekend)
+
+
+def as_business_calendar(
+    is_holiday: IsHolidayFuncType,
+) -> BaseBusinessCalendar | None:
+    """Get the calendar answering queries about is_holiday with index arithmetic.
+
+    Args:
+        is_holiday (IsHolidayFuncType): function to check if a date is a holiday.
+
+    Returns:
+        BaseBusinessCalendar | None: is_holiday itself if it is a calendar,
+            the equivalent WeekmaskCalendar if any (see get_weekmask_calendar),
+            or None if the queries must call is_holiday day by day.
+
+    Notes:
+        - while the instrumentation is enabled, a HolidayDiscriminator is not
+          answered by a WeekmaskCalendar, so that the calls of its rules are recorded.
+    """  # noqa: E501
+    if isinstance(is_holiday, BaseBusinessCalendar):
+        return is_holiday
+    if _instrumentation.enabled and isinstance(is_holiday, HolidayDiscriminator):  # noqa: E501
+        return None
+    return get_weekmask_calendar(is_holiday)
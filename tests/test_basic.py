@@ -1,16 +1,28 @@
 import datetime
-from typing import Callable
+from typing import Callable, Generator
 
 import pytest
 
 from pybizday_utils.basic import (
     bizday_range,
     count_bizdays,
+    disable_result_cache,
+    enable_result_cache,
     get_n_next_bizday,
     get_n_prev_bizday,
     get_next_bizday,
     get_prev_bizday,
     is_bizday,
+    result_cache_clear,
+    result_cache_info,
+)
+from pybizday_utils.holiday_utils import (
+    CacheInfo,
+    HolidayDiscriminator,
+    IsHolidayFuncType,
+    cached_is_holiday,
+    compile_is_holiday,
+    compile_is_holiday_lazily,
 )
 
 
@@ -1041,3 +1053,185 @@ def test_get_n_prev_bizday_should_raise_ValueError_if_no_prev_bizday_found(
 ) -> None:
     with pytest.raises(ValueError, match=expected_msg):
         get_n_prev_bizday(d, n, is_holiday=lambda _: True)
+
+
+def _raise_lookup_error(d: datetime.date) -> bool:
+    raise ValueError(f"lookup failed for {d}")
+
+
+@pytest.mark.negative
+@pytest.mark.parametrize("enable_cache", [False, True])
+@pytest.mark.parametrize(
+    "func",
+    [
+        get_next_bizday,
+        get_prev_bizday,
+        lambda d, f: get_n_next_bizday(d, 3, f),
+        lambda d, f: get_n_prev_bizday(d, 3, f),
+    ],
+)
+def test_ValueError_of_is_holiday_is_not_masked(
+    func: Callable[[datetime.date, IsHolidayFuncType], datetime.date],
+    enable_cache: bool,
+) -> None:
+    if enable_cache:
+        enable_result_cache()
+    try:
+        with pytest.raises(ValueError, match="lookup failed"):
+            func(datetime.date(2025, 1, 1), _raise_lookup_error)
+    finally:
+        disable_result_cache()
+
+
+class CountingIsHoliday:
+    """is_holiday function with holidays on the 1st and 2nd of each month."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, d: datetime.date) -> bool:
+        self.calls += 1
+        return d.day <= 2
+
+
+@pytest.fixture
+def result_cache() -> Generator[None, None, None]:
+    enable_result_cache(maxsize=4)
+    try:
+        yield
+    finally:
+        disable_result_cache()
+
+
+@pytest.mark.positive
+def test_result_cache_is_disabled_by_default() -> None:
+    assert result_cache_info() is None
+    result_cache_clear()  # no error
+
+
+@pytest.mark.positive
+@pytest.mark.usefixtures("result_cache")
+def test_result_cache() -> None:
+    is_holiday = CountingIsHoliday()
+    d = datetime.date(2025, 1, 31)
+    expected = [
+        get_next_bizday(d, is_holiday),
+        get_prev_bizday(d, is_holiday),
+        get_n_next_bizday(d, 3, is_holiday),
+        get_n_prev_bizday(d, 3, is_holiday),
+    ]
+    assert expected == [
+        datetime.date(2025, 2, 3),
+        datetime.date(2025, 1, 30),
+        datetime.date(2025, 2, 5),
+        datetime.date(2025, 1, 28),
+    ]
+    calls = is_holiday.calls
+    assert result_cache_info() == CacheInfo(hits=0, misses=4, maxsize=4, currsize=4)  # noqa: E501
+
+    # the same offsets are answered from the cache
+    assert [
+        get_n_next_bizday(d, 1, is_holiday),
+        get_n_prev_bizday(d, 1, is_holiday),
+        get_n_prev_bizday(d, -3, is_holiday),
+        get_n_next_bizday(d, -3, is_holiday),
+    ] == expected
+    assert is_holiday.calls == calls
+    assert result_cache_info() == CacheInfo(hits=4, misses=4, maxsize=4, currsize=4)  # noqa: E501
+
+    # the least recently used result is evicted
+    get_n_next_bizday(d, 10, is_holiday)
+    assert result_cache_info() == CacheInfo(hits=4, misses=5, maxsize=4, currsize=4)  # noqa: E501
+    get_next_bizday(d, is_holiday)
+    assert result_cache_info() == CacheInfo(hits=4, misses=6, maxsize=4, currsize=4)  # noqa: E501
+
+    result_cache_clear()
+    assert result_cache_info() == CacheInfo(hits=0, misses=0, maxsize=4, currsize=0)  # noqa: E501
+
+
+@pytest.mark.positive
+@pytest.mark.usefixtures("result_cache")
+def test_result_cache_is_keyed_by_discriminator_version() -> None:
+    def is_first_day(d: datetime.date) -> bool:
+        return d.day == 1
+
+    def is_second_day(d: datetime.date) -> bool:
+        return d.day == 2
+
+    discriminator = HolidayDiscriminator(is_first_day)
+    d = datetime.date(2025, 1, 31)
+    assert get_next_bizday(d, discriminator) == datetime.date(2025, 2, 2)
+    discriminator.add_is_holiday_funcs(is_second_day)
+    assert get_next_bizday(d, discriminator) == datetime.date(2025, 2, 3)
+    discriminator.remove_is_holiday_funcs("is_second_day")
+    assert get_next_bizday(d, discriminator) == datetime.date(2025, 2, 2)
+    assert result_cache_info() == CacheInfo(hits=0, misses=3, maxsize=4, currsize=3)  # noqa: E501
+
+
+@pytest.mark.positive
+@pytest.mark.usefixtures("result_cache")
+@pytest.mark.parametrize(
+    "wrap",
+    [compile_is_holiday_lazily, cached_is_holiday],
+)
+def test_result_cache_is_keyed_by_wrapped_discriminator_version(
+    wrap: Callable[[IsHolidayFuncType], IsHolidayFuncType],
+) -> None:
+    def is_first_day(d: datetime.date) -> bool:
+        return d.day == 1
+
+    def is_second_day(d: datetime.date) -> bool:
+        return d.day == 2
+
+    discriminator = HolidayDiscriminator(is_first_day)
+    is_holiday = wrap(discriminator)
+    d = datetime.date(2025, 1, 31)
+    assert get_next_bizday(d, is_holiday) == datetime.date(2025, 2, 2)
+    discriminator.add_is_holiday_funcs(is_second_day)
+    assert get_next_bizday(d, is_holiday) == datetime.date(2025, 2, 3)
+    assert result_cache_info() == CacheInfo(hits=0, misses=2, maxsize=4, currsize=2)  # noqa: E501
+
+
+@pytest.mark.positive
+@pytest.mark.usefixtures("result_cache")
+def test_result_cache_is_keyed_by_fingerprint() -> None:
+    def is_first_day(d: datetime.date) -> bool:
+        return d.day == 1
+
+    start, end = datetime.date(2025, 1, 1), datetime.date(2025, 12, 31)
+    compiled1 = compile_is_holiday(is_first_day, start, end)
+    compiled2 = compile_is_holiday(is_first_day, start, end)
+    d = datetime.date(2025, 1, 31)
+    assert get_next_bizday(d, compiled1) == datetime.date(2025, 2, 2)
+    assert get_next_bizday(d, compiled2) == datetime.date(2025, 2, 2)
+    assert result_cache_info() == CacheInfo(hits=1, misses=1, maxsize=4, currsize=1)  # noqa: E501
+
+
+@pytest.mark.positive
+@pytest.mark.usefixtures("result_cache")
+def test_result_cache_skips_unhashable_is_holiday() -> None:
+    class Unhashable(CountingIsHoliday):
+        __hash__ = None  # type: ignore[assignment]
+
+    is_holiday = Unhashable()
+    d = datetime.date(2025, 1, 31)
+    assert get_next_bizday(d, is_holiday) == get_next_bizday(d, is_holiday)
+    assert result_cache_info() == CacheInfo(hits=0, misses=0, maxsize=4, currsize=0)  # noqa: E501
+
+
+@pytest.mark.negative
+@pytest.mark.usefixtures("result_cache")
+def test_result_cache_does_not_cache_errors() -> None:
+    d = datetime.date.max - datetime.timedelta(days=10)
+    for _ in range(2):
+        with pytest.raises(ValueError, match="No next business day found"):
+            get_next_bizday(d, lambda _: True)
+    assert result_cache_info() == CacheInfo(hits=0, misses=2, maxsize=4, currsize=0)  # noqa: E501
+
+
+@pytest.mark.negative
+@pytest.mark.parametrize("maxsize", [0, -1])
+def test_enable_result_cache_with_invalid_maxsize(maxsize: int) -> None:
+    with pytest.raises(ValueError):
+        enable_result_cache(maxsize)
+    assert result_cache_info() is None
@@ -0,0 +1,121 @@
+from typing import Any
+
+import pytest
+
+from benchmarks.compare import compare_results, mann_whitney_u
+
+
+def _results(*entries: tuple[str, str, list[float]]) -> dict[str, Any]:
+    return {
+        "results": [
+            {"scenario": scenario, "calendar": calendar, "times": times}
+            for scenario, calendar, times in entries
+        ],
+    }
+
+
+BASE_TIMES = [float(t) for t in range(100, 120)]
+
+
+@pytest.mark.positive
+@pytest.mark.parametrize(
+    "xs",
+    [
+        [1.0, 2.0, 3.0, 4.0, 5.0],
+        BASE_TIMES,
+    ],
+)
+def test_mann_whitney_u_identical_samples(xs: list[float]) -> None:
+    assert mann_whitney_u(xs, list(xs)) == 1.0
+
+
+@pytest.mark.positive
+def test_mann_whitney_u_separated_samples() -> None:
+    xs = [float(t) for t in range(1, 11)]
+    ys = [float(t) for t in range(11, 21)]
+    # the normal approximation with the continuity correction
+    assert mann_whitney_u(xs, ys) == pytest.approx(0.000182672, rel=1e-4)
+    assert mann_whitney_u(ys, xs) == pytest.approx(mann_whitney_u(xs, ys))
+
+
+@pytest.mark.positive
+def test_mann_whitney_u_ties() -> None:
+    xs = [1.0, 1.0, 2.0, 2.0, 3.0, 3.0]
+    ys = [2.0, 3.0, 3.0, 4.0, 4.0, 5.0]
+    # the tie-corrected variance is smaller than the uncorrected one
+    assert mann_whitney_u(xs, ys) == pytest.approx(0.0393933, rel=1e-4)
+
+
+@pytest.mark.positive
+@pytest.mark.parametrize(
+    "xs, ys",
+    [
+        ([1.0] * 5, [1.0] * 5),
+        ([1.0] * 5, [1.0] * 3),
+        ([], [1.0, 2.0]),
+        ([1.0, 2.0], []),
+        ([], []),
+    ],
+)
+def test_mann_whitney_u_degenerate_samples(
+    xs: list[float],
+    ys: list[float],
+) -> None:
+    assert mann_whitney_u(xs, ys) == 1.0
+
+
+@pytest.mark.positive
+@pytest.mark.parametrize(
+    "scale, expected",
+    [
+        (1.0, "unchanged"),
+        # separated, but within the threshold
+        (1.05, "unchanged"),
+        (0.96, "unchanged"),
+        (1.5, "regression"),
+        (0.5, "improvement"),
+    ],
+)
+def test_compare_results_verdict(scale: float, expected: str) -> None:
+    new_times = [t * scale for t in BASE_TIMES]
+    comparisons = compare_results(
+        _results(("is_bizday", "weekmask", BASE_TIMES)),
+        _results(("is_bizday", "weekmask", new_times)),
+        threshold=0.1,
+    )
+    assert len(comparisons) == 1
+    comparison = comparisons[0]
+    assert comparison.scenario == "is_bizday"
+    assert comparison.calendar == "weekmask"
+    assert comparison.ratio == pytest.approx(scale)
+    assert comparison.verdict == expected
+
+
+@pytest.mark.positive
+def test_compare_results_not_significant_is_unchanged() -> None:
+    # the medians differ beyond the threshold but the samples overlap
+    base_times = [1.0, 2.0, 3.0, 100.0, 101.0]
+    new_times = [1.0, 2.0, 50.0, 100.0, 101.0]
+    comparisons = compare_results(
+        _results(("is_bizday", "weekmask", base_times)),
+        _results(("is_bizday", "weekmask", new_times)),
+        threshold=0.1,
+        alpha=0.05,
+    )
+    assert comparisons[0].ratio > 1.1
+    assert comparisons[0].p_value >= 0.05
+    assert comparisons[0].verdict == "unchanged"
+
+
+@pytest.mark.positive
+def test_compare_results_skips_new_scenarios() -> None:
+    comparisons = compare_results(
+        _results(("is_bizday", "weekmask", BASE_TIMES)),
+        _results(
+            ("is_bizday", "weekmask", BASE_TIMES),
+            ("count_bizdays", "weekmask", BASE_TIMES),
+        ),
+    )
+    assert [(c.scenario, c.calendar) for c in comparisons] == [
+        ("is_bizday", "weekmask"),
+    ]
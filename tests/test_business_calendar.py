@@ -0,0 +1,356 @@
+import gc
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from pybizday_utils import basic, month
+from pybizday_utils.business_calendar import BusinessCalendar
+from pybizday_utils.default_holiday_utils import (
+    global_default_holiday_discriminator,
+    with_is_holiday_funcs,
+)
+from pybizday_utils.holiday_utils import (
+    HolidayDiscriminator,
+    IsHolidayFuncType,
+    compile_is_holiday,
+    is_between_1231_0103,
+    is_saturday_or_sunday,
+    load_compiled,
+)
+
+START = date(2024, 12, 1)
+END = date(2025, 2, 28)
+IS_HOLIDAY: IsHolidayFuncType = HolidayDiscriminator(
+    is_saturday_or_sunday,
+    is_between_1231_0103,
+)
+DATES = [
+    date(2024, 11, 1),
+    date(2024, 11, 30),
+    date(2024, 12, 1),
+    date(2024, 12, 31),
+    date(2025, 1, 3),
+    date(2025, 1, 4),
+    date(2025, 2, 28),
+    date(2025, 3, 1),
+    date(2025, 4, 15),
+    datetime(2025, 1, 6, 12, 30),
+]
+
+
+@pytest.fixture
+def calendar() -> BusinessCalendar:
+    return BusinessCalendar(IS_HOLIDAY, START, END)
+
+
+@pytest.mark.positive
+def test_business_calendar_properties(calendar: BusinessCalendar) -> None:
+    assert calendar.start == START
+    assert calendar.end == END
+    assert calendar.is_holiday is IS_HOLIDAY
+
+
+@pytest.mark.positive
+def test_business_calendar_with_datetime_range() -> None:
+    calendar = BusinessCalendar(
+        IS_HOLIDAY,
+        datetime(2024, 12, 1, 10),
+        datetime(2025, 2, 28, 10),
+    )
+    assert calendar.start == START
+    assert calendar.end == END
+
+
+@pytest.mark.positive
+@pytest.mark.parametrize("d", DATES)
+def test_business_calendar_is_holiday(
+    calendar: BusinessCalendar,
+    d: date,
+) -> None:
+    for offset in range(-7, 8):
+        d_ = d + timedelta(days=offset)
+        assert calendar(d_) == IS_HOLIDAY(d_)
+        assert calendar.is_bizday(d_) == (not IS_HOLIDAY(d_))
+
+
+@pytest.mark.positive
+@pytest.mark.parametrize("d", DATES)
+def test_business_calendar_next_and_prev(
+    calendar: BusinessCalendar,
+    d: date,
+) -> None:
+    assert calendar.next(d) == basic.get_next_bizday(d, IS_HOLIDAY)
+    assert calendar.prev(d) == basic.get_prev_bizday(d, IS_HOLIDAY)
+
+
+@pytest.mark.positive
+@pytest.mark.parametrize("d", DATES)
+@pytest.mark.parametrize("n", [1, 2, 5, 20, 60, 200, -1, -2, -5, -20, -60, -200])
+def test_business_calendar_n_next_and_n_prev(
+    calendar: BusinessCalendar,
+    d: date,
+    n: int,
+) -> None:
+    assert calendar.n_next(d, n) == basic.get_n_next_bizday(d, n, IS_HOLIDAY)
+    assert calendar.n_prev(d, n) == basic.get_n_prev_bizday(d, n, IS_HOLIDAY)
+
+
+@pytest.mark.positive
+@pytest.mark.parametrize("start", DATES)
+@pytest.mark.parametrize("end", DATES)
+@pytest.mark.parametrize("include_start", [True, False])
+@pytest.mark.parametrize("include_end", [True, False])
+def test_business_calendar_bizday_range(
+    calendar: BusinessCalendar,
+    start: date,
+    end: date,
+    include_start: bool,
+    include_end: bool,
+) -> None:
+    expected = list(
+        basic.bizday_range(
+            start,
+            end,
+            IS_HOLIDAY,
+            include_start=include_start,
+            include_end=include_end,
+        )
+    )
+    actual = list(
+        calendar.bizday_range(
+            start,
+            end,
+            include_start=include_start,
+            include_end=include_end,
+        )
+    )
+    assert actual == expected
+
+
+@pytest.mark.positive
+def test_business_calendar_n_zero(calendar: BusinessCalendar) -> None:
+    assert calendar.n_next(date(2025, 1, 6), 0) == date(2025, 1, 6)
+    assert calendar.n_prev(date(2025, 1, 6), 0) == date(2025, 1, 6)
+
+
+@pytest.mark.negative
+@pytest.mark.parametrize("d", [date(2025, 1, 1), date(2025, 1, 4)])
+def test_business_calendar_n_zero_on_holiday(
+    calendar: BusinessCalendar,
+    d: date,
+) -> None:
+    with pytest.raises(ValueError):
+        calendar.n_next(d, 0)
+    with pytest.raises(ValueError):
+        calendar.n_prev(d, 0)
+
+
+@pytest.mark.negative
+def test_business_calendar_no_bizday_found() -> None:
+    calendar = BusinessCalendar(lambda _: False, date.max, date.max)
+    with pytest.raises(ValueError):
+        calendar.next(date.max)
+    with pytest.raises(ValueError):
+        calendar.n_next(date.max - timedelta(days=1), 2)
+    calendar = BusinessCalendar(lambda _: False, date.min, date.min)
+    with pytest.raises(ValueError):
+        calendar.prev(date.min)
+    with pytest.raises(ValueError):
+        calendar.n_prev(date.min + timedelta(days=1), 2)
+
+
+@pytest.mark.negative
+def test_business_calendar_with_start_is_greater_than_end() -> None:
+    with pytest.raises(ValueError):
+        BusinessCalendar(IS_HOLIDAY, END, START)
+
+
+@pytest.mark.positive
+def test_business_calendar_does_not_call_is_holiday_in_range() -> None:
+    calls: list[date] = []
+
+    def is_holiday(d: date) -> bool:
+        calls.append(d)
+        return bool(IS_HOLIDAY(d))
+
+    calendar = BusinessCalendar(is_holiday, START, END)
+    calls.clear()
+    assert basic.get_n_next_bizday(START, 40, calendar) == basic.get_n_next_bizday(  # noqa: E501
+        START, 40, IS_HOLIDAY
+    )
+    assert basic.get_n_prev_bizday(END, 40, calendar) == basic.get_n_prev_bizday(  # noqa: E501
+        END, 40, IS_HOLIDAY
+    )
+    assert basic.count_bizdays(START, END, calendar) == basic.count_bizdays(
+        START, END, IS_HOLIDAY
+    )
+    assert month.get_biz_end_of_month(
+        date(2025, 1, 15), calendar
+    ) == month.get_biz_end_of_month(date(2025, 1, 15), IS_HOLIDAY)
+    assert month.add_months(
+        date(2024, 12, 30), 1, calendar
+    ) == month.add_months(date(2024, 12, 30), 1, IS_HOLIDAY)
+    assert calls == []
+
+
+@pytest.mark.positive
+@pytest.mark.parametrize("start", DATES)
+@pytest.mark.parametrize("end", DATES)
+@pytest.mark.parametrize("include_start", [True, False])
+@pytest.mark.parametrize("include_end", [True, False])
+def test_business_calendar_count_bizdays(
+    calendar: BusinessCalendar,
+    start: date,
+    end: date,
+    include_start: bool,
+    include_end: bool,
+) -> None:
+    expected = basic.count_bizdays(
+        start,
+        end,
+        IS_HOLIDAY,
+        include_start=include_start,
+        include_end=include_end,
+    )
+    actual = calendar.count_bizdays(
+        start,
+        end,
+        include_start=include_start,
+        include_end=include_end,
+    )
+    assert actual == expected
+    assert basic.count_bizdays(
+        start,
+        end,
+        calendar,
+        include_start=include_start,
+        include_end=include_end,
+    ) == expected
+
+
+@pytest.mark.positive
+@pytest.mark.parametrize("with_counts", [True, False])
+def test_business_calendar_from_compiled(
+    tmp_path: Path,
+    with_counts: bool,
+) -> None:
+    path = tmp_path / "calendar.bin"
+    compile_is_holiday(IS_HOLIDAY, START, END).save_compiled(
+        path,
+        with_counts=with_counts,
+    )
+    compiled = load_compiled(path, is_holiday=IS_HOLIDAY)
+    calendar = BusinessCalendar.from_compiled(compiled)
+    expected = BusinessCalendar(IS_HOLIDAY, START, END)
+    assert calendar.start == START
+    assert calendar.end == END
+    assert calendar.is_holiday is compiled
+    for d in DATES:
+        assert calendar.n_next(d, 30) == expected.n_next(d, 30)
+        assert calendar.n_prev(d, 30) == expected.n_prev(d, 30)
+        assert calendar.count_bizdays(d, END) == expected.count_bizdays(d, END)  # noqa: E501
+
+
+@pytest.mark.positive
+@pytest.mark.parametrize("d", DATES)
+def test_business_calendar_month_queries(
+    calendar: BusinessCalendar,
+    d: date,
+) -> None:
+    for offset in range(-40, 41, 3):
+        d_ = d + timedelta(days=offset)
+        assert calendar.is_biz_start_of_month(d_) == month.is_biz_start_of_month(d_, IS_HOLIDAY)  # noqa: E501
+        assert calendar.is_biz_end_of_month(d_) == month.is_biz_end_of_month(d_, IS_HOLIDAY)  # noqa: E501
+        assert calendar.biz_start_of_month(d_) == month.get_biz_start_of_month(d_, IS_HOLIDAY)  # noqa: E501
+        assert calendar.biz_end_of_month(d_) == month.get_biz_end_of_month(d_, IS_HOLIDAY)  # noqa: E501
+
+
+@pytest.mark.positive
+def test_business_calendar_count_bizdays_in_month(
+    calendar: BusinessCalendar,
+) -> None:
+    assert calendar.count_bizdays_in_month(date(2025, 1, 15)) == basic.count_bizdays(  # noqa: E501
+        date(2025, 1, 1), date(2025, 1, 31), IS_HOLIDAY
+    )
+    assert calendar.count_bizdays_in_month(datetime(2025, 4, 30, 12)) == basic.count_bizdays(  # noqa: E501
+        date(2025, 4, 1), date(2025, 4, 30), IS_HOLIDAY
+    )
+
+
+@pytest.mark.positive
+def test_business_calendar_month_table_is_shared() -> None:
+    calls: list[date] = []
+
+    def is_holiday(d: date) -> bool:
+        calls.append(d)
+        return bool(IS_HOLIDAY(d))
+
+    # out of the indexed range, so the raw function is called
+    calendar = BusinessCalendar(is_holiday, START, START)
+    calls.clear()
+    d = date(2025, 6, 30)
+    assert month.is_biz_end_of_month(d, calendar)
+    assert calls
+    calls.clear()
+    for _ in range(3):
+        assert month.is_biz_end_of_month(d, calendar)
+        assert month.get_biz_end_of_month(d, calendar) == d
+        assert month.get_biz_start_of_month(d, calendar) == date(2025, 6, 2)
+    assert calls == []
+
+
+@pytest.mark.negative
+def test_business_calendar_month_queries_without_bizday() -> None:
+    calendar = BusinessCalendar(lambda d: d != date.max, date.max, date.max)
+    with pytest.raises(ValueError):
+        calendar.is_biz_end_of_month(date.max)
+    calendar = BusinessCalendar(lambda d: d != date.min, date.min, date.min)
+    with pytest.raises(ValueError):
+        calendar.is_biz_start_of_month(date.min)
+
+
+def is_20240103(d: date) -> bool:
+    return d == date(2024, 1, 3)
+
+
+@pytest.mark.positive
+@pytest.mark.use_global_default_holiday_discriminator
+@pytest.mark.parametrize("from_compiled", [True, False])
+def test_business_calendar_rebuilt_on_change_of_global_default(
+    from_compiled: bool,
+) -> None:
+    start, end = date(2024, 1, 1), date(2024, 12, 31)
+    if from_compiled:
+        calendar = BusinessCalendar.from_compiled(
+            compile_is_holiday(global_default_holiday_discriminator, start, end),  # noqa: E501
+        )
+    else:
+        calendar = BusinessCalendar(global_default_holiday_discriminator, start, end)  # noqa: E501
+    # fill the month table
+    assert calendar.count_bizdays_in_month(date(2024, 1, 1)) == 23
+    assert calendar.count_bizdays(date(2024, 1, 1), date(2024, 1, 5)) == 5
+
+    with with_is_holiday_funcs(is_20240103):
+        assert calendar(date(2024, 1, 3)) is True
+        assert calendar.count_bizdays(date(2024, 1, 1), date(2024, 1, 5)) == 4  # noqa: E501
+        assert calendar.count_bizdays_in_month(date(2024, 1, 1)) == 22
+        assert calendar.n_next(date(2024, 1, 2), 1) == date(2024, 1, 4)
+        assert basic.count_bizdays(
+            date(2024, 1, 1),
+            date(2024, 1, 5),
+            calendar,
+        ) == basic.count_bizdays(date(2024, 1, 1), date(2024, 1, 5))
+
+    assert calendar(date(2024, 1, 3)) is False
+    assert calendar.count_bizdays(date(2024, 1, 1), date(2024, 1, 5)) == 5
+    assert calendar.count_bizdays_in_month(date(2024, 1, 1)) == 23
+
+
+@pytest.mark.positive
+def test_business_calendar_is_not_kept_alive_by_discriminator() -> None:
+    discriminator = HolidayDiscriminator(is_saturday_or_sunday)
+    calendar = BusinessCalendar(discriminator, START, END)
+    del calendar
+    gc.collect()
+    assert discriminator._subscribers == {}
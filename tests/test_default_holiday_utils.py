@@ -233,3 +233,34 @@ def test_default_holiday_discriminator_status() -> None:
     assert default.is_holiday_funcs[name] is expected
     assert get_global_holiday_funcs_names() == [name]
     assert get_global_holiday_funcs()[name] is expected
+
+
+@pytest.mark.positive
+@pytest.mark.use_global_default_holiday_discriminator
+def test_with_is_holiday_funcs_restores_priorities() -> None:
+    with with_is_holiday_funcs(func1, priority=2, all_replace=True):
+        add_global_is_holiday_funcs(func2, priority=1)
+        with with_is_holiday_funcs(func3_, priority=3) as default:
+            assert default.evaluation_order == ["func3_", "func1", "func2"]
+            assert default.priorities == {"func1": 2, "func2": 1, "func3_": 3}
+        assert default.evaluation_order == ["func1", "func2"]
+        assert default.priorities == {"func1": 2, "func2": 1}
+    assert get_global_holiday_funcs_names() == [is_saturday_or_sunday.__name__]
+    assert default.priorities == {is_saturday_or_sunday.__name__: 0}
+
+
+@pytest.mark.positive
+@pytest.mark.use_global_default_holiday_discriminator
+def test_with_is_holiday_funcs_notifies_changes() -> None:
+    default = _GlobalDefaultHolidayDiscriminator.get_instance()
+    versions: list[int] = []
+    unsubscribe = default.subscribe(lambda d: versions.append(d.version))
+    try:
+        version = default.version
+        with with_is_holiday_funcs(func1):
+            assert default.version > version
+            version = default.version
+        assert default.version > version
+        assert versions and versions[-1] == default.version
+    finally:
+        unsubscribe()
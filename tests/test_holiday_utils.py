@@ -1,16 +1,30 @@
-from datetime import date, datetime
+import gc
+from datetime import date, datetime, timedelta
+from pathlib import Path
 
 import pytest
 
+from pybizday_utils.date_range_utils import date_range
+from pybizday_utils.default_holiday_utils import (
+    global_default_holiday_discriminator,
+    with_is_holiday_funcs,
+)
 from pybizday_utils.holiday_utils import (
+    CachedIsHoliday,
+    CacheInfo,
+    CompiledIsHoliday,
     HolidayDiscriminator,
     IsHolidayFuncType,
+    OutOfRangeInfo,
+    cached_is_holiday,
     compile_is_holiday,
+    compile_is_holiday_lazily,
     is_between_1231_0103,
     is_new_year_day,
     is_saturday_or_sunday,
     is_the_end_of_year,
     is_the_first_three_days_of_new_year,
+    load_compiled,
 )
 
 
@@ -332,6 +346,227 @@ def test_holiday_discriminator_remove_not_exist() -> None:
     assert discriminator.names == [is_new_year_day.__name__]
 
 
+@pytest.mark.positive
+def test_holiday_discriminator_priority() -> None:
+    calls: list[str] = []
+
+    def is_first_day(d: date) -> bool:
+        calls.append("is_first_day")
+        return d.day == 1
+
+    def is_first_month(d: date) -> bool:
+        calls.append("is_first_month")
+        return d.month == 1
+
+    discriminator = HolidayDiscriminator(is_first_day)
+    discriminator.add_is_holiday_funcs(is_first_month, priority=1)
+    assert discriminator.names == ["is_first_day", "is_first_month"]
+    assert discriminator.evaluation_order == ["is_first_month", "is_first_day"]  # noqa: E501
+    assert discriminator.priorities == {"is_first_day": 0, "is_first_month": 1}  # noqa: E501
+
+    assert discriminator(date(2025, 1, 1)) is True
+    assert calls == ["is_first_month"]
+    calls.clear()
+    assert discriminator(date(2025, 2, 1)) is True
+    assert calls == ["is_first_month", "is_first_day"]
+
+    # the priority is replaced on overwrite
+    discriminator.add_is_holiday_funcs(
+        is_first_month,
+        allow_overwrite=True,
+        priority=-1,
+    )
+    assert discriminator.evaluation_order == ["is_first_day", "is_first_month"]  # noqa: E501
+    assert discriminator.priorities == {"is_first_day": 0, "is_first_month": -1}  # noqa: E501
+
+    discriminator.remove_is_holiday_funcs("is_first_day")
+    assert discriminator.evaluation_order == ["is_first_month"]
+    assert discriminator.priorities == {"is_first_month": -1}
+
+
+@pytest.mark.positive
+@pytest.mark.parametrize("n", [0, 1, 2, 3, 10])
+def test_holiday_discriminator_flat_call(n: int) -> None:
+    # the i-th function returns a truthy value other than True on the i-th day
+    funcs = {
+        f"is_day_{i}": (lambda d, i=i: [1] if d.day == i + 1 else [])
+        for i in range(n)
+    }
+    discriminator = HolidayDiscriminator(**funcs)  # type: ignore[arg-type]
+    for d in date_range(date(2025, 1, 1), date(2025, 1, 31)):
+        assert discriminator(d) is (d.day <= n)
+
+
+@pytest.mark.positive
+def test_holiday_discriminator_flat_call_is_rebuilt() -> None:
+    discriminator = HolidayDiscriminator()
+    assert discriminator(date(2025, 1, 1)) is False
+    discriminator.add_is_holiday_funcs(is_new_year_day)
+    assert discriminator(date(2025, 1, 1)) is True
+    discriminator.add_is_holiday_funcs(is_saturday_or_sunday)
+    assert discriminator(date(2025, 1, 4)) is True
+    discriminator.remove_is_holiday_funcs(is_new_year_day.__name__)
+    assert discriminator(date(2025, 1, 1)) is False
+    assert discriminator(date(2025, 1, 4)) is True
+
+
+@pytest.mark.positive
+def test_holiday_discriminator_replace_funcs() -> None:
+    discriminator = HolidayDiscriminator(is_new_year_day)
+    discriminator._is_holiday_funcs = {"sos": is_saturday_or_sunday}
+    assert discriminator.evaluation_order == ["sos"]
+    assert discriminator(date(2025, 1, 1)) is False
+    assert discriminator(date(2025, 3, 22)) is True
+
+
+@pytest.mark.positive
+def test_holiday_discriminator_version() -> None:
+    discriminator = HolidayDiscriminator(is_new_year_day)
+    assert discriminator.version == 0
+
+    discriminator.add_is_holiday_funcs(is_saturday_or_sunday)
+    assert discriminator.version == 1
+    discriminator.remove_is_holiday_funcs(is_new_year_day.__name__)
+    assert discriminator.version == 2
+    discriminator._is_holiday_funcs = {}
+    assert discriminator.version == 3
+
+    # neither calls nor the order of evaluation are changes
+    discriminator(date(2025, 1, 1))
+    discriminator.adaptive = True
+    assert discriminator.version == 3
+
+    # failed updates are not changes
+    with pytest.raises(KeyError):
+        discriminator.remove_is_holiday_funcs("no_such_func")
+    assert discriminator.version == 3
+
+
+@pytest.mark.positive
+def test_holiday_discriminator_subscribe() -> None:
+    discriminator = HolidayDiscriminator()
+    notified: list[int] = []
+
+    def callback(d: HolidayDiscriminator) -> None:
+        notified.append(d.version)
+
+    unsubscribe = discriminator.subscribe(callback)
+    discriminator.add_is_holiday_funcs(is_new_year_day)
+    discriminator.remove_is_holiday_funcs(is_new_year_day.__name__)
+    assert notified == [1, 2]
+
+    unsubscribe()
+    unsubscribe()  # no error
+    discriminator.add_is_holiday_funcs(is_new_year_day)
+    assert notified == [1, 2]
+
+
+@pytest.mark.positive
+def test_holiday_discriminator_subscribe_weak() -> None:
+    class Cache:
+        def __init__(self) -> None:
+            self.n_invalidated = 0
+
+        def invalidate(self, d: HolidayDiscriminator) -> None:
+            self.n_invalidated += 1
+
+    discriminator = HolidayDiscriminator()
+    cache = Cache()
+    discriminator.subscribe(cache.invalidate, weak=True)
+    discriminator.add_is_holiday_funcs(is_new_year_day)
+    assert cache.n_invalidated == 1
+
+    del cache
+    discriminator.add_is_holiday_funcs(is_saturday_or_sunday)
+    assert discriminator._subscribers == {}
+
+
+@pytest.mark.positive
+def test_holiday_discriminator_dead_subscribers_are_removed_without_change() -> None:  # noqa: E501
+    discriminator = HolidayDiscriminator(is_new_year_day)
+    for _ in range(100):
+        cached_is_holiday(discriminator)
+
+    def callback(d: HolidayDiscriminator) -> None:
+        pass
+
+    discriminator.subscribe(callback, weak=True)
+    del callback
+    gc.collect()
+    assert discriminator._subscribers == {}
+    assert discriminator.version == 0
+
+
+@pytest.mark.negative
+def test_holiday_discriminator_subscriber_error(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    discriminator = HolidayDiscriminator()
+    notified: list[int] = []
+
+    def broken(d: HolidayDiscriminator) -> None:
+        raise RuntimeError("broken")
+
+    discriminator.subscribe(broken)
+    discriminator.subscribe(lambda d: notified.append(d.version))
+    discriminator.add_is_holiday_funcs(is_new_year_day)
+    assert notified == [1]
+    assert discriminator.names == [is_new_year_day.__name__]
+    assert "broken" in caplog.text
+
+
+@pytest.mark.positive
+def test_holiday_discriminator_adaptive() -> None:
+    counts = {"is_rare_and_expensive": 0, "is_weekend": 0}
+
+    def is_rare_and_expensive(d: date) -> bool:
+        counts["is_rare_and_expensive"] += 1
+        sum(range(1000))
+        return d.month == 12 and d.day == 25
+
+    def is_weekend(d: date) -> bool:
+        counts["is_weekend"] += 1
+        return d.weekday() >= 5
+
+    dates = list(date_range(date(2020, 1, 1), date(2029, 12, 31)))
+    static = HolidayDiscriminator(is_rare_and_expensive, is_weekend)
+    expected = [static(d) for d in dates]
+    static_calls = counts["is_rare_and_expensive"]
+
+    counts["is_rare_and_expensive"] = 0
+    adaptive = HolidayDiscriminator(
+        is_rare_and_expensive,
+        is_weekend,
+        adaptive=True,
+    )
+    assert adaptive.adaptive
+    assert [adaptive(d) for d in dates] == expected
+    assert adaptive.evaluation_order == ["is_weekend", "is_rare_and_expensive"]  # noqa: E501
+    assert counts["is_rare_and_expensive"] < static_calls * 0.8
+    # the registration order is kept
+    assert adaptive.names == ["is_rare_and_expensive", "is_weekend"]
+
+    adaptive.adaptive = False
+    assert adaptive.evaluation_order == ["is_rare_and_expensive", "is_weekend"]  # noqa: E501
+
+
+@pytest.mark.positive
+def test_holiday_discriminator_adaptive_respects_priority() -> None:
+    def is_rare_and_expensive(d: date) -> bool:
+        sum(range(1000))
+        return d.month == 12 and d.day == 25
+
+    adaptive = HolidayDiscriminator(adaptive=True)
+    adaptive.add_is_holiday_funcs(is_rare_and_expensive, priority=1)
+    adaptive.add_is_holiday_funcs(is_saturday_or_sunday)
+    for d in date_range(date(2020, 1, 1), date(2029, 12, 31)):
+        adaptive(d)
+    assert adaptive.evaluation_order == [
+        "is_rare_and_expensive",
+        "is_saturday_or_sunday",
+    ]
+
+
 @pytest.mark.positive
 @pytest.mark.heavy
 @pytest.mark.parametrize(
@@ -432,6 +667,137 @@ def test_compiled_func_for_out_of_compilation_range(
     assert expected in caplog.text
 
 
+@pytest.mark.positive
+def test_compiled_func_logs_out_of_range_once(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    compiled_func = compile_is_holiday(
+        is_new_year_day,
+        start=date(2020, 1, 1),
+        end=date(2020, 12, 31),
+    )
+    assert compiled_func.out_of_range_info() == OutOfRangeInfo(0, None, None)
+
+    dates = [date(2021, 1, 1), date(2019, 1, 1), date(2022, 6, 1), date(2021, 1, 1)]  # noqa: E501
+    with caplog.at_level("WARNING"):
+        results = [compiled_func(d) for d in dates]
+        compiled_func(date(2020, 1, 1))  # in the range
+    assert results == [True, True, False, True]
+    assert caplog.text.count("out of the compilation range") == 1
+    assert "Date(2021-01-01)" in caplog.text
+    assert compiled_func.out_of_range_info() == OutOfRangeInfo(
+        calls=4,
+        earliest=date(2019, 1, 1),
+        latest=date(2022, 6, 1),
+    )
+
+    # reset re-arms the warning
+    compiled_func.reset_out_of_range_info()
+    assert compiled_func.out_of_range_info() == OutOfRangeInfo(0, None, None)
+    caplog.clear()
+    with caplog.at_level("WARNING"):
+        compiled_func(date(2023, 1, 1))
+    assert caplog.text.count("out of the compilation range") == 1
+    assert compiled_func.out_of_range_info() == OutOfRangeInfo(
+        1,
+        date(2023, 1, 1),
+        date(2023, 1, 1),
+    )
+
+
+@pytest.mark.positive
+@pytest.mark.parametrize(
+    "d, expected_start, expected_end",
+    [
+        # by extend_years
+        (date(2021, 3, 1), date(2020, 1, 1), date(2022, 12, 31)),
+        (date(2019, 12, 31), date(2018, 1, 1), date(2020, 12, 31)),
+        # up to the date farther than extend_years
+        (date(2025, 1, 1), date(2020, 1, 1), date(2025, 1, 1)),
+        (date(2010, 6, 30), date(2010, 6, 30), date(2020, 12, 31)),
+    ],
+)
+def test_compiled_func_extends_range(
+    d: date,
+    expected_start: date,
+    expected_end: date,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    calls: list[date] = []
+
+    def is_holiday(d: date) -> bool:
+        calls.append(d)
+        return is_between_1231_0103(d) or is_saturday_or_sunday(d)
+
+    compiled_func = compile_is_holiday(
+        is_holiday,
+        start=date(2020, 1, 1),
+        end=date(2020, 12, 31),
+        extend_years=2,
+    )
+    calls.clear()
+    with caplog.at_level("WARNING"):
+        assert compiled_func(d) == is_holiday(d)
+    assert "out of the compilation range" not in caplog.text
+    assert compiled_func.start == expected_start
+    assert compiled_func.end == expected_end
+
+    # the extended range is served from the bitmap
+    calls.clear()
+    for day in date_range(expected_start, expected_end):
+        assert compiled_func(day) == (
+            is_between_1231_0103(day) or is_saturday_or_sunday(day)
+        )
+    assert calls == []
+    assert compiled_func.nbytes == (expected_end - expected_start).days // 8 + 1  # noqa: E501
+
+
+@pytest.mark.positive
+def test_compiled_func_extends_range_up_to_date_max() -> None:
+    compiled_func = compile_is_holiday(
+        is_new_year_day,
+        start=date(9998, 1, 1),
+        end=date(9998, 12, 31),
+        extend_years=10,
+    )
+    assert compiled_func(date(9999, 1, 1)) is True
+    assert compiled_func.end == date.max
+
+
+@pytest.mark.positive
+def test_compiled_func_extension_updates_derived_data() -> None:
+    compiled_func = compile_is_holiday(
+        is_saturday_or_sunday,
+        start=date(2025, 1, 1),
+        end=date(2025, 1, 31),
+        extend_years=1,
+    )
+    fingerprint = compiled_func.fingerprint
+    assert len(compiled_func.bizday_counts()) == 32
+
+    compiled_func(date(2026, 1, 1))
+    expected = compile_is_holiday(
+        is_saturday_or_sunday,
+        start=date(2025, 1, 1),
+        end=date(2026, 1, 31),
+    )
+    assert compiled_func.fingerprint != fingerprint
+    assert compiled_func.fingerprint == expected.fingerprint
+    assert list(compiled_func.bizday_counts()) == list(expected.bizday_counts())  # noqa: E501
+
+
+@pytest.mark.negative
+@pytest.mark.parametrize("extend_years", [0, -1])
+def test_compile_with_invalid_extend_years(extend_years: int) -> None:
+    with pytest.raises(ValueError):
+        compile_is_holiday(
+            is_new_year_day,
+            start=date(2020, 1, 1),
+            end=date(2020, 12, 31),
+            extend_years=extend_years,
+        )
+
+
 @pytest.mark.negative
 def test_compile_with_start_is_greater_than_end() -> None:
     with pytest.raises(ValueError):
@@ -440,3 +806,476 @@ def test_compile_with_start_is_greater_than_end() -> None:
             start=date(2030, 1, 1),
             end=date(2020, 12, 31),
         )
+
+
+@pytest.mark.positive
+@pytest.mark.parametrize("segment_years", [1, 3])
+@pytest.mark.parametrize(
+    "is_holiday",
+    [
+        is_new_year_day,
+        is_saturday_or_sunday,
+        is_between_1231_0103,
+    ],
+)
+def test_compile_lazily(
+    is_holiday: IsHolidayFuncType,
+    segment_years: int,
+) -> None:
+    compiled_func = compile_is_holiday_lazily(
+        is_holiday,
+        segment_years=segment_years,
+    )
+    assert HolidayDiscriminator(compiled_func).names == [is_holiday.__name__]
+    assert compiled_func.n_resident_segments == 0
+    for d in [
+        date(1, 1, 1),
+        date(2024, 12, 30),
+        date(2024, 12, 31),
+        date(2025, 1, 1),
+        date(2025, 1, 2),
+        datetime(2025, 1, 3),
+        datetime(2025, 1, 4),
+        date(9999, 12, 31),
+    ]:
+        assert compiled_func(d) == is_holiday(d)
+
+
+@pytest.mark.positive
+def test_compile_lazily_compiles_only_touched_segments() -> None:
+    calls: list[date] = []
+
+    def is_holiday(d: date) -> bool:
+        calls.append(d)
+        return is_new_year_day(d)
+
+    compiled_func = compile_is_holiday_lazily(is_holiday)
+    assert calls == []
+
+    assert compiled_func(date(2025, 1, 1)) is True
+    assert compiled_func(date(2025, 6, 1)) is False
+    assert len(calls) == 365
+    assert compiled_func.n_resident_segments == 1
+    assert compiled_func.n_compiled_segments == 1
+
+    assert compiled_func(date(2024, 1, 1)) is True
+    assert len(calls) == 365 + 366
+    assert compiled_func.n_resident_segments == 2
+    assert compiled_func.n_compiled_segments == 2
+
+    compiled_func.cache_clear()
+    assert compiled_func.n_resident_segments == 0
+    assert compiled_func.n_compiled_segments == 2
+
+
+@pytest.mark.positive
+def test_compile_lazily_invalidated_on_change() -> None:
+    discriminator = HolidayDiscriminator(is_new_year_day)
+    compiled_func = compile_is_holiday_lazily(discriminator)
+    assert compiled_func(date(2025, 1, 4)) is False
+
+    discriminator.add_is_holiday_funcs(is_saturday_or_sunday)
+    assert compiled_func.n_resident_segments == 0
+    assert compiled_func(date(2025, 1, 4)) is True
+
+    # the discriminator does not keep the cache alive
+    del compiled_func
+    gc.collect()
+    assert discriminator._subscribers == {}
+
+
+def is_20240103(d: date) -> bool:
+    return d == date(2024, 1, 3)
+
+
+@pytest.mark.positive
+@pytest.mark.use_global_default_holiday_discriminator
+@pytest.mark.parametrize("extend_years", [None, 1])
+def test_compile_rebuilt_on_change_of_global_default(
+    extend_years: int | None,
+) -> None:
+    compiled_func = compile_is_holiday(
+        global_default_holiday_discriminator,
+        date(2024, 1, 1),
+        date(2024, 12, 31),
+        extend_years=extend_years,
+    )
+    counts = list(compiled_func.bizday_counts())
+    fingerprint = compiled_func.fingerprint
+    assert compiled_func(date(2024, 1, 3)) is False
+
+    with with_is_holiday_funcs(is_20240103):
+        assert compiled_func(date(2024, 1, 3)) is True
+        assert compiled_func.bizday_counts()[5] == counts[5] - 1
+        assert compiled_func.fingerprint != fingerprint
+
+    assert compiled_func(date(2024, 1, 3)) is False
+    assert list(compiled_func.bizday_counts()) == counts
+    assert compiled_func.fingerprint == fingerprint
+
+
+@pytest.mark.positive
+def test_compile_rebuilt_over_extended_range_on_change() -> None:
+    discriminator = HolidayDiscriminator(is_new_year_day)
+    compiled_func = compile_is_holiday(
+        discriminator,
+        date(2024, 1, 1),
+        date(2024, 12, 31),
+        extend_years=1,
+    )
+    assert compiled_func(date(2025, 1, 4)) is False
+    assert compiled_func.end == date(2025, 12, 31)
+
+    discriminator.add_is_holiday_funcs(is_saturday_or_sunday)
+    assert compiled_func.end == date(2025, 12, 31)
+    assert compiled_func(date(2025, 1, 4)) is True
+
+    # the discriminator does not keep the bitmap alive
+    del compiled_func
+    gc.collect()
+    assert discriminator._subscribers == {}
+
+
+@pytest.mark.positive
+def test_compile_lazily_evicts_least_recently_used_segment() -> None:
+    compiled_func = compile_is_holiday_lazily(is_new_year_day, max_segments=2)
+    compiled_func(date(2023, 1, 1))
+    compiled_func(date(2024, 1, 1))
+    compiled_func(date(2023, 1, 2))  # 2023 is used more recently than 2024
+    compiled_func(date(2025, 1, 1))  # 2024 is evicted
+    assert compiled_func.n_resident_segments == 2
+    assert compiled_func.n_compiled_segments == 3
+    compiled_func(date(2023, 1, 3))
+    assert compiled_func.n_compiled_segments == 3
+    compiled_func(date(2024, 1, 3))
+    assert compiled_func.n_compiled_segments == 4
+
+
+@pytest.mark.negative
+@pytest.mark.parametrize(
+    "segment_years, max_segments",
+    [(0, 1), (-1, 1), (1, 0), (1, -1)],
+)
+def test_compile_lazily_with_invalid_arguments(
+    segment_years: int,
+    max_segments: int,
+) -> None:
+    with pytest.raises(ValueError):
+        compile_is_holiday_lazily(
+            is_new_year_day,
+            segment_years=segment_years,
+            max_segments=max_segments,
+        )
+
+
+@pytest.mark.positive
+def test_cached_is_holiday() -> None:
+    calls: list[date] = []
+
+    def is_holiday(d: date) -> bool:
+        calls.append(d)
+        return is_new_year_day(d)
+
+    cached_func = cached_is_holiday(is_holiday, maxsize=2)
+    assert isinstance(cached_func, CachedIsHoliday)
+    assert HolidayDiscriminator(cached_func).names == ["is_holiday"]
+    assert cached_func.maxsize == 2
+
+    assert cached_func(date(2025, 1, 1)) is True
+    assert cached_func(datetime(2025, 1, 1, 12)) is True
+    assert cached_func(date(2025, 1, 2)) is False
+    assert calls == [date(2025, 1, 1), date(2025, 1, 2)]
+    assert cached_func.cache_info() == CacheInfo(
+        hits=1, misses=2, maxsize=2, currsize=2
+    )
+
+    # 2025-01-02 is evicted as the least recently used
+    cached_func(date(2025, 1, 1))
+    cached_func(date(2025, 1, 3))
+    cached_func(date(2025, 1, 2))
+    assert calls[2:] == [date(2025, 1, 3), date(2025, 1, 2)]
+    assert cached_func.cache_info() == CacheInfo(
+        hits=2, misses=4, maxsize=2, currsize=2
+    )
+
+    cached_func.cache_clear()
+    assert cached_func.cache_info() == CacheInfo(
+        hits=0, misses=0, maxsize=2, currsize=0
+    )
+
+
+@pytest.mark.positive
+def test_cached_is_holiday_with_key() -> None:
+    calls: list[date] = []
+
+    def is_holiday(d: date) -> bool:
+        calls.append(d)
+        return d.month == 1
+
+    cached_func = cached_is_holiday(
+        is_holiday,
+        maxsize=None,
+        key=lambda d: d.month,
+    )
+    for d in date_range(date(2025, 1, 1), date(2025, 12, 31)):
+        assert cached_func(d) is (d.month == 1)
+    assert len(calls) == 12
+    assert cached_func.cache_info().currsize == 12
+
+
+@pytest.mark.positive
+def test_cached_is_holiday_invalidated_on_change() -> None:
+    discriminator = HolidayDiscriminator(is_new_year_day)
+    cached_func = cached_is_holiday(discriminator)
+    assert cached_func(date(2025, 1, 4)) is False
+    assert cached_func(date(2025, 1, 4)) is False
+
+    discriminator.add_is_holiday_funcs(is_saturday_or_sunday)
+    assert cached_func.cache_info().currsize == 0
+    assert cached_func(date(2025, 1, 4)) is True
+    assert cached_func.cache_info().hits == 1
+    assert cached_func.cache_info().misses == 2
+
+    # the discriminator does not keep the cache alive
+    del cached_func
+    discriminator.remove_is_holiday_funcs(is_new_year_day.__name__)
+    assert discriminator._subscribers == {}
+
+
+@pytest.mark.negative
+@pytest.mark.parametrize("maxsize", [0, -1])
+def test_cached_is_holiday_with_invalid_maxsize(maxsize: int) -> None:
+    with pytest.raises(ValueError):
+        cached_is_holiday(is_new_year_day, maxsize=maxsize)
+
+
+@pytest.mark.positive
+def test_compiled_func_properties() -> None:
+    compiled_func = compile_is_holiday(
+        is_saturday_or_sunday,
+        start=datetime(2001, 1, 1, 12),
+        end=date(2100, 12, 31),
+    )
+    assert isinstance(compiled_func, CompiledIsHoliday)
+    assert compiled_func.start == date(2001, 1, 1)
+    assert compiled_func.end == date(2100, 12, 31)
+    # one bit per day
+    assert compiled_func.nbytes == (36524 + 7) // 8
+    assert HolidayDiscriminator(compiled_func).names == [
+        is_saturday_or_sunday.__name__
+    ]
+
+
+@pytest.mark.positive
+@pytest.mark.parametrize("n_days", [1, 7, 8, 9, 16, 17])
+def test_compiled_func_bitmap_boundaries(n_days: int) -> None:
+    def is_holiday(d: date) -> bool:
+        return d.toordinal() % 3 == 0
+
+    start = date(2025, 1, 1)
+    end = start + timedelta(days=n_days - 1)
+    compiled_func = compile_is_holiday(is_holiday, start=start, end=end)
+    for i in range(n_days):
+        d = start + timedelta(days=i)
+        assert compiled_func(d) == is_holiday(d)
+
+
+@pytest.mark.positive
+@pytest.mark.parametrize("mmap", [True, False])
+@pytest.mark.parametrize("with_counts", [True, False])
+def test_save_and_load_compiled(
+    tmp_path: Path,
+    mmap: bool,
+    with_counts: bool,
+) -> None:
+    is_holiday = HolidayDiscriminator(is_saturday_or_sunday, is_between_1231_0103)  # noqa: E501
+    start, end = date(2020, 1, 1), date(2030, 12, 31)
+    compiled_func = compile_is_holiday(is_holiday, start=start, end=end)
+    path = tmp_path / "calendar.bin"
+    compiled_func.save_compiled(path, with_counts=with_counts)
+
+    loaded = load_compiled(path, mmap=mmap, verify=True)
+    assert loaded.start == start
+    assert loaded.end == end
+    assert loaded.nbytes == compiled_func.nbytes
+    assert loaded.fingerprint == compiled_func.fingerprint
+    for d in date_range(start, end):
+        assert loaded(d) == compiled_func(d)
+    assert list(loaded.bizday_counts()) == list(compiled_func.bizday_counts())
+
+
+@pytest.mark.positive
+def test_save_compiled_header(tmp_path: Path) -> None:
+    compiled_func = compile_is_holiday(
+        is_saturday_or_sunday,
+        start=date(2025, 1, 1),
+        end=date(2025, 1, 31),
+    )
+    path = tmp_path / "calendar.bin"
+    compiled_func.save_compiled(path, with_counts=True)
+    data = path.read_bytes()
+    assert data[:8] == b"PYBIZDAY"
+    assert int.from_bytes(data[8:10], "little") == 1  # version
+    assert int.from_bytes(data[10:12], "little") == 1  # with counts
+    assert int.from_bytes(data[12:16], "little") == date(2025, 1, 1).toordinal()  # noqa: E501
+    assert int.from_bytes(data[16:20], "little") == date(2025, 1, 31).toordinal()  # noqa: E501
+    assert data[20] == 0b1100000  # Saturday and Sunday
+    assert data[24:56].hex() == compiled_func.fingerprint
+    # header, bitmap of 31 days, padding and counts of 32 int32
+    assert len(data) == 64 + 8 + 4 * 32
+
+
+@pytest.mark.positive
+def test_load_compiled_with_fallback(
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    compiled_func = compile_is_holiday(
+        is_new_year_day,
+        start=date(2020, 1, 1),
+        end=date(2020, 12, 31),
+    )
+    path = tmp_path / "calendar.bin"
+    compiled_func.save_compiled(path)
+
+    loaded = load_compiled(path, is_holiday=is_new_year_day)
+    assert HolidayDiscriminator(loaded).names == [is_new_year_day.__name__]
+    with caplog.at_level("WARNING"):
+        assert loaded(date(2021, 1, 1)) is True
+    assert "out of the compilation range" in caplog.text
+
+
+@pytest.mark.positive
+@pytest.mark.parametrize("mmap", [True, False])
+def test_load_compiled_extends_range(tmp_path: Path, mmap: bool) -> None:
+    path = tmp_path / "calendar.bin"
+    compile_is_holiday(
+        is_new_year_day,
+        start=date(2020, 1, 1),
+        end=date(2020, 12, 31),
+    ).save_compiled(path, with_counts=True)
+
+    loaded = load_compiled(
+        path,
+        mmap=mmap,
+        is_holiday=is_new_year_day,
+        extend_years=1,
+    )
+    assert loaded(date(2021, 1, 1)) is True
+    assert loaded.end == date(2021, 12, 31)
+    assert loaded(date(2020, 1, 1)) is True
+    assert loaded(date(2020, 1, 2)) is False
+    assert len(loaded.bizday_counts()) == (date(2021, 12, 31) - date(2020, 1, 1)).days + 2  # noqa: E501
+    # the file is not modified
+    assert load_compiled(path).end == date(2020, 12, 31)
+
+
+@pytest.mark.negative
+def test_load_compiled_extend_years_without_fallback(tmp_path: Path) -> None:
+    path = tmp_path / "calendar.bin"
+    compile_is_holiday(
+        is_new_year_day,
+        start=date(2020, 1, 1),
+        end=date(2020, 12, 31),
+    ).save_compiled(path)
+    with pytest.raises(ValueError):
+        load_compiled(path, extend_years=1)
+
+
+@pytest.mark.negative
+def test_load_compiled_without_fallback(tmp_path: Path) -> None:
+    compiled_func = compile_is_holiday(
+        is_new_year_day,
+        start=date(2020, 1, 1),
+        end=date(2020, 12, 31),
+    )
+    path = tmp_path / "calendar.bin"
+    compiled_func.save_compiled(path)
+    loaded = load_compiled(path)
+    with pytest.raises(ValueError):
+        loaded(date(2021, 1, 1))
+
+
+@pytest.mark.negative
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"NOTBIZDAY" + bytes(64),
+        b"PYBIZDAY" + (2).to_bytes(2, "little") + bytes(64),
+    ],
+)
+def test_load_compiled_invalid_file(tmp_path: Path, data: bytes) -> None:
+    path = tmp_path / "calendar.bin"
+    path.write_bytes(data)
+    with pytest.raises(ValueError):
+        load_compiled(path, mmap=False)
+
+
+@pytest.mark.negative
+@pytest.mark.parametrize("mmap", [True, False])
+@pytest.mark.parametrize("with_counts", [True, False])
+@pytest.mark.parametrize("n_removed", [1, 8, 100])
+def test_load_compiled_truncated_file(
+    tmp_path: Path,
+    mmap: bool,
+    with_counts: bool,
+    n_removed: int,
+) -> None:
+    compiled_func = compile_is_holiday(
+        is_new_year_day,
+        start=date(2020, 1, 1),
+        end=date(2020, 12, 31),
+    )
+    path = tmp_path / "calendar.bin"
+    compiled_func.save_compiled(path, with_counts=with_counts)
+    path.write_bytes(path.read_bytes()[:-n_removed])
+    with pytest.raises(ValueError, match="truncated"):
+        load_compiled(path, mmap=mmap)
+
+
+@pytest.mark.negative
+@pytest.mark.parametrize(
+    "start_ordinal, end_ordinal",
+    [
+        (date(2020, 12, 31).toordinal(), date(2020, 1, 1).toordinal()),
+        (0, date(2020, 1, 1).toordinal()),
+        (1, date.max.toordinal() + 1),
+    ],
+)
+def test_load_compiled_invalid_range(
+    tmp_path: Path,
+    start_ordinal: int,
+    end_ordinal: int,
+) -> None:
+    compiled_func = compile_is_holiday(
+        is_new_year_day,
+        start=date(2020, 1, 1),
+        end=date(2020, 12, 31),
+    )
+    path = tmp_path / "calendar.bin"
+    compiled_func.save_compiled(path)
+    data = bytearray(path.read_bytes())
+    data[12:16] = start_ordinal.to_bytes(4, "little")
+    data[16:20] = end_ordinal.to_bytes(4, "little")
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match="Invalid compilation range"):
+        load_compiled(path, mmap=False)
+
+
+@pytest.mark.negative
+def test_load_compiled_verify_fingerprint(tmp_path: Path) -> None:
+    compiled_func = compile_is_holiday(
+        is_new_year_day,
+        start=date(2020, 1, 1),
+        end=date(2020, 12, 31),
+    )
+    path = tmp_path / "calendar.bin"
+    compiled_func.save_compiled(path)
+    data = bytearray(path.read_bytes())
+    data[64] ^= 1  # flip the bit of 2020-01-01
+    path.write_bytes(bytes(data))
+
+    assert load_compiled(path)(date(2020, 1, 1)) is False
+    with pytest.raises(ValueError):
+        load_compiled(path, verify=True)
@@ -0,0 +1,103 @@
+import subprocess
+import sys
+
+import pytest
+
+import pybizday_utils
+
+# budget of the cumulative time to import pybizday_utils in a new process
+IMPORT_TIME_BUDGET_US = 50_000
+EAGER_MODULES = [
+    "pybizday_utils.basic",
+    "pybizday_utils.month",
+    "pybizday_utils.holiday_utils",
+    "pybizday_utils.default_holiday_utils",
+    "dateutil",
+]
+
+
+def _import_time_us(module: str) -> dict[str, int]:
+    """Cumulative import times in microseconds from `python -X importtime`."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.positive
+def test_import_does_not_load_submodules() -> None:
+    times = _import_time_us("pybizday_utils")
+    assert "pybizday_utils" in times
+    for module in EAGER_MODULES:
+        assert module not in times
+
+
+@pytest.mark.positive
+@pytest.mark.heavy
+def test_import_time_is_within_budget() -> None:
+    # the best of a few runs to be robust to noise
+    elapsed = min(
+        _import_time_us("pybizday_utils")["pybizday_utils"] for _ in range(3)
+    )
+    assert elapsed <= IMPORT_TIME_BUDGET_US
+
+
+@pytest.mark.positive
+@pytest.mark.parametrize("name", pybizday_utils.__all__)
+def test_public_names_are_loaded_lazily(name: str) -> None:
+    assert name in dir(pybizday_utils)
+    assert getattr(pybizday_utils, name) is not None
+
+
+@pytest.mark.positive
+def test_lazy_names_are_the_same_objects() -> None:
+    from pybizday_utils import basic, holiday_utils, month
+
+    assert pybizday_utils.get_next_bizday is basic.get_next_bizday
+    assert pybizday_utils.add_months is month.add_months
+    assert pybizday_utils.holiday_utils is holiday_utils
+
+
+@pytest.mark.negative
+@pytest.mark.parametrize("name", ["no_such_name", "_LAZY", "_no_such_module"])
+def test_unknown_name(name: str) -> None:
+    with pytest.raises(AttributeError):
+        getattr(pybizday_utils, name)
+
+
+@pytest.mark.positive
+@pytest.mark.parametrize(
+    "module",
+    [
+        "basic",
+        "month",
+        "utils",
+        "date_range_utils",
+        "business_calendar",
+        "weekmask",
+    ],
+)
+def test_submodules_are_attributes_after_import(module: str) -> None:
+    # in a fresh process, where the submodule has not been imported yet
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import pybizday_utils; "
+            f"print(pybizday_utils.{module}.__name__)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert completed.stdout.strip() == f"pybizday_utils.{module}"
@@ -0,0 +1,231 @@
+from datetime import date, datetime
+from typing import Generator
+
+import pytest
+
+from pybizday_utils import instrumentation
+from pybizday_utils.basic import count_bizdays, get_n_next_bizday, is_bizday
+from pybizday_utils.holiday_utils import HolidayDiscriminator, is_saturday_or_sunday
+from pybizday_utils.month import (
+    add_months,
+    add_years,
+    add_years_months,
+    get_biz_end_of_month,
+    get_month_position,
+)
+from pybizday_utils.weekmask import get_weekmask_calendar
+
+
+def is_first_day(d: date) -> bool:
+    return d.day == 1
+
+
+def is_tenth_day(d: date) -> bool:
+    return d.day == 10
+
+
+@pytest.fixture(autouse=True)
+def restore_instrumentation() -> Generator[None, None, None]:
+    instrumentation.reset_instrumentation()
+    try:
+        yield
+    finally:
+        instrumentation.disable_instrumentation()
+        instrumentation.reset_instrumentation()
+
+
+@pytest.mark.positive
+def test_disabled_by_default() -> None:
+    is_holiday = HolidayDiscriminator(is_first_day)
+    is_bizday(date(2025, 1, 1), is_holiday)
+    assert not instrumentation.is_instrumentation_enabled()
+    assert instrumentation.get_instrumentation_snapshot() == {
+        "enabled": False,
+        "api_calls": {},
+        "rules": {},
+    }
+
+
+@pytest.mark.positive
+def test_rule_calls_and_hits() -> None:
+    is_holiday = HolidayDiscriminator(is_first_day, is_tenth_day)
+    instrumentation.enable_instrumentation()
+    results = [is_holiday(date(2025, 1, day)) for day in range(1, 11)]
+    snapshot = instrumentation.get_instrumentation_snapshot()
+
+    assert results == [True] + [False] * 8 + [True]
+    # is_tenth_day is not called once is_first_day hits
+    assert snapshot["rules"]["is_first_day"]["calls"] == 10
+    assert snapshot["rules"]["is_first_day"]["hits"] == 1
+    assert snapshot["rules"]["is_tenth_day"]["calls"] == 9
+    assert snapshot["rules"]["is_tenth_day"]["hits"] == 1
+    assert all(stats["time"] >= 0 for stats in snapshot["rules"].values())
+
+
+@pytest.mark.positive
+def test_api_calls() -> None:
+    is_holiday = HolidayDiscriminator(is_first_day)
+    with instrumentation.with_instrumentation():
+        for day in range(1, 4):
+            is_bizday(date(2025, 1, day), is_holiday)
+        get_n_next_bizday(date(2025, 1, 1), 3, is_holiday)
+        count_bizdays(date(2025, 1, 1), date(2025, 1, 31), is_holiday)
+        add_months(date(2025, 1, 15), 1, is_holiday)
+    snapshot = instrumentation.get_instrumentation_snapshot()
+
+    assert not snapshot["enabled"]
+    assert snapshot["api_calls"]["is_bizday"] == 3
+    assert snapshot["api_calls"]["get_n_next_bizday"] == 1
+    assert snapshot["api_calls"]["count_bizdays"] == 1
+    assert snapshot["api_calls"]["add_months"] == 1
+    # the functions called by add_months internally are not counted
+    assert "add_years_months" not in snapshot["api_calls"]
+    assert snapshot["rules"]["is_first_day"]["calls"] > 0
+
+
+@pytest.mark.positive
+def test_api_calls_are_counted_only_at_the_outermost_call() -> None:
+    is_holiday = HolidayDiscriminator(is_first_day)
+    with instrumentation.with_instrumentation():
+        add_years_months(date(2024, 1, 31), 0, 1, is_holiday)
+        get_month_position(date(2024, 1, 31), is_holiday)
+        get_biz_end_of_month(date(2024, 1, 15), is_holiday)
+        add_years(datetime(2024, 1, 31, 12), 1, is_holiday)
+        snapshot = instrumentation.get_instrumentation_snapshot()
+    assert snapshot["api_calls"] == {
+        "add_years_months": 1,
+        "get_month_position": 1,
+        "get_biz_end_of_month": 1,
+        "add_years": 1,
+    }
+
+
+@pytest.mark.positive
+def test_reset() -> None:
+    is_holiday = HolidayDiscriminator(is_first_day)
+    with instrumentation.with_instrumentation():
+        is_bizday(date(2025, 1, 1), is_holiday)
+        instrumentation.reset_instrumentation()
+        is_bizday(date(2025, 1, 2), is_holiday)
+    snapshot = instrumentation.get_instrumentation_snapshot()
+    assert snapshot["api_calls"] == {"is_bizday": 1}
+    assert snapshot["rules"]["is_first_day"]["calls"] == 1
+
+
+@pytest.mark.positive
+def test_snapshot_is_a_copy() -> None:
+    is_holiday = HolidayDiscriminator(is_first_day)
+    with instrumentation.with_instrumentation():
+        is_bizday(date(2025, 1, 1), is_holiday)
+        snapshot = instrumentation.get_instrumentation_snapshot()
+        is_bizday(date(2025, 1, 2), is_holiday)
+    assert snapshot["api_calls"] == {"is_bizday": 1}
+    assert snapshot["rules"]["is_first_day"]["calls"] == 1
+
+
+@pytest.mark.positive
+@pytest.mark.parametrize("reset", [True, False])
+def test_with_instrumentation_restores_state(reset: bool) -> None:
+    is_holiday = HolidayDiscriminator(is_first_day)
+    instrumentation.enable_instrumentation()
+    is_bizday(date(2025, 1, 1), is_holiday)
+    with instrumentation.with_instrumentation(reset=reset):
+        is_bizday(date(2025, 1, 2), is_holiday)
+    assert instrumentation.is_instrumentation_enabled()
+    snapshot = instrumentation.get_instrumentation_snapshot()
+    assert snapshot["api_calls"] == {"is_bizday": 1 if reset else 2}
+
+
+@pytest.mark.positive
+def test_instrumented_results_are_the_same() -> None:
+    is_holiday = HolidayDiscriminator(is_first_day, is_tenth_day)
+    dates = [date.fromordinal(date(2025, 1, 1).toordinal() + i) for i in range(60)]  # noqa: E501
+    expected = [is_holiday(d) for d in dates]
+    with instrumentation.with_instrumentation():
+        assert [is_holiday(d) for d in dates] == expected
+
+
+@pytest.mark.negative
+def test_exception_in_rule_is_propagated() -> None:
+    def is_broken(d: date) -> bool:
+        raise RuntimeError("broken")
+
+    is_holiday = HolidayDiscriminator(is_broken)
+    with instrumentation.with_instrumentation():
+        with pytest.raises(RuntimeError):
+            is_holiday(date(2025, 1, 1))
+    assert not instrumentation.is_instrumentation_enabled()
+
+
+@pytest.mark.positive
+def test_weekday_only_rules_are_recorded() -> None:
+    # answered by a WeekmaskCalendar unless the instrumentation is enabled
+    is_holiday = HolidayDiscriminator(is_saturday_or_sunday)
+    expected = get_n_next_bizday(date(2025, 1, 1), 10, is_holiday)
+    with instrumentation.with_instrumentation():
+        assert get_n_next_bizday(date(2025, 1, 1), 10, is_holiday) == expected
+        assert add_months(date(2025, 1, 31), 1, is_holiday) == date(2025, 2, 28)  # noqa: E501
+        snapshot = instrumentation.get_instrumentation_snapshot()
+    assert snapshot["api_calls"] == {"get_n_next_bizday": 1, "add_months": 1}
+    # 2025-01-01 to 2025-01-15, and around the ends of January and February
+    assert snapshot["rules"]["is_saturday_or_sunday"]["calls"] > 14
+    assert snapshot["rules"]["is_saturday_or_sunday"]["hits"] >= 4
+
+
+@pytest.mark.positive
+@pytest.mark.use_global_default_holiday_discriminator
+def test_rules_of_global_default_are_recorded() -> None:
+    with instrumentation.with_instrumentation():
+        get_n_next_bizday(date(2025, 1, 1), 10)
+        snapshot = instrumentation.get_instrumentation_snapshot()
+    assert "is_saturday_or_sunday" in snapshot["rules"]
+
+
+@pytest.mark.positive
+def test_explicit_calendar_is_used_while_instrumented() -> None:
+    calendar = get_weekmask_calendar(is_saturday_or_sunday)
+    assert calendar is not None
+    with instrumentation.with_instrumentation():
+        get_n_next_bizday(date(2025, 1, 1), 10, calendar)
+        snapshot = instrumentation.get_instrumentation_snapshot()
+    assert snapshot["api_calls"] == {"get_n_next_bizday": 1}
+    assert snapshot["rules"] == {}
+
+
+@pytest.mark.positive
+def test_rules_of_the_same_name_are_recorded_separately() -> None:
+    first = HolidayDiscriminator(lambda d: d.day == 1)
+    tenth = HolidayDiscriminator(lambda d: d.day == 10)
+    company = HolidayDiscriminator(company=is_first_day)
+    other_company = HolidayDiscriminator(company=is_tenth_day)
+    with instrumentation.with_instrumentation():
+        for day in range(1, 11):
+            first(date(2025, 1, day))
+            company(date(2025, 1, day))
+        tenth(date(2025, 1, 10))
+        other_company(date(2025, 1, 10))
+        snapshot = instrumentation.get_instrumentation_snapshot()
+
+    rules = snapshot["rules"]
+    assert len(rules) == 4
+    lambdas = [stats for name, stats in rules.items() if name.startswith("<lambda> (")]  # noqa: E501
+    assert sorted((s["calls"], s["hits"]) for s in lambdas) == [(1, 1), (10, 1)]  # noqa: E501
+    companies = {
+        name: stats for name, stats in rules.items() if name.startswith("company (")  # noqa: E501
+    }
+    assert len(companies) == 2
+    (first_day,) = (name for name in companies if ".is_first_day at " in name)
+    assert companies[first_day]["calls"] == 10
+    (tenth_day,) = (name for name in companies if ".is_tenth_day at " in name)
+    assert companies[tenth_day]["calls"] == 1
+
+
+@pytest.mark.positive
+def test_rule_of_a_unique_name_is_reported_by_the_name() -> None:
+    is_holiday = HolidayDiscriminator(is_first_day)
+    with instrumentation.with_instrumentation():
+        is_holiday(date(2025, 1, 1))
+        is_holiday(date(2025, 1, 2))
+        snapshot = instrumentation.get_instrumentation_snapshot()
+    assert list(snapshot["rules"]) == ["is_first_day"]
+    assert snapshot["rules"]["is_first_day"]["calls"] == 2
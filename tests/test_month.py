@@ -5,12 +5,15 @@ import pytest
 from pytest_mock import MockerFixture
 
 import pybizday_utils.month
+from pybizday_utils.holiday_utils import is_saturday_or_sunday
 from pybizday_utils.month import (
+    MonthPosition,
     add_months,
     add_years,
     add_years_months,
     get_biz_end_of_month,
     get_biz_start_of_month,
+    get_month_position,
     is_biz_end_of_month,
     is_biz_start_of_month,
 )
@@ -503,8 +506,9 @@ def test_add_months(
     bizsom2bizsom: bool,
     mocker: MockerFixture,
 ) -> None:
-    # Spy on the add_years_months function to verify its usage
-    add_years_months_spy = mocker.spy(pybizday_utils.month, "add_years_months")
+    # Spy on the implementation of add_years_months to verify its usage,
+    # which add_months and add_years call without counting add_years_months
+    add_years_months_spy = mocker.spy(pybizday_utils.month, "_add_years_months")
     # Call the add_months function
     _ = add_months(
         date,
@@ -521,7 +525,6 @@ def test_add_months(
         is_holiday,
         bizeom2bizeom=bizeom2bizeom,
         bizsom2bizsom=bizsom2bizsom,
-        datetime_handler=datetime.date,
     )
 
 
@@ -595,8 +598,9 @@ def test_add_years(
     bizsom2bizsom: bool,
     mocker: MockerFixture,
 ) -> None:
-    # Spy on the add_years_months function to verify its usage
-    add_years_months_spy = mocker.spy(pybizday_utils.month, "add_years_months")
+    # Spy on the implementation of add_years_months to verify its usage,
+    # which add_months and add_years call without counting add_years_months
+    add_years_months_spy = mocker.spy(pybizday_utils.month, "_add_years_months")
     # Call the add_years function
     _ = add_years(
         date,
@@ -613,7 +617,6 @@ def test_add_years(
         is_holiday,
         bizeom2bizeom=bizeom2bizeom,
         bizsom2bizsom=bizsom2bizsom,
-        datetime_handler=datetime.date,
     )
 
 
@@ -821,3 +824,55 @@ def test_add_years_months_with_datetime_obj_should_return_the_same_result_of_add
     )
     expected = add_years_months(handled, years, months, is_holiday)
     assert actual == expected
+
+
+@pytest.mark.positive
+@pytest.mark.parametrize(
+    "d,is_holiday,expected",
+    [
+        (date(2025, 1, 1), is_saturday_or_sunday, MonthPosition.FIRST),
+        (date(2025, 1, 15), is_saturday_or_sunday, MonthPosition.INTERIOR),
+        (date(2025, 1, 31), is_saturday_or_sunday, MonthPosition.LAST),
+        (date(2025, 2, 1), is_saturday_or_sunday, MonthPosition.HOLIDAY),
+        (date(2025, 2, 3), is_saturday_or_sunday, MonthPosition.FIRST),
+        (date(2025, 2, 28), lambda d: d.month == 2 and d.day != 14, MonthPosition.HOLIDAY),  # noqa: E501
+        (date(2025, 2, 14), lambda d: d.month == 2 and d.day != 14, MonthPosition.FIRST | MonthPosition.LAST),  # noqa: E501
+        (datetime(2025, 1, 31, 23, 59), lambda d: d.weekday() >= 5, MonthPosition.LAST),  # noqa: E501
+    ],
+)
+def test_get_month_position(
+    d: date,
+    is_holiday: Callable[[date], bool],
+    expected: MonthPosition,
+) -> None:
+    position = get_month_position(d, is_holiday)
+    assert position == expected
+    assert (MonthPosition.FIRST in position) == is_biz_start_of_month(d, is_holiday)  # noqa: E501
+    assert (MonthPosition.LAST in position) == is_biz_end_of_month(d, is_holiday)  # noqa: E501
+
+
+@pytest.mark.positive
+@pytest.mark.parametrize("bizeom2bizeom", [True, False])
+@pytest.mark.parametrize("bizsom2bizsom", [True, False])
+def test_add_years_months_evaluates_is_holiday_of_date_once(
+    bizeom2bizeom: bool,
+    bizsom2bizsom: bool,
+) -> None:
+    calls: list[date] = []
+
+    def is_holiday(d: date) -> bool:
+        calls.append(d)
+        return d.weekday() >= 5
+
+    for i in range(62):
+        d = date(2025, 1, 1) + timedelta(days=i)
+        calls.clear()
+        add_years_months(
+            d,
+            0,
+            1,
+            is_holiday,
+            bizeom2bizeom=bizeom2bizeom,
+            bizsom2bizsom=bizsom2bizsom,
+        )
+        assert calls.count(d) == (1 if bizeom2bizeom or bizsom2bizsom else 0)
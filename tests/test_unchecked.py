@@ -0,0 +1,116 @@
+from datetime import date, timedelta
+
+import pytest
+
+from pybizday_utils import basic, instrumentation, unchecked
+from pybizday_utils.business_calendar import BusinessCalendar
+from pybizday_utils.holiday_utils import (
+    HolidayDiscriminator,
+    IsHolidayFuncType,
+    compile_is_holiday,
+    is_between_1231_0103,
+    is_saturday_or_sunday,
+)
+
+START = date(2024, 12, 1)
+END = date(2025, 2, 28)
+IS_HOLIDAY: IsHolidayFuncType = HolidayDiscriminator(
+    is_saturday_or_sunday,
+    is_between_1231_0103,
+)
+DATES = [date(2024, 12, 20) + timedelta(days=i) for i in range(20)]
+IS_HOLIDAYS = [
+    IS_HOLIDAY,
+    is_saturday_or_sunday,
+    compile_is_holiday(IS_HOLIDAY, START, END),
+    BusinessCalendar(IS_HOLIDAY, START, END),
+]
+
+
+@pytest.mark.positive
+@pytest.mark.parametrize("is_holiday", IS_HOLIDAYS)
+@pytest.mark.parametrize("d", DATES)
+def test_same_results_as_basic(d: date, is_holiday: IsHolidayFuncType) -> None:
+    assert unchecked.is_bizday(d, is_holiday) == basic.is_bizday(d, is_holiday)  # noqa: E501
+    assert unchecked.get_next_bizday(d, is_holiday) == basic.get_next_bizday(d, is_holiday)  # noqa: E501
+    assert unchecked.get_prev_bizday(d, is_holiday) == basic.get_prev_bizday(d, is_holiday)  # noqa: E501
+    for n in [1, 3, -3]:
+        assert unchecked.get_n_next_bizday(d, n, is_holiday) == basic.get_n_next_bizday(d, n, is_holiday)  # noqa: E501
+        assert unchecked.get_n_prev_bizday(d, n, is_holiday) == basic.get_n_prev_bizday(d, n, is_holiday)  # noqa: E501
+
+
+@pytest.mark.positive
+@pytest.mark.parametrize("is_holiday", IS_HOLIDAYS)
+@pytest.mark.parametrize("include_start", [True, False])
+@pytest.mark.parametrize("include_end", [True, False])
+@pytest.mark.parametrize(
+    "start, end",
+    [
+        (date(2024, 12, 20), date(2025, 1, 10)),
+        (date(2025, 1, 10), date(2024, 12, 20)),
+        (date(2025, 1, 1), date(2025, 1, 1)),
+    ],
+)
+def test_range_and_count_same_as_basic(
+    start: date,
+    end: date,
+    include_start: bool,
+    include_end: bool,
+    is_holiday: IsHolidayFuncType,
+) -> None:
+    assert list(
+        unchecked.bizday_range(
+            start,
+            end,
+            is_holiday,
+            include_start=include_start,
+            include_end=include_end,
+        )
+    ) == list(
+        basic.bizday_range(
+            start,
+            end,
+            is_holiday,
+            include_start=include_start,
+            include_end=include_end,
+        )
+    )
+    assert unchecked.count_bizdays(
+        start,
+        end,
+        is_holiday,
+        include_start=include_start,
+        include_end=include_end,
+    ) == basic.count_bizdays(
+        start,
+        end,
+        is_holiday,
+        include_start=include_start,
+        include_end=include_end,
+    )
+
+
+@pytest.mark.positive
+@pytest.mark.use_global_default_holiday_discriminator
+def test_default_is_holiday() -> None:
+    assert unchecked.is_bizday(date(2025, 3, 21)) is True
+    assert unchecked.is_bizday(date(2025, 3, 22)) is False
+    assert unchecked.get_next_bizday(date(2025, 3, 21)) == date(2025, 3, 24)
+
+
+@pytest.mark.positive
+def test_not_instrumented() -> None:
+    with instrumentation.with_instrumentation():
+        unchecked.is_bizday(date(2025, 1, 1), is_saturday_or_sunday)
+        unchecked.get_next_bizday(date(2025, 1, 1), is_saturday_or_sunday)
+    assert instrumentation.get_instrumentation_snapshot()["api_calls"] == {}
+
+
+@pytest.mark.negative
+def test_errors_are_the_same_as_basic() -> None:
+    with pytest.raises(ValueError, match="No next business day found"):
+        unchecked.get_next_bizday(date.max, is_saturday_or_sunday)
+    with pytest.raises(ValueError, match="No previous business day found"):
+        unchecked.get_prev_bizday(date.min, is_saturday_or_sunday)
+    with pytest.raises(ValueError, match="is holiday"):
+        unchecked.get_n_next_bizday(date(2025, 3, 22), 0, is_saturday_or_sunday)  # noqa: E501
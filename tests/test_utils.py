@@ -3,7 +3,7 @@ from typing import Any
 
 import pytest
 
-from pybizday_utils.utils import validate_date_type
+from pybizday_utils.utils import add_calendar_months, validate_date_type
 
 
 @pytest.mark.parametrize(
@@ -39,3 +39,49 @@ def test_validate_date_type_with_invalid_types(invalid_date: Any) -> None:
         validate_date_type(invalid_date)
     assert "must be a datetime.date or datetime.datetime object" in str(exc_info.value)  # noqa: E501
     assert str(type(invalid_date)) in str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    "date",
+    [
+        datetime.date(2024, 1, 31),
+        datetime.date(2024, 2, 29),
+        datetime.date(2023, 3, 31),
+        datetime.date(2000, 12, 31),
+        datetime.date(1900, 1, 29),
+        datetime.datetime(2025, 5, 31, 12, 30),
+    ],
+)
+@pytest.mark.parametrize(
+    "years,months",
+    [(0, 0), (0, 1), (0, -1), (1, 1), (-1, 13), (0, 25), (3, -40), (-100, 0)],
+)
+def test_add_calendar_months_is_the_same_as_relativedelta(
+    date: datetime.date,
+    years: int,
+    months: int,
+) -> None:
+    """Test add_calendar_months against dateutil.relativedelta."""
+    relativedelta = pytest.importorskip("dateutil.relativedelta").relativedelta
+    expected = date + relativedelta(years=years, months=months)
+    actual = add_calendar_months(date, years, months)
+    assert actual == expected
+    assert type(actual) is type(expected)
+
+
+@pytest.mark.parametrize(
+    "date,years,months",
+    [
+        (datetime.date(9999, 12, 1), 0, 1),
+        (datetime.date(1, 1, 1), 0, -1),
+        (datetime.date(2025, 1, 1), 10000, 0),
+    ],
+)
+def test_add_calendar_months_out_of_range(
+    date: datetime.date,
+    years: int,
+    months: int,
+) -> None:
+    """Test add_calendar_months raises ValueError out of the range of date."""
+    with pytest.raises(ValueError):
+        add_calendar_months(date, years, months)
@@ -0,0 +1,389 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from pybizday_utils import basic, month
+from pybizday_utils.business_calendar import BusinessCalendar
+from pybizday_utils.holiday_utils import (
+    HolidayDiscriminator,
+    IsHolidayFuncType,
+    compile_is_holiday,
+    is_between_1231_0103,
+    is_saturday_or_sunday,
+)
+from pybizday_utils.weekmask import WeekmaskCalendar
+
+np = pytest.importorskip("numpy")
+
+from pybizday_utils import vectorized  # noqa: E402
+
+START = date(2024, 12, 1)
+END = date(2025, 2, 28)
+IS_HOLIDAY: IsHolidayFuncType = HolidayDiscriminator(
+    is_saturday_or_sunday,
+    is_between_1231_0103,
+)
+# from 2024-11-01 to 2025-03-31, i.e. including dates out of [START, END]
+DATES = [date(2024, 11, 1) + timedelta(days=i) for i in range(151)]
+
+
+def _expected(
+    dates: list[date],
+    is_holiday: IsHolidayFuncType,
+) -> list[bool]:
+    return [basic.is_bizday(d, is_holiday) for d in dates]
+
+
+@pytest.mark.positive
+@pytest.mark.parametrize(
+    "is_holiday",
+    [
+        IS_HOLIDAY,
+        is_saturday_or_sunday,
+        HolidayDiscriminator(is_saturday_or_sunday),
+        compile_is_holiday(IS_HOLIDAY, START, END),
+        BusinessCalendar(IS_HOLIDAY, START, END),
+        WeekmaskCalendar((5, 6), [date(2025, 1, 1), date(2025, 1, 4)]),
+        WeekmaskCalendar(()),
+    ],
+)
+def test_is_bizday(is_holiday: IsHolidayFuncType) -> None:
+    dates = np.array(DATES, dtype="datetime64[D]")
+    actual = vectorized.is_bizday(dates, is_holiday)
+    assert actual.dtype == bool
+    assert actual.tolist() == _expected(DATES, is_holiday)
+
+
+@pytest.mark.positive
+@pytest.mark.parametrize(
+    "dates",
+    [
+        DATES,
+        np.array(DATES, dtype="datetime64[D]"),
+        np.array(DATES, dtype="datetime64[ns]"),
+        np.array([d.toordinal() for d in DATES]),
+    ],
+)
+def test_is_bizday_with_various_inputs(dates: object) -> None:
+    actual = vectorized.is_bizday(dates, IS_HOLIDAY)  # type: ignore[arg-type]
+    assert actual.tolist() == _expected(DATES, IS_HOLIDAY)
+
+
+@pytest.mark.positive
+def test_is_bizday_with_datetime64_of_time() -> None:
+    dates = np.array([datetime(2025, 1, 4, 23, 59), datetime(2025, 1, 6, 9)], dtype="datetime64[m]")  # noqa: E501
+    assert vectorized.is_bizday(dates, IS_HOLIDAY).tolist() == [False, True]
+
+
+@pytest.mark.positive
+def test_is_bizday_keeps_shape() -> None:
+    dates = np.array(DATES[:150], dtype="datetime64[D]").reshape(10, 15)
+    actual = vectorized.is_bizday(dates, IS_HOLIDAY)
+    assert actual.shape == (10, 15)
+    assert actual.ravel().tolist() == _expected(DATES[:150], IS_HOLIDAY)
+
+
+@pytest.mark.positive
+@pytest.mark.use_global_default_holiday_discriminator
+def test_is_bizday_with_global_default() -> None:
+    dates = np.array(DATES, dtype="datetime64[D]")
+    assert vectorized.is_bizday(dates).tolist() == [
+        basic.is_bizday(d) for d in DATES
+    ]
+
+
+@pytest.mark.positive
+def test_is_bizday_calls_is_holiday_once_per_unique_date() -> None:
+    calls: list[date] = []
+
+    def is_holiday(d: date) -> bool:
+        calls.append(d)
+        return bool(IS_HOLIDAY(d))
+
+    dates = np.array(DATES * 3, dtype="datetime64[D]")
+    actual = vectorized.is_bizday(dates, is_holiday)
+    assert actual.tolist() == _expected(DATES * 3, IS_HOLIDAY)
+    assert sorted(calls) == DATES
+
+
+@pytest.mark.positive
+def test_is_bizday_calls_is_holiday_only_out_of_compiled_range() -> None:
+    calls: list[date] = []
+
+    def is_holiday(d: date) -> bool:
+        calls.append(d)
+        return bool(IS_HOLIDAY(d))
+
+    compiled = compile_is_holiday(is_holiday, START, END)
+    calls.clear()
+    dates = np.array(DATES, dtype="datetime64[D]")
+    assert vectorized.is_bizday(dates, compiled).tolist() == _expected(DATES, IS_HOLIDAY)  # noqa: E501
+    assert sorted(calls) == [d for d in DATES if not START <= d <= END]
+
+
+@pytest.mark.positive
+def test_is_bizday_uses_extended_range_of_compiled() -> None:
+    calls: list[date] = []
+
+    def is_holiday(d: date) -> bool:
+        calls.append(d)
+        return bool(IS_HOLIDAY(d))
+
+    compiled = compile_is_holiday(is_holiday, START, END, extend_years=1)
+    dates = np.array(DATES, dtype="datetime64[D]")
+    assert vectorized.is_bizday(dates[30:60], compiled).tolist() == _expected(DATES[30:60], IS_HOLIDAY)  # noqa: E501
+    # the first date out of the range extends it
+    assert vectorized.is_bizday(dates, compiled).tolist() == _expected(DATES, IS_HOLIDAY)  # noqa: E501
+    assert compiled.start <= DATES[0] and DATES[-1] <= compiled.end
+    calls.clear()
+    assert vectorized.is_bizday(dates, compiled).tolist() == _expected(DATES, IS_HOLIDAY)  # noqa: E501
+    assert vectorized.count_bizdays(dates[:1], dates[-1:], compiled).tolist() == [  # noqa: E501
+        basic.count_bizdays(DATES[0], DATES[-1], IS_HOLIDAY)
+    ]
+    assert calls == []
+    # the cached table is rebuilt for the extended range
+    assert len(vectorized._holiday_tables[compiled][1]) == (compiled.end - compiled.start).days + 1  # noqa: E501
+
+
+@pytest.mark.positive
+@pytest.mark.parametrize(
+    "is_holiday",
+    [
+        IS_HOLIDAY,
+        is_saturday_or_sunday,
+        compile_is_holiday(IS_HOLIDAY, START, END),
+        BusinessCalendar(IS_HOLIDAY, START, END),
+        BusinessCalendar(IS_HOLIDAY, date(2024, 10, 1), date(2025, 4, 30)),
+        WeekmaskCalendar((5, 6), [date(2025, 1, 1), date(2025, 1, 4)]),
+        WeekmaskCalendar(range(7)),
+    ],
+)
+@pytest.mark.parametrize("include_start", [True, False])
+@pytest.mark.parametrize("include_end", [True, False])
+def test_count_bizdays(
+    is_holiday: IsHolidayFuncType,
+    include_start: bool,
+    include_end: bool,
+) -> None:
+    pairs = [(s, e) for s in DATES[::7] for e in DATES[::5]]
+    pairs += [(d, d) for d in DATES[:7]]
+    pairs += [(d, d + timedelta(days=1)) for d in DATES[:7]]
+    pairs += [(d + timedelta(days=1), d) for d in DATES[:7]]
+    starts = np.array([s for s, _ in pairs], dtype="datetime64[D]")
+    ends = np.array([e for _, e in pairs], dtype="datetime64[D]")
+    actual = vectorized.count_bizdays(
+        starts,
+        ends,
+        is_holiday,
+        include_start=include_start,
+        include_end=include_end,
+    )
+    assert actual.dtype == np.int64
+    assert actual.tolist() == [
+        basic.count_bizdays(
+            s,
+            e,
+            is_holiday,
+            include_start=include_start,
+            include_end=include_end,
+        )
+        for s, e in pairs
+    ]
+
+
+@pytest.mark.positive
+def test_count_bizdays_with_broadcast() -> None:
+    starts = np.array(DATES, dtype="datetime64[D]")
+    actual = vectorized.count_bizdays(starts, np.datetime64("2025-01-15"), IS_HOLIDAY)  # noqa: E501
+    assert actual.tolist() == [
+        basic.count_bizdays(d, date(2025, 1, 15), IS_HOLIDAY) for d in DATES
+    ]
+
+
+@pytest.mark.positive
+def test_count_bizdays_with_empty_arrays() -> None:
+    empty = np.array([], dtype="datetime64[D]")
+    assert vectorized.count_bizdays(empty, empty, IS_HOLIDAY).tolist() == []
+
+
+@pytest.mark.negative
+def test_count_bizdays_with_mismatched_shapes() -> None:
+    with pytest.raises(ValueError):
+        vectorized.count_bizdays(
+            np.array(DATES[:3], dtype="datetime64[D]"),
+            np.array(DATES[:4], dtype="datetime64[D]"),
+            IS_HOLIDAY,
+        )
+
+
+@pytest.mark.positive
+@pytest.mark.parametrize(
+    "is_holiday",
+    [
+        IS_HOLIDAY,
+        is_saturday_or_sunday,
+        compile_is_holiday(IS_HOLIDAY, START, END),
+        BusinessCalendar(IS_HOLIDAY, START, END),
+        WeekmaskCalendar((5, 6), [date(2025, 1, 1), date(2025, 1, 6)]),
+    ],
+)
+@pytest.mark.parametrize("n", [1, 2, 5, 30, 200, -1, -2, -5, -30, -200])
+def test_offset_bizdays(is_holiday: IsHolidayFuncType, n: int) -> None:
+    dates = np.array(DATES, dtype="datetime64[D]")
+    actual = vectorized.offset_bizdays(dates, n, is_holiday)
+    assert actual.dtype == np.dtype("datetime64[D]")
+    assert actual.tolist() == [
+        basic.get_n_next_bizday(d, n, is_holiday) for d in DATES
+    ]
+
+
+@pytest.mark.positive
+def test_offset_bizdays_with_array_of_n() -> None:
+    dates = np.array(DATES, dtype="datetime64[D]")
+    n = np.array([(i % 11) - 5 for i in range(len(DATES))])
+    n[n == 0] = 1
+    actual = vectorized.offset_bizdays(dates, n, IS_HOLIDAY)
+    assert actual.tolist() == [
+        basic.get_n_next_bizday(d, int(k), IS_HOLIDAY) for d, k in zip(DATES, n, strict=True)  # noqa: E501
+    ]
+
+
+@pytest.mark.positive
+def test_offset_bizdays_with_zero() -> None:
+    bizdays = [d for d in DATES if not IS_HOLIDAY(d)]
+    dates = np.array(bizdays, dtype="datetime64[D]")
+    assert vectorized.offset_bizdays(dates, 0, IS_HOLIDAY).tolist() == bizdays
+
+
+@pytest.mark.negative
+def test_offset_bizdays_with_zero_on_holiday() -> None:
+    dates = np.array([date(2025, 1, 6), date(2025, 1, 4)], dtype="datetime64[D]")  # noqa: E501
+    with pytest.raises(ValueError):
+        vectorized.offset_bizdays(dates, 0, IS_HOLIDAY)
+    actual = vectorized.offset_bizdays(dates, 0, IS_HOLIDAY, errors="coerce")
+    assert actual[0] == np.datetime64("2025-01-06")
+    assert np.isnat(actual[1])
+
+
+@pytest.mark.positive
+def test_offset_bizdays_falls_back_out_of_span() -> None:
+    def is_holiday(d: date) -> bool:
+        # only one business day a month
+        return d.day != 15
+
+    dates = np.array([date(2025, 1, 1), date(2025, 3, 31)], dtype="datetime64[D]")  # noqa: E501
+    actual = vectorized.offset_bizdays(dates, np.array([3, -2]), is_holiday)
+    assert actual.tolist() == [date(2025, 3, 15), date(2025, 2, 15)]
+
+
+@pytest.mark.negative
+def test_offset_bizdays_no_bizday_found() -> None:
+    dates = np.array([date(2025, 1, 1), date.max - timedelta(days=1)], dtype="datetime64[D]")  # noqa: E501
+    with pytest.raises(ValueError):
+        vectorized.offset_bizdays(dates, 2, WeekmaskCalendar(()))
+    actual = vectorized.offset_bizdays(
+        dates,
+        2,
+        WeekmaskCalendar(()),
+        errors="coerce",
+    )
+    assert actual[0] == np.datetime64("2025-01-03")
+    assert np.isnat(actual[1])
+
+
+@pytest.mark.negative
+def test_offset_bizdays_with_invalid_arguments() -> None:
+    dates = np.array(DATES[:3], dtype="datetime64[D]")
+    with pytest.raises(TypeError):
+        vectorized.offset_bizdays(dates, 1.5, IS_HOLIDAY)
+    with pytest.raises(ValueError):
+        vectorized.offset_bizdays(dates, 1, IS_HOLIDAY, errors="ignore")  # type: ignore[arg-type]  # noqa: E501
+    with pytest.raises(ValueError):
+        vectorized.offset_bizdays(dates, np.array([1, 2]), IS_HOLIDAY)
+
+
+@pytest.mark.positive
+@pytest.mark.parametrize(
+    "is_holiday",
+    [
+        IS_HOLIDAY,
+        is_saturday_or_sunday,
+        compile_is_holiday(IS_HOLIDAY, START, END),
+        BusinessCalendar(IS_HOLIDAY, START, END),
+        WeekmaskCalendar((5, 6), [date(2025, 1, 31), date(2025, 2, 3)]),
+    ],
+)
+@pytest.mark.parametrize("years, months", [(0, 1), (0, -1), (1, 0), (-1, 3), (0, 13), (2, -25)])  # noqa: E501
+@pytest.mark.parametrize("bizeom2bizeom", [True, False])
+@pytest.mark.parametrize("bizsom2bizsom", [True, False])
+def test_add_years_months(
+    is_holiday: IsHolidayFuncType,
+    years: int,
+    months: int,
+    bizeom2bizeom: bool,
+    bizsom2bizsom: bool,
+) -> None:
+    dates = np.array(DATES, dtype="datetime64[D]")
+    actual = vectorized.add_years_months(
+        dates,
+        years,
+        months,
+        is_holiday,
+        bizeom2bizeom=bizeom2bizeom,
+        bizsom2bizsom=bizsom2bizsom,
+    )
+    assert actual.dtype == np.dtype("datetime64[D]")
+    assert actual.tolist() == [
+        month.add_years_months(
+            d,
+            years,
+            months,
+            is_holiday,
+            bizeom2bizeom=bizeom2bizeom,
+            bizsom2bizsom=bizsom2bizsom,
+        )
+        for d in DATES
+    ]
+
+
+@pytest.mark.positive
+def test_add_years_and_add_months() -> None:
+    dates = np.array(DATES, dtype="datetime64[D]")
+    n = np.arange(len(DATES)) % 7 - 3
+    assert vectorized.add_years(dates, n, IS_HOLIDAY).tolist() == [
+        month.add_years(d, int(k), IS_HOLIDAY)
+        for d, k in zip(DATES, n, strict=True)
+    ]
+    assert vectorized.add_months(dates, n, IS_HOLIDAY, bizsom2bizsom=True).tolist() == [  # noqa: E501
+        month.add_months(d, int(k), IS_HOLIDAY, bizsom2bizsom=True)
+        for d, k in zip(DATES, n, strict=True)
+    ]
+
+
+@pytest.mark.positive
+def test_add_years_months_falls_back_out_of_span() -> None:
+    def is_holiday(d: date) -> bool:
+        # only one business day a year
+        return (d.month, d.day) != (6, 15)
+
+    dates = np.array([date(2025, 6, 15), date(2025, 6, 16)], dtype="datetime64[D]")  # noqa: E501
+    actual = vectorized.add_years_months(
+        dates,
+        0,
+        1,
+        is_holiday,
+        bizsom2bizsom=True,
+    )
+    assert actual.tolist() == [
+        month.add_years_months(d, 0, 1, is_holiday, bizsom2bizsom=True)
+        for d in [date(2025, 6, 15), date(2025, 6, 16)]
+    ]
+
+
+@pytest.mark.negative
+def test_add_years_months_out_of_date_range() -> None:
+    dates = np.array([date(9999, 1, 4)], dtype="datetime64[D]")
+    with pytest.raises(ValueError):
+        vectorized.add_years_months(dates, 1, 0, IS_HOLIDAY)
+    with pytest.raises(TypeError):
+        vectorized.add_years_months(dates, 0.5, 0, IS_HOLIDAY)
@@ -0,0 +1,216 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pybizday_utils import basic, month
+from pybizday_utils.holiday_utils import (
+    HolidayDiscriminator,
+    IsHolidayFuncType,
+    is_new_year_day,
+    is_saturday_or_sunday,
+)
+from pybizday_utils.weekmask import WeekmaskCalendar, get_weekmask_calendar
+
+HOLIDAYS = [
+    date(2024, 12, 31),
+    date(2025, 1, 1),
+    date(2025, 1, 2),
+    date(2025, 1, 3),
+    date(2025, 1, 4),  # Saturday
+    date(2025, 1, 13),
+    datetime(2025, 2, 11, 9),
+]
+DATES = [
+    date(2024, 12, 27),
+    date(2024, 12, 31),
+    date(2025, 1, 1),
+    date(2025, 1, 5),
+    date(2025, 1, 6),
+    date(2025, 1, 13),
+    datetime(2025, 2, 10, 12),
+]
+
+
+def _brute_force(
+    weekend: tuple[int, ...],
+    holidays: list[date | datetime],
+) -> IsHolidayFuncType:
+    holidays_ = {d.date() if isinstance(d, datetime) else d for d in holidays}
+
+    def is_holiday(d: date | datetime) -> bool:
+        if isinstance(d, datetime):
+            d = d.date()
+        return d.weekday() in weekend or d in holidays_
+
+    return is_holiday
+
+
+@pytest.mark.positive
+@pytest.mark.parametrize("weekend", [(), (5, 6), (4, 5), (0, 2, 4, 6)])
+@pytest.mark.parametrize("holidays", [[], HOLIDAYS])
+def test_weekmask_calendar(
+    weekend: tuple[int, ...],
+    holidays: list[date | datetime],
+) -> None:
+    calendar = WeekmaskCalendar(weekend, holidays)
+    is_holiday = _brute_force(weekend, holidays)
+    for d in DATES:
+        for offset in range(-7, 8):
+            d_ = d + timedelta(days=offset)
+            assert calendar(d_) == is_holiday(d_)
+        for n in [0, 1, 2, 3, 7, 30, -1, -2, -3, -7, -30]:
+            if n == 0 and is_holiday(d):
+                continue
+            assert calendar.n_next(d, n) == basic.get_n_next_bizday(d, n, is_holiday)  # noqa: E501
+            assert calendar.n_prev(d, n) == basic.get_n_prev_bizday(d, n, is_holiday)  # noqa: E501
+        for end in DATES:
+            for include_start in [True, False]:
+                for include_end in [True, False]:
+                    assert list(
+                        calendar.bizday_range(
+                            d,
+                            end,
+                            include_start=include_start,
+                            include_end=include_end,
+                        )
+                    ) == list(
+                        basic.bizday_range(
+                            d,
+                            end,
+                            is_holiday,
+                            include_start=include_start,
+                            include_end=include_end,
+                        )
+                    )
+                    assert calendar.count_bizdays(
+                        d,
+                        end,
+                        include_start=include_start,
+                        include_end=include_end,
+                    ) == basic.count_bizdays(
+                        d,
+                        end,
+                        is_holiday,
+                        include_start=include_start,
+                        include_end=include_end,
+                    )
+
+
+@pytest.mark.positive
+def test_weekmask_calendar_properties() -> None:
+    calendar = WeekmaskCalendar((6, 5), [datetime(2025, 1, 1, 9)])
+    assert calendar.weekend == frozenset({5, 6})
+    assert calendar.holidays == frozenset({date(2025, 1, 1)})
+
+
+@pytest.mark.positive
+def test_weekmask_calendar_large_offset() -> None:
+    calendar = WeekmaskCalendar()
+    d = date(2025, 1, 1)
+    assert calendar.n_next(d, 100000) == date(2408, 4, 23)
+    assert calendar.count_bizdays(d, date(2408, 4, 23), include_start=False) == 100000  # noqa: E501
+    assert calendar.n_prev(date(2408, 4, 23), 100000) == d
+
+
+@pytest.mark.negative
+def test_weekmask_calendar_out_of_date_range() -> None:
+    calendar = WeekmaskCalendar(())
+    with pytest.raises(ValueError):
+        calendar.next(date.max)
+    with pytest.raises(ValueError):
+        calendar.n_next(date.max - timedelta(days=1), 2)
+    with pytest.raises(ValueError):
+        calendar.prev(date.min)
+    with pytest.raises(ValueError):
+        calendar.n_prev(date.min + timedelta(days=1), 2)
+
+
+@pytest.mark.negative
+def test_weekmask_calendar_without_bizday() -> None:
+    calendar = WeekmaskCalendar(range(7))
+    with pytest.raises(ValueError):
+        calendar.next(date(2025, 1, 1))
+    with pytest.raises(ValueError):
+        calendar.prev(date(2025, 1, 1))
+    assert list(calendar.bizday_range(date(2025, 1, 1), date(2025, 2, 1))) == []  # noqa: E501
+    assert calendar.count_bizdays(date(2025, 1, 1), date(2025, 2, 1)) == 0
+
+
+@pytest.mark.negative
+@pytest.mark.parametrize("weekend", [(7,), (-1,), (5, 6, 10)])
+def test_weekmask_calendar_with_invalid_weekend(weekend: tuple[int, ...]) -> None:  # noqa: E501
+    with pytest.raises(ValueError):
+        WeekmaskCalendar(weekend)
+
+
+@pytest.mark.positive
+@pytest.mark.parametrize(
+    "is_holiday, expected",
+    [
+        (is_saturday_or_sunday, frozenset({5, 6})),
+        (HolidayDiscriminator(), frozenset()),
+        (HolidayDiscriminator(is_saturday_or_sunday), frozenset({5, 6})),
+        (HolidayDiscriminator(is_new_year_day), None),
+        (HolidayDiscriminator(is_saturday_or_sunday, is_new_year_day), None),
+        (is_new_year_day, None),
+        (lambda d: d.weekday() in {5, 6}, None),
+    ],
+)
+def test_get_weekmask_calendar(
+    is_holiday: IsHolidayFuncType,
+    expected: frozenset[int] | None,
+) -> None:
+    calendar = get_weekmask_calendar(is_holiday)
+    if expected is None:
+        assert calendar is None
+    else:
+        assert calendar is not None
+        assert calendar.weekend == expected
+        assert calendar.holidays == frozenset()
+
+
+@pytest.mark.positive
+def test_get_weekmask_calendar_follows_discriminator_changes() -> None:
+    discriminator = HolidayDiscriminator(is_saturday_or_sunday)
+    assert get_weekmask_calendar(discriminator) is not None
+    discriminator.add_is_holiday_funcs(is_new_year_day)
+    assert get_weekmask_calendar(discriminator) is None
+    discriminator.remove_is_holiday_funcs(is_new_year_day.__name__)
+    assert get_weekmask_calendar(discriminator) is not None
+
+
+@pytest.mark.positive
+@pytest.mark.use_global_default_holiday_discriminator
+def test_global_default_uses_closed_form(mocker: MockerFixture) -> None:
+    spy = mocker.spy(WeekmaskCalendar, "_n_next_ordinal")
+    assert basic.get_n_next_bizday(date(2025, 1, 1), 100000) == date(2408, 4, 23)  # noqa: E501
+    assert spy.call_count == 1
+
+
+@pytest.mark.positive
+@pytest.mark.parametrize("weekend", [(5, 6), (4, 5), (0, 2, 4, 6)])
+def test_weekmask_calendar_month_queries(weekend: tuple[int, ...]) -> None:
+    calendar = WeekmaskCalendar(weekend, HOLIDAYS)
+    is_holiday = _brute_force(weekend, HOLIDAYS)
+    for i in range(0, 120, 2):
+        d = date(2024, 11, 20) + timedelta(days=i)
+        assert calendar.is_biz_start_of_month(d) == month.is_biz_start_of_month(d, is_holiday)  # noqa: E501
+        assert calendar.is_biz_end_of_month(d) == month.is_biz_end_of_month(d, is_holiday)  # noqa: E501
+        assert calendar.biz_start_of_month(d) == month.get_biz_start_of_month(d, is_holiday)  # noqa: E501
+        assert calendar.biz_end_of_month(d) == month.get_biz_end_of_month(d, is_holiday)  # noqa: E501
+    assert calendar.count_bizdays_in_month(date(2025, 1, 1)) == basic.count_bizdays(  # noqa: E501
+        date(2025, 1, 1), date(2025, 1, 31), is_holiday
+    )
+
+
+@pytest.mark.negative
+def test_weekmask_calendar_month_queries_without_bizday() -> None:
+    calendar = WeekmaskCalendar(range(7))
+    assert calendar.count_bizdays_in_month(date(2025, 1, 1)) == 0
+    assert not calendar.is_biz_end_of_month(date(2025, 1, 1))
+    assert not calendar.is_biz_start_of_month(date(2025, 1, 1))
+    with pytest.raises(ValueError):
+        calendar.biz_end_of_month(date(2025, 1, 1))
+    with pytest.raises(ValueError):
+        calendar.biz_start_of_month(date(2025, 1, 1))